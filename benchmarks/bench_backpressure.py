@@ -0,0 +1,60 @@
+"""Soak test for controlled().windowed(n): a producer pushes a burst of
+values every tick and the consumer gets a window of values per tick, as
+requests run one tick after the window that triggered them.
+
+The queue stays bounded while the consumer keeps up with the producer.
+A producer twice as fast as the consumer grows the queue, unless the
+queue is disabled, which drops the values nobody requested.
+
+Usage: PYTHONPATH=. python benchmarks/bench_backpressure.py [ticks]  (default 1000)
+"""
+import sys
+import time
+import tracemalloc
+
+from rx.subjects import Subject
+from rx.testing import TestScheduler
+
+BURST = 1000
+
+
+def run(name, ticks, burst, window, enable_queue=True):
+    scheduler = TestScheduler()
+    source = Subject()
+    controlled = source.controlled(enable_queue)
+    received = [0]
+    peak_queue = [0]
+
+    def on_next(value):
+        received[0] += 1
+
+    controlled.windowed(window, scheduler).subscribe(on_next)
+
+    def produce(scheduler, state):
+        for i in range(burst):
+            source.on_next(i)
+        peak_queue[0] = max(peak_queue[0], len(controlled.subject.queue))
+
+    for t in range(1, ticks + 1):
+        scheduler.schedule_absolute(t, produce)
+
+    tracemalloc.start()
+    start = time.time()
+    scheduler.advance_to(ticks)
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("%-30s %7.3fs %9.0f items/s  received %8d  peak queue %7d  peak memory %6.1f MB" % (
+        name, elapsed, ticks * burst / elapsed, received[0], peak_queue[0], peak / 1e6))
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    run("windowed(1000), keeping up", ticks, BURST, BURST)
+    run("windowed(500), queueing", ticks, BURST, BURST // 2)
+    run("windowed(500), no queue", ticks, BURST, BURST // 2, enable_queue=False)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Throughput of bulk ingest: from_iterable one element per scheduler turn,
+from_iterable in batches, and from_buffer chunks with select_batch and
+where_batch, optionally on NumPy arrays.
+
+Usage: PYTHONPATH=. python benchmarks/bench_batch.py [count]
+"""
+import sys
+import time
+
+from rx import Observable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def run(name, xs, count):
+    result = []
+    start = time.time()
+    xs.subscribe(result.append)
+    elapsed = time.time() - start
+    print("%-44s %7.3fs %10.0f items/s" % (name, elapsed, count / elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    values = list(range(count))
+
+    run("from_iterable.select.where",
+        Observable.from_iterable(values)
+            .select(lambda x: x * 2).where(lambda x: x % 3 == 0), count)
+    run("from_iterable(batch_size=1024).select.where",
+        Observable.from_iterable(values, batch_size=1024)
+            .select(lambda x: x * 2).where(lambda x: x % 3 == 0), count)
+    run("from_buffer.select_batch.where_batch (list)",
+        Observable.from_buffer(values, 1024)
+            .select_batch(lambda c: [x * 2 for x in c])
+            .where_batch(lambda c: [x % 3 == 0 for x in c]), count)
+
+    if numpy is not None:
+        array = numpy.arange(count)
+        run("from_buffer.select_batch.where_batch (numpy)",
+            Observable.from_buffer(array, 1024)
+                .select_batch(lambda c: c * 2)
+                .where_batch(lambda c: c % 3 == 0), count)
+        run("... .unbatch() (numpy)",
+            Observable.from_buffer(array, 1024)
+                .select_batch(lambda c: c * 2)
+                .where_batch(lambda c: c % 3 == 0)
+                .unbatch(), count)
+
+if __name__ == '__main__':
+    main()
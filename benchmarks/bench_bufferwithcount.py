@@ -0,0 +1,44 @@
+"""Native buffer_with_count against the window_with_count(...).select_many(to_array)
+composition it replaces, micro-batching a stream into chunks of 1000.
+
+Usage: PYTHONPATH=. python benchmarks/bench_bufferwithcount.py [count]  (default 1000000)
+"""
+import sys
+import time
+
+from rx.subjects import Subject
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def run(name, count, build):
+    subject = Subject()
+    buffers = []
+    build(subject).subscribe(buffers.append)
+
+    start = time.time()
+    for i in range(count):
+        subject.on_next(i)
+    subject.on_completed()
+    elapsed = time.time() - start
+    print("%-44s %7.3fs %10.0f items/s  %d buffers" % (name, elapsed, count / elapsed, len(buffers)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    run("window_with_count(1000).select_many(to_array)", count // 10,
+        lambda xs: xs.window_with_count(1000).select_many(lambda w: w.to_array()))
+    run("buffer_with_count(1000)", count,
+        lambda xs: xs.buffer_with_count(1000))
+    run("buffer_with_count(1000, 500)", count,
+        lambda xs: xs.buffer_with_count(1000, 500))
+    if numpy is not None:
+        run("buffer_with_count(1000, dtype='int64')", count,
+            lambda xs: xs.buffer_with_count(1000, dtype="int64"))
+
+if __name__ == '__main__':
+    main()
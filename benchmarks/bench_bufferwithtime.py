@@ -0,0 +1,54 @@
+"""Native buffer_with_time and buffer_with_time_or_count against the
+window_with_time(...).select_many(to_array) composition they replace, on a
+stream of 100k items per (virtual) second.
+
+Usage: PYTHONPATH=. python benchmarks/bench_bufferwithtime.py [seconds]  (default 1)
+"""
+import sys
+import time
+
+from rx.subjects import Subject
+from rx.testing import TestScheduler
+
+RATE = 100 # items per virtual millisecond
+
+
+def run(name, seconds, build):
+    scheduler = TestScheduler()
+    subject = Subject()
+    buffers = []
+    build(subject, scheduler).subscribe(buffers.append)
+
+    def push(scheduler, state):
+        for i in range(RATE):
+            subject.on_next(i)
+
+    for t in range(1, seconds * 1000 + 1):
+        scheduler.schedule_absolute(t, push)
+
+    # The buffer timers repeat forever, so only run to the end of the stream
+    start = time.time()
+    scheduler.advance_to(seconds * 1000)
+    elapsed = time.time() - start
+    count = seconds * 1000 * RATE
+    print("%-44s %7.3fs %9.0f items/s  %d buffers" % (name, elapsed, count / elapsed, len(buffers)))
+
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    run("window_with_time(100).select_many(to_array)", seconds,
+        lambda xs, s: xs.window_with_time(100, 100, s).select_many(lambda w: w.to_array()))
+    run("buffer_with_time(100)", seconds,
+        lambda xs, s: xs.buffer_with_time(100, scheduler=s))
+    run("window_with_time(100, 50).select_many(...)", seconds,
+        lambda xs, s: xs.window_with_time(100, 50, s).select_many(lambda w: w.to_array()))
+    run("buffer_with_time(100, 50)", seconds,
+        lambda xs, s: xs.buffer_with_time(100, 50, s))
+    run("window_with_time_or_count(100, 1000)...", seconds,
+        lambda xs, s: xs.window_with_time_or_count(100, 1000, s).select_many(lambda w: w.to_array()))
+    run("buffer_with_time_or_count(100, 1000)", seconds,
+        lambda xs, s: xs.buffer_with_time_or_count(100, 1000, s))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Throughput of combine_latest with 20 sources, updated one at a time and
+in bursts of 100 updates per scheduler turn, without and with conflate_on.
+
+Usage: PYTHONPATH=. python benchmarks/bench_combinelatest.py [count]  (default 100000)
+"""
+import sys
+import time
+
+from rx import Observable
+from rx.subjects import Subject
+from rx.testing import TestScheduler
+
+
+def run(name, n, count, conflate, burst=100):
+    subjects = [Subject() for _ in range(n)]
+    scheduler = TestScheduler()
+    result = []
+    kwargs = {"conflate_on": scheduler} if conflate else {}
+    Observable.combine_latest(*(subjects + [lambda *values: sum(values)]), **kwargs).subscribe(result.append)
+
+    for subject in subjects:
+        subject.on_next(0)
+    scheduler.advance_by(1)
+
+    start = time.time()
+    for i in range(count):
+        subjects[i % n].on_next(i)
+        if i % burst == burst - 1:
+            scheduler.advance_by(1)
+    scheduler.advance_by(1)
+    elapsed = time.time() - start
+    print("%-28s %7.3fs %10.0f updates/s %8d results" % (name, elapsed, count / elapsed, len(result)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    run("20-way", 20, count, False)
+    run("20-way, conflate_on", 20, count, True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""select_many with many concurrently live inner sequences, which adds and
+removes one inner subscription per inner sequence in a CompositeDisposable.
+
+Usage: PYTHONPATH=. python benchmarks/bench_compositedisposable.py [count]
+"""
+import sys
+import time
+
+from rx.subjects import Subject
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    outer = Subject()
+    inners = [Subject() for _ in range(count)]
+    result = []
+    outer.select_many(lambda inner: inner).subscribe(result.append)
+
+    start = time.time()
+    for inner in inners:
+        outer.on_next(inner)
+    opened = time.time() - start
+
+    # Complete the newest first, the worst case for a list scan
+    start = time.time()
+    for i, inner in enumerate(reversed(inners)):
+        inner.on_next(i)
+        inner.on_completed()
+    closed = time.time() - start
+    assert len(result) == count
+
+    print("%d live inner sequences: subscribe %.3fs, complete %.3fs" % (count, opened, closed))
+
+if __name__ == '__main__':
+    main()
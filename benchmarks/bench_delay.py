@@ -0,0 +1,75 @@
+"""Throughput of delay() on virtual time and on the timeout scheduler.
+
+Usage: PYTHONPATH=. python benchmarks/bench_delay.py [count]
+"""
+import sys
+import time
+import threading
+
+from rx import Observable
+from rx.concurrency import timeout_scheduler
+from rx.subjects import Subject
+from rx.testing import TestScheduler
+
+
+def virtual_burst(count):
+    scheduler = TestScheduler()
+    subject = Subject()
+    received = [0]
+
+    def on_next(x):
+        received[0] += 1
+
+    subject.delay(1000, scheduler).subscribe(on_next)
+    start = time.time()
+    for i in range(count):
+        subject.on_next(i)
+    scheduler.start()
+    assert received[0] == count
+    return time.time() - start
+
+
+def virtual_stream(count):
+    scheduler = TestScheduler()
+    received = [0]
+
+    def on_next(x):
+        received[0] += 1
+
+    # One element per tick, delayed by 100 ticks, so 100 are always queued
+    Observable.interval(1, scheduler).take(count).delay(100, scheduler).subscribe(on_next)
+    start = time.time()
+    scheduler.start()
+    assert received[0] == count
+    return time.time() - start
+
+
+def timeout_burst(count):
+    subject = Subject()
+    received = [0]
+    done = threading.Event()
+
+    def on_next(x):
+        received[0] += 1
+
+    subject.delay(50, timeout_scheduler).subscribe(on_next, on_completed=done.set)
+    start = time.time()
+    for i in range(count):
+        subject.on_next(i)
+    subject.on_completed()
+    done.wait()
+    assert received[0] == count
+    return time.time() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    for name, run in [("virtual time, burst", virtual_burst),
+                      ("virtual time, stream", virtual_stream),
+                      ("timeout scheduler, burst", timeout_burst)]:
+        elapsed = run(count)
+        print("%-26s %7.3fs %9.0f msg/s" % (name, elapsed, count / elapsed))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Throughput of distinct with the hash set, the comparer scan and the
+bounded LRU variant.
+
+Usage: PYTHONPATH=. python benchmarks/bench_distinct.py [count]
+"""
+import sys
+import time
+
+from rx import Observable
+
+
+def source(values):
+    def subscribe(observer):
+        for value in values:
+            observer.on_next(value)
+        observer.on_completed()
+    return Observable.create(subscribe)
+
+
+def run(name, xs, count):
+    result = []
+    start = time.time()
+    xs.subscribe(result.append)
+    elapsed = time.time() - start
+    print("%-36s %7.3fs %10.0f items/s  %d passed" % (name, elapsed, count / elapsed, len(result)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    values = [i % (count // 2) for i in range(count)]
+    xs = source(values)
+
+    run("distinct()", xs.distinct(), count)
+    run("distinct(max_keys=1000)", xs.distinct(max_keys=1000), count)
+    small = source(values[:5000])
+    run("distinct(comparer=...) 5000 items", small.distinct(comparer=lambda a, b: a == b), 5000)
+
+if __name__ == '__main__':
+    main()
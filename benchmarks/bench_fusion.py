@@ -0,0 +1,52 @@
+"""Throughput of synchronous select/where/take/skip pipelines.
+
+The source pushes a range in a plain loop so the time measured is spent in
+the operators.
+
+Usage: PYTHONPATH=. python benchmarks/bench_fusion.py [count]
+"""
+import sys
+import time
+
+from rx import Observable
+
+
+def source(count):
+    def subscribe(observer):
+        for i in range(count):
+            observer.on_next(i)
+        observer.on_completed()
+    return Observable.create(subscribe)
+
+
+def run(name, xs, count):
+    result = []
+    start = time.time()
+    xs.subscribe(result.append)
+    elapsed = time.time() - start
+    print("%-40s %6.2fs %8.0f items/s" % (name, elapsed, count / elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    xs = source(count)
+    run("select", xs.select(lambda x: x + 1), count)
+    run("where.select.where.take",
+        xs.where(lambda x: x % 2 == 0)
+          .select(lambda x: x * 3)
+          .where(lambda x: x % 3 == 0)
+          .take(count), count)
+    run("skip.select.take_while.select",
+        xs.skip(10)
+          .select(lambda x: x + 1)
+          .take_while(lambda x: x < count)
+          .select(lambda x: -x), count)
+
+    ys = xs
+    for _ in range(5):
+        ys = ys.select(lambda x: x).where(lambda x: True)
+    run("(select.where) x 5", ys, count)
+
+if __name__ == '__main__':
+    main()
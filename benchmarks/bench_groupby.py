@@ -0,0 +1,42 @@
+"""group_by over a stream of device readings with many distinct device ids,
+with and without a max_groups bound.
+
+Usage: PYTHONPATH=. python benchmarks/bench_groupby.py [count] [keys]  (default 500000 100000)
+"""
+import random
+import sys
+import time
+
+from rx.subjects import Subject
+
+
+def noop(value):
+    pass
+
+
+def run(name, ids, **kwargs):
+    subject = Subject()
+    groups = subject.group_by(lambda x: x, **kwargs)
+    groups.subscribe(lambda group: group.subscribe(noop))
+
+    start = time.time()
+    for device_id in ids:
+        subject.on_next(device_id)
+    subject.on_completed()
+    elapsed = time.time() - start
+    stats = getattr(groups, "stats", "")
+    print("%-28s %7.3fs %9.0f items/s  %s" % (name, elapsed, len(ids) / elapsed, stats))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    random.seed(42)
+    ids = [random.randrange(keys) for _ in range(count)]
+
+    run("group_by", ids)
+    if len(sys.argv) < 4:
+        run("group_by(max_groups=%d)" % (keys // 10), ids, max_groups=keys // 10)
+
+if __name__ == '__main__':
+    main()
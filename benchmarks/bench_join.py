@@ -0,0 +1,77 @@
+"""Joins with 10k live elements per side.
+
+keyed: join + where on the key against join(left_key=...), which only
+visits the partners with the same key.
+windowed: keyed join with a timer per element against keyed join_within,
+which expires elements from the front of a queue per side.
+
+Usage: PYTHONPATH=. python benchmarks/bench_join.py [live] [arrivals]  (default 10000 2000)
+"""
+import sys
+import time
+
+from rx import Observable
+from rx.subjects import Subject
+from rx.testing import TestScheduler
+
+
+def keyed(name, live, arrivals, build):
+    left, right = Subject(), Subject()
+    results = []
+    build(left, right).subscribe(results.append)
+    for i in range(live):
+        left.on_next(i)
+        right.on_next(i)
+
+    start = time.time()
+    for i in range(arrivals):
+        left.on_next(i)
+        right.on_next(i)
+    elapsed = time.time() - start
+    print("%-36s %7.3fs %9.0f arrivals/s  %d results" % (name, elapsed, 2 * arrivals / elapsed, len(results)))
+
+
+def windowed(name, live, arrivals, build):
+    scheduler = TestScheduler()
+    left, right = Subject(), Subject()
+    results = []
+    build(left, right, scheduler).subscribe(results.append)
+
+    # One element per side per tick, each live for `live` ticks
+    def push(scheduler, i):
+        left.on_next(i)
+        right.on_next(-i)
+
+    for i in range(live + arrivals):
+        scheduler.schedule_absolute(i + 1, push, i)
+
+    start = time.time()
+    scheduler.advance_to(live + arrivals)
+    elapsed = time.time() - start
+    print("%-36s %7.3fs %9.0f arrivals/s  %d results" % (name, elapsed, 2 * (live + arrivals) / elapsed, len(results)))
+
+
+def never(x):
+    return Observable.never()
+
+
+def main():
+    live = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    arrivals = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    keyed("join(...).where(same key)", live, arrivals // 10,
+        lambda xs, ys: xs.join(ys, never, never, lambda x, y: (x, y)).where(lambda p: p[0] == p[1]))
+    keyed("join(..., left_key=...)", live, arrivals,
+        lambda xs, ys: xs.join(ys, never, never, lambda x, y: (x, y), left_key=lambda x: x))
+
+    windowed("join(timer(window), left_key=...)", live, arrivals,
+        lambda xs, ys, s: xs.join(ys,
+            lambda x: Observable.timer(live, scheduler=s),
+            lambda y: Observable.timer(live, scheduler=s),
+            lambda x, y: (x, y), left_key=abs))
+    windowed("join_within(window, left_key=...)", live, arrivals,
+        lambda xs, ys, s: xs.join_within(ys, live, lambda x, y: (x, y),
+            left_key=abs, scheduler=s))
+
+if __name__ == '__main__':
+    main()
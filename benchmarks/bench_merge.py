@@ -0,0 +1,46 @@
+"""merge(max_concurrent) over many short-lived inner sequences.
+
+Usage: PYTHONPATH=. python benchmarks/bench_merge.py [count] [max_concurrent]
+"""
+import sys
+import time
+
+from rx import Observable
+from rx.subjects import Subject
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    max_concurrent = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    # Inner sequences completing as soon as they are subscribed to
+    def subscribe(observer):
+        for i in range(count):
+            observer.on_next(Observable.return_value(i))
+        observer.on_completed()
+
+    result = []
+    start = time.time()
+    Observable.create(subscribe).merge(max_concurrent).subscribe(result.append)
+    elapsed = time.time() - start
+    assert len(result) == count
+    print("synchronous inner, merge(%d)  %7.3fs %8.0f inner/s" % (max_concurrent, elapsed, count / elapsed))
+
+    # All inner sequences queued up front, then completed one by one
+    outer = Subject()
+    inners = [Subject() for _ in range(count)]
+    result = []
+    outer.merge(max_concurrent).subscribe(result.append)
+
+    start = time.time()
+    for inner in inners:
+        outer.on_next(inner)
+    outer.on_completed()
+    for i, inner in enumerate(inners):
+        inner.on_next(i)
+        inner.on_completed()
+    elapsed = time.time() - start
+    print("queued inner, merge(%d)       %7.3fs %8.0f inner/s" % (max_concurrent, elapsed, count / elapsed))
+
+if __name__ == '__main__':
+    main()
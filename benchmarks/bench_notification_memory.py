@@ -0,0 +1,58 @@
+"""Memory held per element by materialize and delay, measured with
+tracemalloc. Needs Python 3.4 or later.
+
+materialize keeps every notification in a list. delay is fed all
+elements at virtual time 0 and the peak is taken while they all wait in
+its queue.
+
+Usage: PYTHONPATH=. python benchmarks/bench_notification_memory.py [count]
+"""
+import sys
+import tracemalloc
+
+from rx import Observable
+from rx.subjects import Subject
+from rx.testing import TestScheduler
+
+
+def source(count):
+    def subscribe(observer):
+        for i in range(count):
+            observer.on_next(i)
+        observer.on_completed()
+    return Observable.create(subscribe)
+
+
+def measure(name, count, run):
+    tracemalloc.start()
+    run()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("%-12s %8.1f MB peak  %6.1f bytes per element" % (name, peak / 1e6, float(peak) / count))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    def materialize():
+        result = []
+        source(count).materialize().subscribe(result.append)
+    measure("materialize", count, materialize)
+
+    def delay():
+        scheduler = TestScheduler()
+        subject = Subject()
+        received = [0]
+
+        def on_next(x):
+            received[0] += 1
+
+        subject.delay(1000, scheduler).subscribe(on_next)
+        for i in range(count):
+            subject.on_next(i)
+        scheduler.start()
+        assert received[0] == count
+    measure("delay", count, delay)
+
+if __name__ == '__main__':
+    main()
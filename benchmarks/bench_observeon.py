@@ -0,0 +1,57 @@
+"""observe_on throughput on the timeout and asyncio schedulers.
+
+Usage: PYTHONPATH=. python benchmarks/bench_observeon.py [count]
+"""
+import sys
+import time
+import threading
+
+from rx import Observable
+from rx.concurrency import TimeoutScheduler
+from rx.subjects import Subject
+
+
+def run_timeout(count):
+    done = threading.Event()
+    subject = Subject()
+    subject.observe_on(TimeoutScheduler()).subscribe(
+        lambda x: None, on_completed=done.set)
+
+    start = time.time()
+    for i in range(count):
+        subject.on_next(i)
+    subject.on_completed()
+    done.wait()
+    return time.time() - start
+
+
+def run_asyncio(count):
+    import asyncio
+    from rx.concurrency import AsyncIOScheduler
+
+    loop = asyncio.new_event_loop()
+    done = asyncio.Event(loop=loop)
+    subject = Subject()
+    subject.observe_on(AsyncIOScheduler(loop)).subscribe(
+        lambda x: None, on_completed=done.set)
+
+    def produce():
+        for i in range(count):
+            subject.on_next(i)
+        subject.on_completed()
+
+    start = time.time()
+    loop.call_soon(produce)
+    loop.run_until_complete(done.wait())
+    loop.close()
+    return time.time() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for name, run in [("timeout", run_timeout), ("asyncio", run_asyncio)]:
+        elapsed = run(count)
+        print("%-8s n=%-8d %8.3fs %10.0f items/s" % (name, count, elapsed, count / elapsed))
+
+if __name__ == '__main__':
+    main()
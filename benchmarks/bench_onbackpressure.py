@@ -0,0 +1,57 @@
+"""A fast producer and a slow consumer on an EventLoopScheduler thread.
+observe_on queues every value, while the lossy operators keep the queue
+bounded and count what they drop.
+
+Usage: PYTHONPATH=. python benchmarks/bench_onbackpressure.py [count]  (default 100000)
+"""
+import sys
+import threading
+import time
+import tracemalloc
+
+from rx.concurrency import EventLoopScheduler
+from rx.subjects import Subject
+
+
+def run(name, count, build):
+    scheduler = EventLoopScheduler()
+    source = Subject()
+    done = threading.Event()
+    received = [0]
+
+    def on_next(value):
+        received[0] += 1
+        sum(range(200)) # Some work per value
+
+    observable = build(source, scheduler)
+    observable.subscribe(on_next, None, done.set)
+
+    tracemalloc.start()
+    start = time.time()
+    for i in range(count):
+        source.on_next("value %d" % i)
+    source.on_completed()
+    produced = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    done.wait()
+    elapsed = time.time() - start
+    tracemalloc.stop()
+
+    stats = getattr(observable, "stats", {})
+    print("%-32s produce %6.3fs  total %6.3fs  received %7d  dropped %7s  peak memory %6.1f MB" % (
+        name, produced, elapsed, received[0], stats.get("dropped", "-"), peak / 1e6))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    run("observe_on", count, lambda xs, s: xs.observe_on(s))
+    run("on_backpressure_drop", count, lambda xs, s: xs.on_backpressure_drop(s))
+    run("on_backpressure_latest", count, lambda xs, s: xs.on_backpressure_latest(s))
+    run("on_backpressure_latest(key % 100)", count,
+        lambda xs, s: xs.on_backpressure_latest(s, lambda x: hash(x) % 100))
+    run("on_backpressure_buffer(1000)", count,
+        lambda xs, s: xs.on_backpressure_buffer(1000, s, "drop_oldest"))
+
+if __name__ == '__main__':
+    main()
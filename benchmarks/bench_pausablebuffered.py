@@ -0,0 +1,47 @@
+"""pausable_buffered: buffer values while paused, then resume and drain.
+
+Usage: PYTHONPATH=. python benchmarks/bench_pausablebuffered.py [count]  (default 200000)
+"""
+import sys
+import time
+import tracemalloc
+
+from rx.subjects import Subject
+
+
+def run(name, count, *args):
+    source = Subject()
+    controller = Subject()
+    received = [0]
+
+    def on_next(value):
+        received[0] += 1
+
+    try:
+        source.pausable_buffered(controller, *args).subscribe(on_next)
+    except TypeError:
+        print("%-34s not supported" % name)
+        return
+
+    tracemalloc.start()
+    start = time.time()
+    for i in range(count):
+        source.on_next("value %d" % i)
+    _, peak = tracemalloc.get_traced_memory()
+    controller.on_next(True)
+    elapsed = time.time() - start
+    tracemalloc.stop()
+
+    print("%-34s %7.3fs %9.0f items/s  received %7d  peak memory while paused %6.1f MB" % (
+        name, elapsed, count / elapsed, received[0], peak / 1e6))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    run("unbounded", count)
+    run("max_buffer=10000, drop_oldest", count, 10000, "drop_oldest")
+    run("max_buffer=10000, spill", count, 10000, "spill")
+
+if __name__ == '__main__':
+    main()
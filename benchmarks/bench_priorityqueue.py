@@ -0,0 +1,66 @@
+"""Enqueue/dequeue/remove throughput of the scheduler priority queue.
+
+Usage: PYTHONPATH=. python benchmarks/bench_priorityqueue.py [count]
+"""
+import sys
+import random
+import time
+
+from rx.internal import PriorityQueue
+from rx.concurrency.scheduleditem import ScheduledItem
+
+
+def make_items(count):
+    random.seed(42)
+    return [ScheduledItem(None, None, None, random.randint(0, count))
+            for _ in range(count)]
+
+
+def bench_enqueue_dequeue(count):
+    items = make_items(count)
+    queue = PriorityQueue()
+    start = time.time()
+    for item in items:
+        queue.enqueue(item)
+    while queue.length > 0:
+        queue.dequeue()
+    return time.time() - start
+
+
+def bench_remove(count):
+    items = make_items(count)
+    queue = PriorityQueue()
+    for item in items:
+        queue.enqueue(item)
+
+    start = time.time()
+    for item in items[::2]:
+        queue.remove(item)
+    while queue.length > 0:
+        queue.dequeue()
+    return time.time() - start
+
+
+def bench_virtual_time(count):
+    """Mirrors VirtualTimeScheduler: peek the head, then remove it."""
+
+    items = make_items(count)
+    queue = PriorityQueue()
+    start = time.time()
+    for item in items:
+        queue.enqueue(item)
+    while queue.length > 0:
+        queue.remove(queue.peek())
+    return time.time() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, bench in [("enqueue+dequeue", bench_enqueue_dequeue),
+                        ("remove half", bench_remove),
+                        ("peek+remove", bench_virtual_time)]:
+        elapsed = bench(count)
+        print("%-16s n=%-8d %8.3fs %12.0f ops/s" % (name, count, elapsed, count / elapsed))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Subscriber churn on ref_count: 4 threads subscribing and disposing in a
+loop against one published source, counting how often the source is
+connected, without and with a grace period.
+
+Usage: PYTHONPATH=. python benchmarks/bench_refcount.py [count]  (default 20000)
+"""
+import sys
+import threading
+import time
+
+from rx import Observable
+
+
+def run(name, count, grace, threads=4):
+    connects = [0]
+
+    def subscribe(observer):
+        connects[0] += 1
+        # Stands in for opening a connection to an expensive source
+        time.sleep(0.0001)
+        return lambda: None
+
+    refd = Observable.create(subscribe).publish().ref_count(grace)
+
+    def churn():
+        for _ in range(count // threads):
+            refd.subscribe().dispose()
+
+    workers = [threading.Thread(target=churn) for _ in range(threads)]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.time() - start
+    print("%-28s %7.3fs %10.0f subscriptions/s %8d connects %s" % (
+        name, elapsed, count / elapsed, connects[0], refd.stats))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    run("no grace", count, None)
+    run("grace 100ms", count, 100)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""ReplaySubject on_next cost with large replay buffers.
+
+Usage: PYTHONPATH=. python benchmarks/bench_replaysubject.py [count]
+"""
+import sys
+import time
+
+from rx.subjects import ReplaySubject
+from rx.testing import TestScheduler
+
+
+def run(name, subject, count):
+    start = time.time()
+    for i in range(count):
+        subject.on_next(i)
+    elapsed = time.time() - start
+    print("%-26s n=%-8d %8.3fs %10.0f items/s" % (name, count, elapsed, count / elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    run("unbounded", ReplaySubject(), count)
+    run("buffer_size=100000", ReplaySubject(100000), count)
+    run("buffer_size=1000", ReplaySubject(1000), count)
+
+    # A virtual clock that never advances keeps every item inside the window
+    run("window, buffer_size=100000",
+        ReplaySubject(100000, 1000, TestScheduler()), count)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Sequential select versus select_parallel for a CPU-bound projection.
+
+Usage: PYTHONPATH=. python benchmarks/bench_selectparallel.py [count]
+"""
+import sys
+import time
+import threading
+
+from rx import Observable
+
+
+def work(x):
+    total = 0
+    for i in range(20000):
+        total += (x * i) % 7
+    return total
+
+
+def run(source):
+    done = threading.Event()
+    start = time.time()
+    source.subscribe(lambda x: None, on_completed=done.set)
+    done.wait()
+    return time.time() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    xs = lambda: Observable.from_iterable(range(count))
+
+    print("select               %.3fs" % run(xs().select(work)))
+    for chunk_size in (1, 10, 50):
+        elapsed = run(xs().select_parallel(work, chunk_size=chunk_size))
+        print("select_parallel(%-3d) %.3fs" % (chunk_size, elapsed))
+
+if __name__ == '__main__':
+    main()
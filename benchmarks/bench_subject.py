@@ -0,0 +1,48 @@
+"""Subject fan-out throughput with one and several producer threads.
+
+Usage: PYTHONPATH=. python benchmarks/bench_subject.py [count]
+"""
+import sys
+import time
+import threading
+import itertools
+
+from rx.subjects import Subject
+
+
+def run(count, producers, observers):
+    subject = Subject()
+
+    # next() on itertools.count is atomic, so the counts are exact
+    counters = [itertools.count() for _ in range(observers)]
+    for counter in counters:
+        subject.subscribe(lambda x, counter=counter: next(counter))
+
+    per_thread = count // producers
+
+    def produce():
+        for i in range(per_thread):
+            subject.on_next(i)
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    start = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - start
+
+    expected = per_thread * producers
+    lost = sum(expected - next(counter) for counter in counters)
+    print("producers=%d observers=%-3d %8.3fs %10.0f items/s lost=%d" % (
+        producers, observers, elapsed, expected / elapsed, lost))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    for producers in (1, 4):
+        for observers in (1, 16):
+            run(count, producers, observers)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Subscribe and dispose cost of a 10-deep synchronous operator chain.
+
+Usage: PYTHONPATH=. python benchmarks/bench_subscribe.py [count]
+"""
+import sys
+import time
+
+from rx import Observable
+
+
+def chain(source, depth=10):
+    for i in range(depth):
+        if i % 2:
+            source = source.where(lambda x: True)
+        else:
+            source = source.select(lambda x: x)
+    return source
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    xs = chain(Observable.never())
+    start = time.time()
+    for _ in range(count):
+        xs.subscribe(lambda x: None).dispose()
+    elapsed = time.time() - start
+    print("never, 10 deep      %8.2fus per subscribe+dispose" % (elapsed / count * 1e6))
+
+    xs = chain(Observable.return_value(1))
+    start = time.time()
+    for _ in range(count):
+        xs.subscribe(lambda x: None).dispose()
+    elapsed = time.time() - start
+    print("return, 10 deep     %8.2fus per subscribe+dispose" % (elapsed / count * 1e6))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Thread usage and latency of the timeout scheduler with many live timers.
+
+Usage: PYTHONPATH=. python benchmarks/bench_timeoutscheduler.py [count]
+"""
+import sys
+import time
+import threading
+from datetime import timedelta
+
+from rx.concurrency import TimeoutScheduler
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    scheduler = TimeoutScheduler()
+    done = threading.Event()
+    fired = [0]
+    lock = threading.Lock()
+
+    def action(scheduler, state):
+        with lock:
+            fired[0] += 1
+            if fired[0] == count:
+                done.set()
+
+    start = time.time()
+    for i in range(count):
+        scheduler.schedule_relative(timedelta(milliseconds=200 + i % 100), action)
+    scheduled = time.time() - start
+
+    peak = threading.active_count()
+    while not done.wait(0.01):
+        peak = max(peak, threading.active_count())
+    elapsed = time.time() - start
+
+    print("timers=%d schedule=%.3fs all fired after=%.3fs peak threads=%d" % (
+        count, scheduled, elapsed, peak))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Throughput of zip with 2 and 16 sources, in lock step and with one
+source running far ahead of the others.
+
+Usage: PYTHONPATH=. python benchmarks/bench_zip.py [count]
+"""
+import sys
+import time
+
+from rx.subjects import Subject
+
+
+def run(name, n, count, skew):
+    subjects = [Subject() for _ in range(n)]
+    result = []
+    subjects[0].zip(*(subjects[1:] + [lambda *values: values[0]])).subscribe(result.append)
+
+    start = time.time()
+    if skew:
+        # The first source runs all the way ahead, its queue grows to count
+        for i in range(count):
+            subjects[0].on_next(i)
+        for subject in subjects[1:]:
+            for i in range(count):
+                subject.on_next(i)
+    else:
+        for i in range(count):
+            for subject in subjects:
+                subject.on_next(i)
+    elapsed = time.time() - start
+    assert len(result) == count
+    print("%-28s %7.3fs %10.0f rows/s" % (name, elapsed, count / elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    run("2-way, lock step", 2, count, False)
+    run("2-way, skewed", 2, count, True)
+    run("16-way, lock step", 16, count // 10, False)
+    run("16-way, skewed", 16, count // 10, True)
+
+if __name__ == '__main__':
+    main()
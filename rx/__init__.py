@@ -2,6 +2,7 @@ from .observable import Observable
 from .anonymousobservable import AnonymousObservable
 from .observer import Observer
 from . import checkedobserver
+from . import synchronizedobserver
 from . import linq
 from . import backpressure
 
@@ -5,6 +5,17 @@ from rx.disposables import Disposable
 from .autodetachobserver import AutoDetachObserver
 from .observable import Observable
 
+def fix_subscriber(subscriber):
+    """Fix subscriber to check for None or function returned to 
+    decorate as Disposable"""
+
+    if subscriber is None:
+        subscriber = Disposable.empty()
+    elif type(subscriber) == types.FunctionType:
+        subscriber = Disposable(subscriber)
+
+    return subscriber
+
 class AnonymousObservable(Observable):
     """Class to create an Observable instance from a delegate-based 
     implementation of the Subscribe method."""
@@ -16,32 +27,25 @@ class AnonymousObservable(Observable):
         Keyword arguments:
         subscribe -- Subscribe method implementation.
         """
-        def _subscribe(observer):
-            def fix_subscriber(subscriber):
-                """Fix subscriber to check for None or function returned to 
-                decorate as Disposable"""
-            
-                if subscriber is None:
-                    subscriber = Disposable.empty()
-                elif type(subscriber) == types.FunctionType:
-                    subscriber = Disposable(subscriber)
-
-                return subscriber
-
-            def set_disposable(scheduler=None, value=None):
-                try:
-                    auto_detach_observer.disposable = fix_subscriber(subscribe(auto_detach_observer))
-                except Exception as ex:
-                    if not auto_detach_observer.fail(ex):
-                        raise ex
-
-            auto_detach_observer = AutoDetachObserver(observer)
-
-            if current_thread_scheduler.schedule_required():
-                current_thread_scheduler.schedule(set_disposable)
-            else:
-                set_disposable()
-
-            return auto_detach_observer
-        
-        super(AnonymousObservable, self).__init__(_subscribe)
+
+        self.subscribe_core = subscribe
+        super(AnonymousObservable, self).__init__(self.__subscribe)
+
+    def __subscribe(self, observer):
+        # Bound methods instead of per-subscription closures keep the
+        # allocations per subscribe down to the auto detach observer.
+        auto_detach_observer = AutoDetachObserver(observer)
+
+        if current_thread_scheduler.schedule_required():
+            current_thread_scheduler.schedule(self._set_disposable, auto_detach_observer)
+        else:
+            self._set_disposable(None, auto_detach_observer)
+
+        return auto_detach_observer
+
+    def _set_disposable(self, scheduler, auto_detach_observer):
+        try:
+            auto_detach_observer.disposable = fix_subscriber(self.subscribe_core(auto_detach_observer))
+        except Exception as ex:
+            if not auto_detach_observer.fail(ex):
+                raise ex
@@ -1,7 +1,5 @@
 import sys, traceback # FIXME: remove after debug
 
-from rx.disposables import SingleAssignmentDisposable
-
 from .abstractobserver import AbstractObserver
 
 class AutoDetachObserver(AbstractObserver):
@@ -10,7 +8,11 @@ class AutoDetachObserver(AbstractObserver):
         super(AutoDetachObserver, self).__init__()
 
         self.observer = observer
-        self.m = SingleAssignmentDisposable()
+
+        # Single assignment disposable inlined, saving an allocation per
+        # subscription
+        self.subscription = None
+        self.is_disposed = False
 
     def next(self, value):
         try:
@@ -32,10 +34,23 @@ class AutoDetachObserver(AbstractObserver):
             self.dispose()
 
     def set_disposable(self, value):
-        self.m.disposable = value
+        if self.subscription is not None:
+            raise Exception('Disposable has already been assigned')
+
+        if self.is_disposed:
+            if value is not None:
+                value.dispose()
+        else:
+            self.subscription = value
 
     disposable = property(fset=set_disposable)
 
     def dispose(self):
         super(AutoDetachObserver, self).dispose()
-        self.m.dispose()
+        if self.is_disposed:
+            return
+
+        self.is_disposed = True
+        subscription, self.subscription = self.subscription, None
+        if subscription is not None:
+            subscription.dispose()
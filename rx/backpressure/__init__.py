@@ -1,5 +1,7 @@
+from . import controlled
 from . import controlledobservable
 from . import controlledsubject
+from . import onbackpressure
 from . import pausable
 from . import pausablebuffered
 from . import stopandwait
@@ -0,0 +1,30 @@
+from six import add_metaclass
+
+from rx import Observable
+from rx.internal import ExtensionMethod
+
+from .controlledobservable import ControlledObservable
+
+@add_metaclass(ExtensionMethod)
+class ObservableControlled(Observable):
+    """Uses a meta class to extend Observable with the methods in this class"""
+
+    def controlled(self, enable_queue=True):
+        """Attaches a controller to the observable sequence with the ability
+        to queue.
+
+        Example:
+        source = rx.Observable.interval(100).controlled()
+        source.request(3) # Reads 3 values
+
+        Keyword arguments:
+        enable_queue -- [Optional] If True (the default), values that arrive
+            before they are requested are queued until they are. If False
+            they are dropped.
+
+        Returns the observable sequence which is controlled by requests to
+        request(number_of_items). Use stop_and_wait() or windowed(n) to
+        have the requests made for you.
+        """
+
+        return ControlledObservable(self, enable_queue)
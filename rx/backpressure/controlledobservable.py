@@ -4,16 +4,19 @@ from .controlledsubject import ControlledSubject
 
 class ControlledObservable(Observable):
 
-    def __init__(self, source, enable_queue):
-        super(ControlledObservable, self).__init__(self.subscribe)
+    def __init__(self, source, enable_queue=True):
+        super(ControlledObservable, self).__init__(self.__subscribe)
         
         self.subject = ControlledSubject(enable_queue)
         self.source = source.multicast(self.subject).ref_count()
     
-    def subscribe(self, observer):
+    def __subscribe(self, observer):
         return self.source.subscribe(observer)
       
-    def request(self, number_of_items):
+    def request(self, number_of_items=None):
+        """Requests number_of_items more values. Requests all values if
+        number_of_items is None."""
+
         if number_of_items is None:
             number_of_items = -1
         return self.subject.request(number_of_items)
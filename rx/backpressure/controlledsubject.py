@@ -1,107 +1,111 @@
+import threading
+from collections import deque
+
 from rx import Observable
+from rx.abstractobserver import AbstractObserver
 from rx.disposables import Disposable
 from rx.subjects import Subject
 from rx.internal.utils import check_disposed
 
-class ControlledSubject(Observable):
+class ControlledSubject(Observable, AbstractObserver):
+    """Subject that only passes on as many values as its observers have
+    requested. Values that arrive without outstanding demand are queued,
+    or dropped if the queue is disabled. Requests add up, so an observer
+    can ask for the next batch before the current one is used up. A
+    completion or error is passed on once the queue is empty."""
+
     def __init__(self, enable_queue=True):
-        super(ControlledSubject, self).__init__(self.subscribe)
+        super(ControlledSubject, self).__init__(self.__subscribe)
 
         self.subject = Subject()
         self.enable_queue = enable_queue
-        self.queue = [] if enable_queue else None
-        self.requested_count = 0
-        self.requested_disposable = Disposable.empty()
+        self.queue = deque()
+        self.requested_count = 0 # -1 for unbounded
         self.error = None
         self.has_failed = False
         self.has_completed = False
-        self.controlled_disposable = Disposable.empty()
+        self.is_disposed = False
+        self.is_draining = False
+        self.lock = threading.RLock()
 
-    def subscribe(self, observer):
+    def __subscribe(self, observer):
         return self.subject.subscribe(observer)
 
     def on_completed(self):
-        check_disposed(self)
-        self.has_completed = True
-
-        if not self.enable_queue or not len(self.queue):
-            self.subject.on_completed()
+        with self.lock:
+            check_disposed(self)
+            self.has_completed = True
+            self._drain()
 
     def on_error(self, error):
-        check_disposed(self)
-        self.has_failed = True
-        self.error = error
-
-        if not self.enable_queue or not len(self.queue):
-            self.subject.on_error(error)
+        with self.lock:
+            check_disposed(self)
+            self.has_failed = True
+            self.error = error
+            self._drain()
 
     def on_next(self, value):
-        check_disposed(self)
-        has_requested = False
-
-        if not self.requested_count:
-            if self.enable_queue:
-                self.queue.push(value)
-        else:
-            if self.requested_count != -1:
-                requested_count = self.requested_count
-                self.requested_count -= 1
-                if requested_count == 0:
-                    self.dispose_current_request()
+        with self.lock:
+            check_disposed(self)
 
-            has_requested = True
+            if self.queue or not self.requested_count:
+                if self.enable_queue:
+                    self.queue.append(value)
+                    self._drain()
+                return
 
-        if has_requested:
+            if self.requested_count > 0:
+                self.requested_count -= 1
             self.subject.on_next(value)
 
-    def _process_request(self, number_of_items):
-        if self.enable_queue:
-            #console.log('queue length', self.queue.length)
+    def _drain(self):
+        # Called with the lock held. A request or value that arrives while
+        # an observer is being called only adds to the state; the loop
+        # below picks it up, so the stack does not grow.
+        if self.is_draining:
+            return
+
+        self.is_draining = True
+        try:
+            queue = self.queue
+            while queue and self.requested_count:
+                if self.requested_count > 0:
+                    self.requested_count -= 1
+                self.subject.on_next(queue.popleft())
+
+            if not queue:
+                if self.has_failed:
+                    self.subject.on_error(self.error)
+                elif self.has_completed:
+                    self.subject.on_completed()
+        finally:
+            self.is_draining = False
 
-            while len(self.queue) >= number_of_items and number_of_items > 0:
-                # console.log('number of items', number_of_items)
-                self.subject.on_next(self.queue.shift())
-                number_of_items -= 1
-
-            if len(self.queue):
-                return { "number_of_items": number_of_items, "return_value": True }
-            else:
-                return { "number_of_items": number_of_items, "return_value": False }
+    def request(self, number):
+        """Requests number more values, or all values if number is None or
+        negative. Queued values are passed on right away.
 
-        if self.has_failed:
-            self.subject.on_error(self.error)
-            self.controlled_disposable.dispose()
-            self.controlled_disposable = Disposable.empty()
-        elif self.has_completed:
-            self.subject.on_completed()
-            self.controlled_disposable.dispose()
-            self.controlled_disposable = Disposable.empty()
+        Returns a disposable that cancels the outstanding demand."""
 
-        return { "number_of_items": number_of_items, "return_value": False }
+        with self.lock:
+            check_disposed(self)
 
-    def request(self, number):
-        check_disposed(self)
-        self.dispose_current_request()
+            if number is None or number < 0:
+                self.requested_count = -1
+            elif self.requested_count != -1:
+                self.requested_count += number
 
-        r = self._process_request(number)
-        number = r["number_of_items"]
-        if not r["return_value"]:
-            self.requested_count = number
+            self._drain()
 
-            def action():
-                self.requested_count = 0
-            self.requested_disposable = Disposable(action)
-
-            return self.requested_disposable
-        else:
-            return Disposable.empty()
+        return Disposable(self.dispose_current_request)
 
     def dispose_current_request(self):
-        self.requested_disposable.dispose()
-        self.requested_disposable = Disposable.empty()
+        with self.lock:
+            self.requested_count = 0
 
     def dispose(self):
-        self.is_disposed = True # FIXME: something wrong in RxJS?
-        self.error = None
-        self.subject.dispose()
-        self.requested_disposable.dispose()
+        with self.lock:
+            self.is_disposed = True
+            self.error = None
+            self.queue.clear()
+            self.subject.dispose()
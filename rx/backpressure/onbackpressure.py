@@ -0,0 +1,241 @@
+import threading
+from collections import deque, OrderedDict
+
+from six import add_metaclass
+
+from rx import Observable, AnonymousObservable
+from rx.abstractobserver import AbstractObserver
+from rx.disposables import CompositeDisposable, SingleAssignmentDisposable
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException, \
+    BufferOverflowException
+from rx.notification import OnError, OnCompleted
+
+
+class BackpressureObserver(AbstractObserver):
+    """Passes values on to the observer on the scheduler, one value per
+    scheduler turn. Every value is handed to the offer() method of the
+    subclass, which decides, with the lock held, whether it is kept as
+    pending or dropped. Pending values are passed on before a completion or
+    error."""
+
+    def __init__(self, scheduler, observer, stats):
+        super(BackpressureObserver, self).__init__()
+        self.scheduler = scheduler
+        self.observer = observer
+        self.stats = stats
+        self.pending = deque()
+        self.terminal = None
+        self.is_busy = False
+        self.lock = threading.Lock()
+        self.turns = CompositeDisposable()
+
+    def take(self):
+        return self.pending.popleft()
+
+    def drop(self):
+        self.stats["dropped"] += 1
+
+    def next(self, value):
+        with self.lock:
+            self.offer(value)
+            if self.is_busy or not (self.pending or self.terminal):
+                return
+            self.is_busy = True
+
+        self.schedule_run()
+
+    def error(self, error):
+        self.terminate(OnError(error))
+
+    def completed(self):
+        self.terminate(OnCompleted())
+
+    def terminate(self, notification):
+        with self.lock:
+            self.terminal = notification
+            if self.is_busy:
+                return
+            self.is_busy = True
+
+        self.schedule_run()
+
+    def schedule_run(self):
+        # Each turn has its own disposable, added before the turn is
+        # scheduled, so a turn that runs and reschedules on another thread
+        # cannot have its successor cancelled by a late assignment
+        turn = SingleAssignmentDisposable()
+        self.turns.add(turn)
+        turn.disposable = self.scheduler.schedule(self.run, turn)
+
+    def run(self, scheduler, turn):
+        self.turns.remove(turn)
+        with self.lock:
+            has_value = bool(self.pending)
+            if has_value:
+                value = self.take()
+            terminal = self.terminal
+
+        if not has_value:
+            terminal.accept(self.observer)
+            return
+
+        self.observer.on_next(value)
+
+        with self.lock:
+            if not self.pending and not self.terminal:
+                self.is_busy = False
+                return
+
+        self.schedule_run()
+
+    def dispose(self):
+        super(BackpressureObserver, self).dispose()
+        self.turns.dispose()
+
+
+class DropObserver(BackpressureObserver):
+    def offer(self, value):
+        if self.is_busy:
+            self.drop()
+        else:
+            self.pending.append(value)
+
+
+class LatestObserver(BackpressureObserver):
+    def __init__(self, scheduler, observer, stats, key_selector):
+        super(LatestObserver, self).__init__(scheduler, observer, stats)
+        self.key_selector = key_selector
+        self.pending = OrderedDict()
+
+    def offer(self, value):
+        try:
+            key = self.key_selector(value) if self.key_selector else None
+        except Exception as ex:
+            self.pending.clear()
+            self.is_stopped = True
+            self.terminal = OnError(ex)
+            return
+
+        if key in self.pending:
+            self.drop()
+        self.pending[key] = value
+
+    def take(self):
+        return self.pending.popitem(last=False)[1]
+
+
+class BufferObserver(BackpressureObserver):
+    def __init__(self, scheduler, observer, stats, size, overflow, on_overflow):
+        super(BufferObserver, self).__init__(scheduler, observer, stats)
+        self.size = size
+        self.overflow = overflow
+        self.on_overflow = on_overflow
+
+    def offer(self, value):
+        pending = self.pending
+        if len(pending) < self.size:
+            pending.append(value)
+            return
+
+        self.drop()
+        if self.on_overflow:
+            self.on_overflow(value)
+
+        if self.overflow == "drop_oldest":
+            pending.popleft()
+            pending.append(value)
+        elif self.overflow == "error":
+            # Fail right away instead of after the pending values
+            pending.clear()
+            self.is_stopped = True
+            self.terminal = OnError(BufferOverflowException())
+
+
+@add_metaclass(ExtensionMethod)
+class ObservableOnBackpressure(Observable):
+    """Uses a meta class to extend Observable with the methods in this class"""
+
+    def on_backpressure_drop(self, scheduler):
+        """Passes values on to the observer on the scheduler, and drops the
+        values that arrive while a value is being passed on, or waiting to
+        be. Use it instead of observe_on when a slow observer should skip
+        values rather than queue them.
+
+        Example:
+        res = source.on_backpressure_drop(rx.Scheduler.timeout)
+
+        Keyword arguments:
+        scheduler -- Scheduler to notify the observer on.
+
+        Returns the source sequence whose values are passed on on the
+        scheduler, or dropped if the observer is busy. The returned
+        observable has a stats dict with the number of values dropped.
+        """
+
+        return _on_backpressure(self, lambda observer, stats: DropObserver(scheduler, observer, stats))
+
+    def on_backpressure_latest(self, scheduler, key_selector=None):
+        """Passes values on to the observer on the scheduler, keeping only
+        the latest value that arrives while the observer is busy. With a
+        key selector the latest value of each key is kept, and the keys are
+        passed on in the order they first arrived.
+
+        Example:
+        res = source.on_backpressure_latest(rx.Scheduler.timeout)
+        res = quotes.on_backpressure_latest(rx.Scheduler.timeout, lambda q: q.symbol)
+
+        Keyword arguments:
+        scheduler -- Scheduler to notify the observer on.
+        key_selector -- [Optional] A function to compute the hashable key
+            values are conflated by. By default all values share one key.
+
+        Returns the source sequence whose values are passed on on the
+        scheduler, conflated while the observer is busy. The returned
+        observable has a stats dict with the number of values replaced.
+        """
+
+        return _on_backpressure(self, lambda observer, stats: LatestObserver(scheduler, observer, stats, key_selector))
+
+    def on_backpressure_buffer(self, size, scheduler, overflow="error", on_overflow=None):
+        """Passes values on to the observer on the scheduler, buffering at
+        most size values while the observer is busy.
+
+        Example:
+        res = source.on_backpressure_buffer(1000, rx.Scheduler.timeout)
+        res = source.on_backpressure_buffer(1000, rx.Scheduler.timeout, "drop_oldest", log_overflow)
+
+        Keyword arguments:
+        size -- Maximum number of values buffered.
+        scheduler -- Scheduler to notify the observer on.
+        overflow -- [Optional] What to do with a value arriving at a full
+            buffer: "error" (the default) fails the sequence with a
+            BufferOverflowException right away, "drop_newest" drops the
+            value and "drop_oldest" drops the oldest buffered value.
+        on_overflow -- [Optional] Function called with each value that
+            arrives at a full buffer.
+
+        Returns the source sequence whose values are passed on on the
+        scheduler. The returned observable has a stats dict with the number
+        of values dropped.
+        """
+
+        if overflow not in ("error", "drop_newest", "drop_oldest"):
+            raise ValueError("Unknown overflow policy: %s" % overflow)
+        if size < 1:
+            raise ArgumentOutOfRangeException()
+
+        return _on_backpressure(self, lambda observer, stats: BufferObserver(
+            scheduler, observer, stats, size, overflow, on_overflow))
+
+
+def _on_backpressure(source, create_observer):
+    stats = {"dropped": 0}
+
+    def subscribe(observer):
+        backpressure_observer = create_observer(observer, stats)
+        subscription = source.subscribe(backpressure_observer)
+        return CompositeDisposable(subscription, backpressure_observer)
+
+    observable = AnonymousObservable(subscribe)
+    observable.stats = stats
+    return observable
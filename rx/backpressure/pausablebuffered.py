@@ -1,93 +1,118 @@
+import threading
+from collections import deque
+
 from six import add_metaclass
 
-from rx import Observable, AnonymousObservable
-from rx.internal import ExtensionMethod
+from rx import Observable
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException, \
+    BufferOverflowException
 from rx.subjects import Subject
-from rx.disposables import CompositeDisposable
-
-def combine_latest_source(source, subject, result_selector):
-    def subscribe(observer):
-        has_value = [False, False]
-        has_value_all = [False]
-        values = [None, None]
-        is_done = [False]
-
-        def next(x, i):
-            has_value[i] = True
-            values[i] = x
-
-            has_value_all[0] = has_value_all[0] or all(has_value)
-            if has_value_all[0]:
-                try:
-                    res = result_selector(*values)
-                except Exception as ex:
-                    observer.on_error(ex)
-                    return
-                observer.on_next(res)
-            elif is_done[0]:
-                observer.on_completed()
+from rx.disposables import CompositeDisposable, Disposable
 
-        def on_next(x):
-            next(x, 0)
+from .spillbuffer import SpillBuffer
 
-        def on_completed():
-            is_done[0] = True
-            observer.on_completed()
-
-        return CompositeDisposable(
-            source.subscribe(on_next, observer.on_error, on_completed),
-            subject.subscribe(lambda x: next(x, 1), observer.on_error)
-        )
-    return AnonymousObservable(subscribe)
+OVERFLOW_POLICIES = ("error", "drop_newest", "drop_oldest", "block", "spill")
 
 class PausableBufferedObservable(Observable):
 
-    def __init__(self, source, subject=None):
+    def __init__(self, source, subject=None, max_buffer=None, overflow="error"):
         self.source = source
         self.subject = subject or Subject()
+        self.max_buffer = max_buffer
+        self.overflow = overflow
         self.is_paused = True
 
         super(PausableBufferedObservable, self).__init__(self.__subscribe)
 
     def __subscribe(self, observer):
-        previous = [True]
-        queue = []
-
-        def result_selector(data, should_fire=False):
-            return {"data": data, "should_fire": should_fire}
-
-        def on_next(results):
-            if results.get("should_fire") and previous[0]:
-                    observer.on_next(results["data"])
+        max_buffer, overflow = self.max_buffer, self.overflow
+        if overflow == "spill":
+            queue = SpillBuffer(max_buffer)
+        else:
+            queue = deque()
+
+        state = {"is_paused": True, "is_stopped": False, "is_draining": False}
+        condition = threading.Condition(threading.RLock())
+
+        def drain():
+            # Called with the lock held. Values that arrive while the queue
+            # is being emitted are queued behind it, so order is kept.
+            state["is_draining"] = True
+            try:
+                while queue and not state["is_paused"] and not state["is_stopped"]:
+                    observer.on_next(queue.popleft())
+                    condition.notify_all()
+            finally:
+                state["is_draining"] = False
+
+        def on_next(value):
+            with condition:
+                if state["is_stopped"]:
+                    return
 
-            if results.get("should_fire") and not previous[0]:
-                while len(queue):
-                    b = queue.pop(0)
-                    observer.on_next(b)
+                if not state["is_paused"] and not queue:
+                    observer.on_next(value)
+                    return
 
-                previous[0] = True
-            elif not results.get("should_fire") and not previous[0]:
-                queue.append(results["data"])
-            elif not results.get("should_fire") and previous[0]:
-                previous[0] = False
+                if max_buffer and len(queue) >= max_buffer:
+                    if overflow == "drop_newest":
+                        return
+                    elif overflow == "drop_oldest":
+                        queue.popleft()
+                    elif overflow == "block":
+                        # Only useful if the producer has a thread of its
+                        # own; wait for a resume to make room
+                        while len(queue) >= max_buffer and not state["is_stopped"]:
+                            condition.wait()
+                        if state["is_stopped"]:
+                            return
+                    elif overflow == "error":
+                        stop()
+                        observer.on_error(BufferOverflowException())
+                        return
+
+                queue.append(value)
+                if not state["is_paused"] and not state["is_draining"]:
+                    drain()
+
+        def flush():
+            # Empty buffer before sending completion or error
+            while queue:
+                observer.on_next(queue.popleft())
+
+        def stop():
+            state["is_stopped"] = True
+            queue.clear()
+            condition.notify_all()
 
         def on_error(err):
-            # Empty buffer before sending error
-            while len(queue):
-                observer.on_next(queue.pop())
-            observer.on_error(err)
+            with condition:
+                if not state["is_stopped"]:
+                    flush()
+                    stop()
+                    observer.on_error(err)
 
         def on_completed():
-            # Empty buffer before sending completion
-            while len(queue):
-                observer.on_next(queue.pop())
-            observer.on_completed()
-
-        subscription = combine_latest_source(
-                self.source,
-                self.subject.distinct_until_changed(),
-                result_selector
-            ).subscribe(on_next, on_error, on_completed)
+            with condition:
+                if not state["is_stopped"]:
+                    flush()
+                    stop()
+                    observer.on_completed()
+
+        def on_pauser(should_fire):
+            with condition:
+                state["is_paused"] = not should_fire
+                if should_fire and not state["is_draining"]:
+                    drain()
+
+        def dispose():
+            with condition:
+                stop()
+
+        subscription = CompositeDisposable(
+            self.subject.distinct_until_changed().subscribe(on_pauser, on_error),
+            self.source.subscribe(on_next, on_error, on_completed),
+            Disposable(dispose))
 
         self.subject.on_next(False)
         return subscription
@@ -110,7 +135,7 @@ class PausableBufferedObservable(Observable):
 class ObservablePausable(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def pausable_buffered(self, subject):
+    def pausable_buffered(self, subject, max_buffer=None, overflow="error"):
         """Pauses the underlying observable sequence based upon the observable
         sequence which yields True/False, and yields the values that were
         buffered while paused.
@@ -118,12 +143,32 @@ class ObservablePausable(Observable):
         Example:
         pauser = rx.Subject()
         source = rx.Observable.interval(100).pausable_buffered(pauser)
+        source = rx.Observable.interval(100).pausable_buffered(pauser, 10000, "spill")
 
         Keyword arguments:
         pauser -- {Observable} The observable sequence used to pause the
             underlying sequence.
+        max_buffer -- [Optional] Maximum number of values buffered while
+            paused. Unbounded by default.
+        overflow -- [Optional] What to do with a value arriving at a full
+            buffer: "error" (the default) fails the sequence with a
+            BufferOverflowException, "drop_newest" drops the value,
+            "drop_oldest" drops the oldest buffered value, "block" blocks
+            the producer until the sequence is resumed and there is room
+            again, and "spill" appends values beyond max_buffer to a
+            temporary file, from which they are read back in order. "block"
+            needs the producer on a thread other than the one resuming, and
+            "spill" needs picklable values. Both need max_buffer.
 
         Returns the observable {Observable} sequence which is paused based upon
         the pauser."""
 
-        return PausableBufferedObservable(self, subject)
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy: %s" % overflow)
+        if max_buffer is not None and max_buffer < 1:
+            raise ArgumentOutOfRangeException()
+        if max_buffer is None and overflow in ("block", "spill"):
+            # Both only differ from an unbounded buffer once it is full
+            raise ArgumentOutOfRangeException()
+
+        return PausableBufferedObservable(self, subject, max_buffer, overflow)
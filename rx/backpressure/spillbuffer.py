@@ -0,0 +1,68 @@
+import pickle
+import tempfile
+from collections import deque
+
+
+class SpillBuffer(object):
+    """First in, first out queue that keeps at most max_memory values in
+    memory. Once memory is full, later values are pickled and appended to
+    an anonymous temporary file, and read back in chunks of max_memory as
+    the memory part is used up. The file is truncated whenever it has been
+    read completely and removed when the buffer is closed, so values must be
+    picklable."""
+
+    def __init__(self, max_memory, dir=None):
+        self.max_memory = max_memory
+        self.dir = dir
+        self.memory = deque()
+        self.file = None
+        self.spilled = 0
+        self.read_pos = 0
+
+    def __len__(self):
+        return len(self.memory) + self.spilled
+
+    def append(self, value):
+        # Once something is on disk, everything after it goes there too, so
+        # the memory part always holds the oldest values
+        if not self.spilled and len(self.memory) < self.max_memory:
+            self.memory.append(value)
+            return
+
+        if self.file is None:
+            self.file = tempfile.TemporaryFile(dir=self.dir)
+
+        self.file.seek(0, 2)
+        pickle.dump(value, self.file, pickle.HIGHEST_PROTOCOL)
+        self.spilled += 1
+
+    def popleft(self):
+        if not self.memory and self.spilled:
+            self._load()
+        return self.memory.popleft()
+
+    def _load(self):
+        spill_file = self.file
+        spill_file.seek(self.read_pos)
+        count = min(self.spilled, self.max_memory)
+        for _ in range(count):
+            self.memory.append(pickle.load(spill_file))
+        self.spilled -= count
+
+        if self.spilled:
+            self.read_pos = spill_file.tell()
+        else:
+            spill_file.seek(0)
+            spill_file.truncate()
+            self.read_pos = 0
+
+    def clear(self):
+        self.memory.clear()
+        self.close()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.spilled = 0
+        self.read_pos = 0
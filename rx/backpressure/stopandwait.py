@@ -10,11 +10,13 @@ from .stopandwaitobservable import StopAndWaitObservable
 class ControlledObservableStopAndWait(ControlledObservable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def stop_and_wait(self, scheduler):
-        """Attaches a stop and wait observable to the current observable.
-   
+    def stop_and_wait(self, scheduler=None):
+        """Attaches a stop and wait observable to the current observable. The
+        next value is requested after each value has been passed on, so there
+        is at most one value in flight.
+
         scheduler -- {Scheduler} [Optional] Optional scheduler used for yielding
-            values.
+            values. Defaults to the current thread scheduler.
         
         Returns a stop and wait observable {Observable}."""
 
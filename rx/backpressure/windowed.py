@@ -1,7 +1,7 @@
 from six import add_metaclass
 
 from rx.concurrency import current_thread_scheduler
-from rx.internal import ExtensionMethod
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
 
 from .controlledobservable import ControlledObservable
 from .windowedobservable import WindowedObservable
@@ -12,14 +12,18 @@ class ControlledObservableWindowed(ControlledObservable):
 
     def windowed(self, window_size, scheduler=None):
         """Creates a sliding windowed observable based upon the window size.
-         
-         
+        The next window_size values are requested each time a full window has
+        been passed on, so there are at most window_size values in flight.
+
         window_size -- {Number} The number of items in the window
         scheduler -- {Scheduler} [Optional] Optional scheduler used for 
             parameterization of concurrency. If not specified, defaults to 
-            Scheduler.timeout.
+            the current thread scheduler.
         
         Returns a windowed observable {Observable} based upon the window size.
         """
+        if window_size <= 0:
+            raise ArgumentOutOfRangeException()
+
         scheduler = scheduler or current_thread_scheduler
-        return WindowedObservable(self, window_size, scheduler)
\ No newline at end of file
+        return WindowedObservable(self, window_size, scheduler)
@@ -1,65 +1,58 @@
 import logging
 
-from rx import Observer, Observable
-from rx.internal.utils import check_disposed
+from rx import Observable
+from rx.abstractobserver import AbstractObserver
+from rx.disposables import CompositeDisposable
 
 log = logging.getLogger('Rx')
 
-class WindowedObserver(Observer):
-    def __init__(self, observer, observable, cancel, scheduler):
+class WindowedObserver(AbstractObserver):
+    """Passes values on and requests the next window_size values on the
+    scheduler each time a full window has been received, so there are at
+    most window_size values in flight."""
+
+    def __init__(self, observer, observable, scheduler):
+        super(WindowedObserver, self).__init__()
+
         self.observer = observer
         self.observable = observable
-        self.cancel = cancel
         self.scheduler = scheduler
         self.received = 0
-        self.is_disposed = False
 
-        def on_completed(self):
-            check_disposed(self)
-            self.observer.on_completed()
-            self.dispose()
+    def completed(self):
+        self.observer.on_completed()
 
-        def on_error(self, error):
-            check_disposed(self)
-            self.observer.on_error(error)
-            self.dispose()
+    def error(self, error):
+        self.observer.on_error(error)
 
-        def on_next(self, value):
-            check_disposed(self)
-            self.observer.on_next(value)
+    def next(self, value):
+        self.observer.on_next(value)
 
-            def action(scheduler, state):
+        def action(scheduler, state):
+            if not self.is_stopped:
                 log.debug('requested size: %s', self.observable.window_size)
                 self.observable.source.request(self.observable.window_size)
 
-            self.received = (self.received+1) % self.observable.window_size
-            if self.received == 0:
-                self.scheduler.schedule(action)
-                
-        def dispose(self):
-            self.observer = None
-            if not self.cancel:
-                self.cancel.dispose()
-                self.cancel = None
+        self.received = (self.received + 1) % self.observable.window_size
+        if self.received == 0:
+            self.scheduler.schedule(action)
 
-            self.is_disposed = True
 
 class WindowedObservable(Observable):
     def __init__(self, source, window_size, scheduler):
-        super(WindowedObservable, self).__init__(self.subscribe)
+        super(WindowedObservable, self).__init__(self.__subscribe)
 
         self.source = source
         self.window_size = window_size
         self.scheduler = scheduler
-        self.is_disposed = False
 
-    def subscribe(self, observer):
-        self.subscription = self.source.subscribe(observer)
-        observer = WindowedObserver(observer, self, self.subscription, self.scheduler)
-        
+    def __subscribe(self, observer):
+        observer = WindowedObserver(observer, self, self.scheduler)
+        subscription = self.source.subscribe(observer)
+
         def action(scheduler, state):
-            self.source.request(self.window_size)
+            if not observer.is_stopped:
+                self.source.request(self.window_size)
 
         self.scheduler.schedule(action)
-        return self.subscription
-
+        return CompositeDisposable(subscription, observer)
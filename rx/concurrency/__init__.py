@@ -4,6 +4,8 @@ from .immediatescheduler import ImmediateScheduler, immediate_scheduler
 from .currentthreadscheduler import CurrentThreadScheduler, current_thread_scheduler
 from .virtualtimescheduler import VirtualTimeScheduler
 from .timeoutscheduler import TimeoutScheduler, timeout_scheduler
+from .threadpoolscheduler import ThreadPoolScheduler
+from .eventloopscheduler import EventLoopScheduler
 from .historicalscheduler import HistoricalScheduler
 from .catchscheduler import CatchScheduler
 
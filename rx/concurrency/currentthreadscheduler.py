@@ -2,6 +2,7 @@
 
 import time
 import logging
+import threading
 from datetime import timedelta
 
 from rx.internal import PriorityQueue
@@ -40,8 +41,22 @@ class CurrentThreadScheduler(Scheduler):
     """Represents an object that schedules units of work on the current thread."""
 
     def __init__(self):
-        """Gets a scheduler that schedules work as soon as possible on the current thread."""
-        self.queue = 0 # Must be different from None, FIXME:
+        """Gets a scheduler that schedules work as soon as possible on the current thread.
+
+        Each thread gets its own trampoline, so work scheduled on one thread
+        never runs on, or waits for, another thread."""
+
+        self.local = threading.local()
+
+    @property
+    def queue(self):
+        """The trampoline running on the current thread, or None."""
+
+        return getattr(self.local, "queue", None)
+
+    @queue.setter
+    def queue(self, value):
+        self.local.queue = value
 
     def schedule(self, action, state=None):
         log.debug("CurrentThreadScheduler.schedule(state=%s)", state)
@@ -52,16 +67,18 @@ class CurrentThreadScheduler(Scheduler):
         dt = self.now() + Scheduler.normalize(duetime)
         si = ScheduledItem(self, state, action, dt)
 
-        if not self.queue:
-            self.queue = Trampoline(self)
+        local = self.local
+        queue = getattr(local, "queue", None)
+        if queue is None:
+            local.queue = queue = Trampoline(self)
             try:
-                self.queue.enqueue(si)
-                self.queue.run()
+                queue.enqueue(si)
+                queue.run()
             finally:
-                self.queue.dispose()
-                self.queue = None
+                queue.dispose()
+                local.queue = None
         else:
-            self.queue.enqueue(si)
+            queue.enqueue(si)
 
         return si.disposable
 
@@ -69,7 +86,7 @@ class CurrentThreadScheduler(Scheduler):
         return self.schedule_relative(duetime - self.now(), action, state=None)
 
     def schedule_required(self):
-        return self.queue is None
+        return getattr(self.local, "queue", None) is None
 
     def ensure_trampoline(self, action):
         """Method for testing the CurrentThreadScheduler"""
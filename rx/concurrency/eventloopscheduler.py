@@ -0,0 +1,20 @@
+from .timeoutscheduler import TimeoutScheduler, invoke_item, monotonic
+
+class EventLoopScheduler(TimeoutScheduler):
+    """A scheduler that runs all work on one dedicated, long-lived thread.
+    Work is run in due time order, and work due at the same time is run in
+    the order it was scheduled, so a sequence observed on this scheduler is
+    never reordered or run concurrently.
+
+    dispose() stops the thread after the work it is running. Work that has
+    not started yet is dropped, and so is work scheduled after that.
+    """
+
+    def __init__(self):
+        super(EventLoopScheduler, self).__init__(max_workers=1)
+
+    def schedule(self, action, state=None):
+        return self._enqueue(monotonic(), action, state)
+
+    def dispatch(self, item):
+        invoke_item(item)
@@ -1,7 +1,5 @@
 from datetime import datetime
 
-from rx.internal.basic import default_sub_comparer
-
 from .virtualtimescheduler import VirtualTimeScheduler
 
 class HistoricalScheduler(VirtualTimeScheduler):
@@ -17,12 +15,7 @@ class HistoricalScheduler(VirtualTimeScheduler):
         comparer -- {Function} Comparer to determine causality of events based
             on absolute time."""
 
-        def compare_datetimes(a, b):
-            return (a > b) - (a < b)
-
         clock = initial_clock or datetime.fromtimestamp(0)
-        comparer = comparer or compare_datetimes
-
         super(HistoricalScheduler, self).__init__(clock, comparer)
 
     def now(self):
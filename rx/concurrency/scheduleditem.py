@@ -5,6 +5,8 @@ def default_sub_comparer(x, y):
     return 0 if x == y else 1 if x > y else -1
 
 class ScheduledItem(object):
+    __slots__ = ("scheduler", "state", "action", "duetime", "comparer", "disposable")
+
     def __init__(self, scheduler, state, action, duetime, comparer=None):
         self.scheduler = scheduler
         self.state = state
@@ -0,0 +1,41 @@
+from multiprocessing import cpu_count
+
+from .timeoutscheduler import TimeoutScheduler, invoke_item
+
+ThreadPoolExecutor = None
+
+class ThreadPoolScheduler(TimeoutScheduler):
+    """A scheduler that runs work on a fixed pool of worker threads using
+    concurrent.futures. Timed work is kept on the single timer thread of the
+    timeout scheduler until it is due, and then submitted to the pool.
+
+    On Python 2.7 this requires the futures backport.
+    """
+
+    def __init__(self, max_workers=None):
+        """Creates a thread pool scheduler.
+
+        Keyword arguments:
+        max_workers -- [Optional] Number of worker threads in the pool.
+            Defaults to five times the number of processors.
+        """
+
+        # Lazy import concurrent.futures
+        global ThreadPoolExecutor
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = max_workers or cpu_count() * 5
+        super(ThreadPoolScheduler, self).__init__(max_workers)
+        self.executor = ThreadPoolExecutor(max_workers)
+
+    def dispatch(self, item):
+        if not self.is_disposed:
+            self.executor.submit(invoke_item, item)
+
+    def dispose(self):
+        """Shuts down the pool after the already submitted work is done.
+        Timed work that is not due yet is dropped, and so is work scheduled
+        after this."""
+
+        super(ThreadPoolScheduler, self).dispose()
+        self.executor.shutdown(wait=False)
@@ -1,55 +1,204 @@
+import time
 import logging
-from threading import Timer
+import threading
+from datetime import timedelta
+from multiprocessing import cpu_count
 
-from rx.disposables import Disposable, SingleAssignmentDisposable, \
-    CompositeDisposable
+from six.moves.queue import Queue
+
+from rx.disposables import Disposable, SerialDisposable, CompositeDisposable
+from rx.internal import PriorityQueue
 
 from .scheduler import Scheduler
+from .scheduleditem import ScheduledItem
 
 log = logging.getLogger("Rx")
 
+# Monotonic clock for due times, falling back to wall time on Python 2.7
+monotonic = getattr(time, "monotonic", time.time)
+
+def invoke_item(item):
+    """Invokes a scheduled item unless it has been cancelled. Exceptions are
+    logged since there is no caller left to raise them to."""
+
+    if not item.is_cancelled():
+        try:
+            item.invoke()
+        except Exception:
+            log.exception("Unhandled exception in scheduled action")
+
+class WorkerPool(object):
+    """Bounded pool of daemon threads running scheduled items. Threads are
+    started on demand, up to max_workers, and then kept alive."""
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self.work = Queue()
+        self.lock = threading.Lock()
+        self.workers = 0
+        self.idle = 0
+
+    def submit(self, item):
+        with self.lock:
+            start = not self.idle and self.workers < self.max_workers
+            if start:
+                self.workers += 1
+            else:
+                self.idle -= 1
+
+        self.work.put(item)
+        if start:
+            thread = threading.Thread(target=self.run)
+            thread.daemon = True
+            thread.start()
+
+    def run(self):
+        while True:
+            invoke_item(self.work.get())
+
+            with self.lock:
+                self.idle += 1
+
 class TimeoutScheduler(Scheduler):
-    """A scheduler that schedules work via a timed callback based upon platform."""
+    """A scheduler that schedules work via a timed callback based upon platform.
 
-    def schedule(self, action, state=None):
-        scheduler = self
-        disposable = SingleAssignmentDisposable()
+    Due times are kept in a single priority queue serviced by one timer
+    thread, and the actions themselves run on a bounded pool of worker
+    threads.
+    """
 
-        def interval():
-            disposable.disposable = action(scheduler, state)
-        timer = [Timer(0, interval)]
-        timer[0].start()
+    def __init__(self, max_workers=None):
+        """Creates a timeout scheduler.
 
-        def dispose():
-            # nonlocal timer
-            timer[0].cancel()
-        return CompositeDisposable(disposable, Disposable(dispose))
+        Keyword arguments:
+        max_workers -- [Optional] Maximum number of worker threads running
+            actions. Defaults to five times the number of processors.
+        """
+
+        self.pool = WorkerPool(max_workers or cpu_count() * 5)
+        self.condition = threading.Condition()
+        self.queue = PriorityQueue()
+        self.timer_thread = None
+        self.is_disposed = False
+
+    def schedule(self, action, state=None):
+        if self.is_disposed:
+            return Disposable.empty()
+
+        si = ScheduledItem(self, state, action, None)
+        self.dispatch(si)
+        return si.disposable
 
     def schedule_relative(self, duetime, action, state=None):
-        scheduler = self
         dt = Scheduler.normalize(duetime)
         if dt == 0:
-            return scheduler.schedule(action, state)
-
-        disposable = SingleAssignmentDisposable()
-        def interval():
-            disposable.disposable = action(scheduler, state)
+            return self.schedule(action, state)
 
         if isinstance(dt, int):
             seconds = dt/1000.0
         else:
-            seconds = dt.seconds+dt.microseconds/1000000.0
+            seconds = dt.total_seconds()
         log.debug("timeout: %s", seconds)
-        timer = [Timer(seconds, interval)]
-        timer[0].start()
+        return self._enqueue(monotonic() + seconds, action, state)
+
+    def schedule_absolute(self, duetime, action, state=None):
+        return self.schedule_relative(duetime - self.now(), action, state)
+
+    def schedule_periodic(self, period, action, state=None):
+        """Schedules a periodic piece of work on the timer thread. Ticks are
+        scheduled relative to the previous due time so the period does not
+        drift.
+
+        Keyword parameters:
+        period -- Period in milliseconds for running the work periodically.
+        action -- Action to be executed.
+        state -- [Optional] Initial state passed to the action upon the first
+            iteration.
+
+        Returns the disposable object used to cancel the scheduled recurring
+        action (best effort).
+        """
+
+        if isinstance(period, timedelta):
+            seconds = period.total_seconds()
+        else:
+            seconds = period/1000.0
+
+        disposable = SerialDisposable()
+        s = [state]
+
+        def tick(scheduler, duetime):
+            s[0] = action(s[0])
+
+            duetime = max(duetime + seconds, monotonic())
+            disposable.disposable = self._enqueue(duetime, tick, duetime)
+
+        duetime = monotonic() + seconds
+        disposable.disposable = self._enqueue(duetime, tick, duetime)
+        return disposable
+
+    def dispatch(self, item):
+        """Runs an item that is due. Subclasses override this to run the
+        work somewhere else than on the worker pool."""
+
+        self.pool.submit(item)
+
+    def _enqueue(self, duetime, action, state):
+        """Adds an action to the timer queue at the given monotonic time."""
+
+        si = ScheduledItem(self, state, action, duetime)
+        with self.condition:
+            if self.is_disposed:
+                return Disposable.empty()
+
+            self.queue.enqueue(si)
+            if self.timer_thread is None:
+                self.timer_thread = threading.Thread(target=self._run_timer)
+                self.timer_thread.daemon = True
+                self.timer_thread.start()
+            elif self.queue.peek() is si:
+                self.condition.notify()
 
         def dispose():
-            # nonlocal timer
-            timer[0].cancel()
+            with self.condition:
+                self.queue.remove(si)
 
-        return CompositeDisposable(disposable, Disposable(dispose))
+        return CompositeDisposable(si.disposable, Disposable(dispose))
 
-    def schedule_absolute(self, duetime, action, state=None):
-        return self.schedule_relative(duetime - self.now(), action, state)
+    def _run_timer(self):
+        condition, pending = self.condition, self.queue
+
+        while True:
+            with condition:
+                while True:
+                    if self.is_disposed:
+                        self.timer_thread = None
+                        return
+
+                    if not pending.length:
+                        condition.wait()
+                        continue
+
+                    timeout = pending.peek().duetime - monotonic()
+                    if timeout <= 0:
+                        item = pending.dequeue()
+                        break
+                    condition.wait(timeout)
+
+            # The timer thread serves every timed item of the scheduler, so
+            # it must outlive an item that cannot be dispatched
+            try:
+                self.dispatch(item)
+            except Exception:
+                log.exception("Dropped scheduled item that could not be dispatched")
+
+    def dispose(self):
+        """Stops the timer thread. Timed work that is not due yet is
+        dropped, and so is work scheduled after this."""
+
+        with self.condition:
+            self.is_disposed = True
+            self.queue = PriorityQueue()
+            self.condition.notify()
 
 Scheduler.timeout = timeout_scheduler = TimeoutScheduler()
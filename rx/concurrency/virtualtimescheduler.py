@@ -3,7 +3,7 @@ import logging
 from rx.internal import PriorityQueue, ArgumentOutOfRangeException
 
 from .scheduler import Scheduler
-from .scheduleditem import ScheduledItem
+from .scheduleditem import ScheduledItem, default_sub_comparer
 from .scheduleperiodicrecursive import SchedulePeriodicRecursive
 
 log = logging.getLogger("Rx")
@@ -18,13 +18,15 @@ class VirtualTimeScheduler(Scheduler):
 
         Keyword arguments:
         initial_clock -- Initial value for the clock.
-        comparer -- Comparer to determine causality of events based on absolute time.
+        comparer -- [Optional] Comparer to determine causality of events
+            based on absolute time. Defaults to the natural ordering of the
+            clock values.
         """
 
         self.clock = initial_clock
-        self.comparer = comparer
+        self.comparer = comparer or default_sub_comparer
         self.is_enabled = False
-        self.queue = PriorityQueue(1024)
+        self.queue = PriorityQueue(1024, comparer)
 
         super(VirtualTimeScheduler, self).__init__()
 
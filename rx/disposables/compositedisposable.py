@@ -1,55 +1,65 @@
+import threading
+from collections import OrderedDict
+
 from .disposable import Disposable
 
 class CompositeDisposable(Disposable):
-    """Represents a group of disposable resources that are disposed together"""
-    
+    """Represents a group of disposable resources that are disposed together.
+
+    The disposables are kept in an ordered dict keyed by identity, so adding
+    and removing one is O(1) and they are disposed in the order they were
+    added. Adding the same disposable twice keeps one entry. The group may
+    be changed from several threads; disposables are always disposed
+    outside the lock."""
+
     def __init__(self, *args):
         if args and isinstance(args[0], list):
-            self.disposables = args[0]
-        else:
-            self.disposables = list(args)
+            args = args[0]
+
+        self.disposables = OrderedDict((id(item), item) for item in args)
         self.is_disposed = False
-        
+        self.lock = threading.Lock()
+
     def add(self, item):
-        if self.is_disposed:
-            item.dispose()
-        else:
-            self.disposables.append(item)
-            
+        with self.lock:
+            if not self.is_disposed:
+                self.disposables[id(item)] = item
+                return
+
+        item.dispose()
+
     def remove(self, item):
-        should_dispose = False
-        if not self.is_disposed and item in self.disposables:
-            self.disposables.remove(item)
-            should_dispose = True
-            item.dispose()
+        with self.lock:
+            if self.is_disposed or self.disposables.pop(id(item), None) is None:
+                return False
 
-        return should_dispose
+        item.dispose()
+        return True
 
     def dispose(self):
-        if self.is_disposed:
-            return
-        
-        self.is_disposed = True
-        current_disposables = self.disposables[:]
-        self.disposables = []
-        
-        for disposable in current_disposables:
+        with self.lock:
+            if self.is_disposed:
+                return
+
+            self.is_disposed = True
+            current_disposables, self.disposables = self.disposables, OrderedDict()
+
+        for disposable in current_disposables.values():
             disposable.dispose()
-            
+
     def clear(self):
-        current_disposables = self.disposables[:]
-        self.disposables = []
-        
-        for disposable in current_disposables:
+        with self.lock:
+            current_disposables, self.disposables = self.disposables, OrderedDict()
+
+        for disposable in current_disposables.values():
             disposable.dispose()
-            
+
     def contains(self, item):
-        return item in self.disposables
+        return id(item) in self.disposables
 
     def to_array(self):
-        return self.disposables[:]
+        return list(self.disposables.values())
 
     @property
     def length(self):
         return len(self.disposables)
-
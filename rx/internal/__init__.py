@@ -1,6 +1,8 @@
 from .priorityqueue import PriorityQueue
+from .joinindex import JoinIndex
 from .basic import noop, default_error, default_comparer
-from .exceptions import SequenceContainsNoElementsError, ArgumentOutOfRangeException, DisposedException
+from .exceptions import SequenceContainsNoElementsError, ArgumentOutOfRangeException, DisposedException, \
+    BufferOverflowException
 from .extensionmethod import ExtensionMethod
 from .enumerable import Enumerable
 from .enumerator import Enumerator
@@ -19,3 +19,7 @@ class ReEntracyException(Exception):
 class CompletedException(Exception):
     def __init__(self, msg=None):
         super(CompletedException, self).__init__(msg or 'Observer completed')
+
+class BufferOverflowException(Exception):
+    def __init__(self, msg=None):
+        super(BufferOverflowException, self).__init__(msg or 'Buffer overflow')
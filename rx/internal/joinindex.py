@@ -0,0 +1,48 @@
+from collections import OrderedDict
+
+import six
+
+
+class JoinIndex(object):
+    """The live elements of one side of a join, by join key. Elements with
+    the same key are kept in arrival order, so looking up the partners of
+    an element only visits the elements with its key. Unkeyed joins use the
+    key None for everything."""
+
+    def __init__(self):
+        self.buckets = {}
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def add(self, key, id, value):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = OrderedDict()
+
+        bucket[id] = value
+        self.length += 1
+
+    def remove(self, key, id):
+        """Removes the element. Returns False if it was not in the index."""
+
+        bucket = self.buckets.get(key)
+        if bucket is None or bucket.pop(id, self) is self:
+            return False
+
+        if not bucket:
+            del self.buckets[key]
+        self.length -= 1
+        return True
+
+    def get(self, key):
+        """Returns the live elements with the given key."""
+
+        bucket = self.buckets.get(key)
+        return bucket.values() if bucket is not None else ()
+
+    def values(self):
+        """Returns all live elements."""
+
+        return [value for bucket in six.itervalues(self.buckets) for value in six.itervalues(bucket)]
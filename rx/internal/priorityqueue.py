@@ -1,88 +1,78 @@
-# Collections
-class IndexedItem(object):
-    def __init__(self, id, value):
-        self._id = id
-        self.value = value
-
-    def compare_to(self, other):
-        ret = self.value.compare_to(other.value)
-        if not ret:
-            ret = self._id - other._id        
-        return ret
+import heapq
+import itertools
+from functools import cmp_to_key
 
 class PriorityQueue(object):
-    """ Priority Queue for Scheduling"""
-    count = 0
+    """Priority Queue for Scheduling. Items are ordered by their duetime,
+    and items with the same duetime are dequeued in the order they were
+    enqueued.
 
-    def __init__(self, capacity=None):
+    Keyword arguments:
+    capacity -- [Optional] Unused, kept for compatibility.
+    comparer -- [Optional] Comparer function for duetimes returning a
+        negative, zero or positive number. Duetimes are compared directly
+        if no comparer is given, which is considerably faster.
+    """
+
+    def __init__(self, capacity=None, comparer=None):
+        self.key = cmp_to_key(comparer) if comparer else None
+
+        # Heap of (duetime, sequence, item) entries. The sequence number
+        # breaks ties, so the items themselves are never compared.
         self.items = []
-        self.length = 0
-    
-    def is_higher_priority(self, left, right):
-        return self.items[left].compare_to(self.items[right]) < 0
-
-    def percolate(self, index):
-        if index >= self.length or index < 0:
-            return
-        
-        parent = index - 1 >> 1
-        if parent < 0 or parent == index:
-            return
-        
-        if self.is_higher_priority(index, parent):
-            temp = self.items[index]
-            self.items[index] = self.items[parent]
-            self.items[parent] = temp
-            self.percolate(parent)
-        
-    def heapify(self, index=None):
-        if index is None:
-            index = 0
-        
-        if index >= self.length or index < 0:
-            return
-        
-        left = 2 * index + 1
-        right = 2 * index + 2
-        first = index
-        
-        if left < self.length and self.is_higher_priority(left, first):
-            first = left
-        
-        if right < self.length and self.is_higher_priority(right, first):
-            first = right
-        
-        if first != index:
-            temp = self.items[index]
-            self.items[index] = self.items[first]
-            self.items[first] = temp
-            self.heapify(first)
+
+        # Maps id(item) to its live heap entry. Entries in the heap that are
+        # not in this map have been removed, and are discarded lazily.
+        self.entries = {}
+        self.sequence = itertools.count()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def length(self):
+        return len(self.entries)
+
+    def _prune(self):
+        """Discards removed entries from the head of the heap."""
+
+        items, entries = self.items, self.entries
+        while items and entries.get(id(items[0][2])) is not items[0]:
+            heapq.heappop(items)
 
     def peek(self):
-        return self.items[0].value
-    
-    def remove_at(self, index):
-        self.length -= 1
-        self.items[index] = self.items[self.length]
-        del self.items[self.length]
-        self.heapify()
-    
+        self._prune()
+        return self.items[0][2]
+
     def dequeue(self):
-        result = self.peek()
-        self.remove_at(0)
-        return result
-    
+        self._prune()
+        item = heapq.heappop(self.items)[2]
+        del self.entries[id(item)]
+        return item
+
     def enqueue(self, item):
-        index = self.length
-        self.length += 1
-        self.items.append(IndexedItem(PriorityQueue.count, item))
-        PriorityQueue.count += 1
-        self.percolate(index)
-    
+        duetime = self.key(item.duetime) if self.key else item.duetime
+        entry = (duetime, next(self.sequence), item)
+        self.entries[id(item)] = entry
+        heapq.heappush(self.items, entry)
+
     def remove(self, item):
-        for index, _item in enumerate(self.items):
-            if _item.value == item:
-                self.remove_at(index)
-                return True
-        
-        return False
+        """Removes the given item from the queue. Unless the item is at the
+        head of the heap its entry is left in place and discarded later, or
+        when removed entries make up more than half of the heap.
+
+        Returns True if the item was found in the queue, else False."""
+
+        entries = self.entries
+        entry = entries.pop(id(item), None)
+        if entry is None:
+            return False
+
+        items = self.items
+        if items[0] is entry:
+            heapq.heappop(items)
+        elif len(items) > 2 * len(entries) + 64:
+            self.items = [e for e in items if entries.get(id(e[2])) is e]
+            heapq.heapify(self.items)
+
+        return True
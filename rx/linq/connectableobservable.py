@@ -1,5 +1,10 @@
+import threading
+from datetime import timedelta
+
 from rx import AnonymousObservable, Observable
-from rx.disposables import Disposable, CompositeDisposable
+from rx.concurrency import timeout_scheduler
+from rx.disposables import Disposable, CompositeDisposable, SerialDisposable
+from rx.internal import ArgumentOutOfRangeException
 
 class ConnectableObservable(Observable):
 
@@ -25,23 +30,93 @@ class ConnectableObservable(Observable):
 
         return self.subscription
 
-    def ref_count(self):
+    def ref_count(self, grace=None, scheduler=None):
+        """Returns an observable sequence that stays connected to the
+        source as long as there is at least one subscription to the
+        observable sequence.
+
+        With a grace period, the source is disconnected only once there
+        has been no subscription for that long, so subscribers that come
+        and go do not reconnect it every time.
+
+        1 - res = connectable.ref_count()
+        2 - res = connectable.ref_count(timedelta(seconds=5))
+
+        Keyword arguments:
+        grace -- [Optional] Time in milliseconds, or a timedelta, to stay
+            connected after the last subscription is disposed. By default
+            the source is disconnected right away.
+        scheduler -- [Optional] Scheduler to run the disconnect timer on.
+            Defaults to rx.Scheduler.timeout.
+
+        Returns an observable sequence that stays connected to the source
+        as long as there is at least one subscription to the observable
+        sequence. The returned observable has a stats dict with the number
+        of connects, of disconnects and of subscriptions that reused a
+        connection during its grace period.
+        """
+
+        if grace is not None and not isinstance(grace, timedelta):
+            grace = timedelta(milliseconds=grace)
+        if grace is not None and grace < timedelta(0):
+            raise ArgumentOutOfRangeException()
+        scheduler = scheduler or timeout_scheduler
+
+        source = self
         connectable_subscription = [None]
         count = [0]
-        source = self
+        # Incremented by every subscription, so a disconnect timer can
+        # tell that it has been overtaken
+        generation = [0]
+        timer = SerialDisposable()
+        lock = threading.RLock()
+        stats = {"connects": 0, "disconnects": 0, "reused": 0}
+
+        def disconnect():
+            connectable_subscription[0].dispose()
+            connectable_subscription[0] = None
+            stats["disconnects"] += 1
 
         def subscribe(observer):
-            count[0] += 1
-            should_connect = count[0] == 1
-            subscription = source.subscribe(observer)
-            if should_connect:
-                connectable_subscription[0] = source.connect()
+            with lock:
+                count[0] += 1
+                generation[0] += 1
+                subscription = source.subscribe(observer)
+                if connectable_subscription[0] is None:
+                    connectable_subscription[0] = source.connect()
+                    stats["connects"] += 1
+                elif count[0] == 1:
+                    timer.disposable = Disposable.empty()
+                    stats["reused"] += 1
+
+            is_disposed = [False]
 
             def dispose():
-                subscription.dispose()
-                count[0] -= 1
-                if not count[0]:
-                    connectable_subscription[0].dispose()
+                with lock:
+                    if is_disposed[0]:
+                        return
+                    is_disposed[0] = True
+
+                    subscription.dispose()
+                    count[0] -= 1
+                    if count[0]:
+                        return
+
+                    if not grace:
+                        disconnect()
+                        return
+
+                    current = generation[0]
+
+                    def action(scheduler, state):
+                        with lock:
+                            if generation[0] == current and not count[0]:
+                                disconnect()
+
+                    timer.disposable = scheduler.schedule_relative(grace, action)
 
             return Disposable.create(dispose)
-        return AnonymousObservable(subscribe)
+
+        observable = AnonymousObservable(subscribe)
+        observable.stats = stats
+        return observable
@@ -0,0 +1,51 @@
+from rx import AnonymousObservable
+from rx.abstractobserver import AbstractObserver
+
+class FusedObserver(AbstractObserver):
+    """Observer at the head of a fused chain. Its next is the composed chain
+    of stages, and once any stage terminates the sequence further elements
+    from the source are ignored."""
+
+    def __init__(self, observer):
+        super(FusedObserver, self).__init__()
+
+        self.error = observer.on_error
+        self.completed = observer.on_completed
+
+class FusedObservable(AnonymousObservable):
+    """Observable running a chain of synchronous per-element operators, like
+    select, where, take and skip, as a single stage.
+
+    Each stage is a function stage(sink, on_next) called once per
+    subscription. It returns the on_next function of the stage, which
+    forwards elements to the given on_next of the next stage, and ends the
+    sequence by calling sink.on_error or sink.on_completed. Applying another
+    fusible operator to a fused observable appends a stage instead of adding
+    a subscription layer, so each element costs one function call per
+    operator."""
+
+    def __init__(self, source, stages):
+        self.source = source
+        self.stages = stages
+
+        super(FusedObservable, self).__init__(self.__subscribe)
+
+    def __subscribe(self, observer):
+        sink = FusedObserver(observer)
+
+        on_next = observer.on_next
+        for stage in reversed(self.stages):
+            on_next = stage(sink, on_next)
+        sink.next = on_next
+
+        return self.source.subscribe(sink)
+
+    @classmethod
+    def fuse(cls, source, stage):
+        """Returns an observable applying stage to the elements of source,
+        appended to the stages of source if it is fused itself."""
+
+        if isinstance(source, FusedObservable):
+            return cls(source.source, source.stages + (stage,))
+
+        return cls(source, (stage,))
@@ -6,7 +6,9 @@ from . import amb
 from . import any
 from . import asobservable
 from . import average
+from . import batch
 from . import buffer
+from . import bufferwithcount
 from . import bufferwithtime
 from . import bufferwithtimeorcount
 from . import case
@@ -23,6 +25,7 @@ from . import delaysubscription
 from . import delaywithselector
 from . import dematerialize
 from . import distinct
+from . import distinctwithin
 from . import distinctuntilchanged
 from . import doaction
 from . import dowhile
@@ -39,6 +42,7 @@ from . import first
 from . import firstordefault
 from . import forin
 from . import fromiterable
+from . import frombuffer
 from . import fromcallback
 from . import fromfuture
 from . import generate
@@ -51,6 +55,7 @@ from . import ignoreelements
 from . import interval
 from . import isempty
 from . import join
+from . import joinwithin
 from . import last
 from . import let
 from . import lastordefault
@@ -78,6 +83,7 @@ from . import scan
 from . import select
 from . import selectswitch
 from . import selectmany
+from . import selectparallel
 from . import sequenceequal
 from . import single
 from . import singleordefault
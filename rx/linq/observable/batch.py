@@ -0,0 +1,87 @@
+from itertools import compress
+
+from six import add_metaclass
+
+from rx import Observable
+from rx.linq.fusedobservable import FusedObservable
+from rx.internal import ExtensionMethod
+
+@add_metaclass(ExtensionMethod)
+class ObservableBatch(Observable):
+    """Uses a meta class to extend Observable with the methods in this class"""
+
+    def select_batch(self, selector):
+        """Projects each chunk of an observable sequence of chunks, e.g. from
+        from_buffer, into a new chunk. The selector gets the whole chunk, so
+        it can be a vectorized function like a NumPy ufunc.
+
+        1 - source.select_batch(numpy.sqrt)
+        2 - source.select_batch(lambda chunk: [x * 2 for x in chunk])
+
+        Keyword arguments:
+        selector -- A transform function to apply to each chunk.
+
+        Returns an observable sequence of the transformed chunks.
+        """
+
+        def stage(sink, on_next):
+            def next(chunk):
+                try:
+                    result = selector(chunk)
+                except Exception as err:
+                    sink.on_error(err)
+                else:
+                    on_next(result)
+            return next
+        return FusedObservable.fuse(self, stage)
+
+    def where_batch(self, predicate):
+        """Filters the elements of each chunk of an observable sequence of
+        chunks. The predicate gets the whole chunk and returns a mask with a
+        truth value per element, e.g. a NumPy boolean array. Chunks left
+        empty are dropped.
+
+        1 - source.where_batch(lambda chunk: chunk > 0)
+        2 - source.where_batch(lambda chunk: [x % 2 == 0 for x in chunk])
+
+        Keyword arguments:
+        predicate -- A function returning the mask of elements to keep for a
+            chunk.
+
+        Returns an observable sequence of chunks with only the elements whose
+        mask value is true. Chunks that have a compress method, like NumPy
+        arrays, are filtered with it, other chunks are returned as lists.
+        """
+
+        def stage(sink, on_next):
+            def next(chunk):
+                try:
+                    mask = predicate(chunk)
+                    if hasattr(chunk, "compress"):
+                        chunk = chunk.compress(mask, axis=0)
+                    else:
+                        chunk = list(compress(chunk, mask))
+                except Exception as err:
+                    sink.on_error(err)
+                    return
+
+                if len(chunk):
+                    on_next(chunk)
+            return next
+        return FusedObservable.fuse(self, stage)
+
+    def unbatch(self):
+        """Flattens an observable sequence of chunks into an observable
+        sequence of their elements.
+
+        Returns an observable sequence of the elements of each chunk.
+        """
+
+        def stage(sink, on_next):
+            def next(chunk):
+                for value in chunk:
+                    on_next(value)
+                    if sink.is_stopped:
+                        return
+            return next
+        return FusedObservable.fuse(self, stage)
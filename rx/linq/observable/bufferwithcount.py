@@ -0,0 +1,82 @@
+from collections import deque
+
+from six import add_metaclass
+
+from rx import AnonymousObservable, Observable
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
+
+@add_metaclass(ExtensionMethod)
+class ObservableBufferWithCount(Observable):
+    """Uses a meta class to extend Observable with the methods in this class"""
+
+    def buffer_with_count(self, count, skip=None, dtype=None):
+        """Projects each element of an observable sequence into zero or more
+        buffers which are produced based on element count information.
+
+        Example:
+        res = xs.buffer_with_count(10)
+        res = xs.buffer_with_count(10, 1)
+        res = xs.buffer_with_count(1000, dtype="float64")
+
+        Keyword parameters:
+        count -- {Number} Length of each buffer.
+        skip -- {Number} [Optional] Number of elements to skip between creation
+            of consecutive buffers. If not provided, defaults to the count.
+        dtype -- [Optional] NumPy data type. If given, each buffer is sent as
+            a contiguous NumPy array of this type instead of a list. Requires
+            NumPy.
+
+        Elements are appended directly to a list per open buffer. With
+        skip == count there is only ever one open buffer.
+
+        Returns an observable {Observable} sequence of buffers."""
+
+        if skip is None:
+            skip = count
+
+        if count <= 0 or skip <= 0:
+            raise ArgumentOutOfRangeException()
+
+        if dtype is None:
+            convert = None
+        else:
+            # Lazy import numpy, it is only needed for array buffers
+            import numpy
+
+            def convert(buffer):
+                return numpy.array(buffer, dtype=dtype)
+
+        source = self
+
+        def subscribe(observer):
+            buffers = deque([[]])
+            n = [0]
+
+            def emit(buffer):
+                observer.on_next(convert(buffer) if convert else buffer)
+
+            def on_next(x):
+                for buffer in buffers:
+                    buffer.append(x)
+
+                c = n[0] - count + 1
+                if c >= 0 and c % skip == 0:
+                    emit(buffers.popleft())
+
+                n[0] += 1
+                if n[0] % skip == 0:
+                    buffers.append([])
+
+            def on_error(exception):
+                buffers.clear()
+                observer.on_error(exception)
+
+            def on_completed():
+                while buffers:
+                    buffer = buffers.popleft()
+                    if buffer:
+                        emit(buffer)
+                observer.on_completed()
+
+            return source.subscribe(on_next, on_error, on_completed)
+        return AnonymousObservable(subscribe)
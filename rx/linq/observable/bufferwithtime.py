@@ -1,7 +1,13 @@
+import threading
+from collections import deque
+from datetime import timedelta
+
 from six import add_metaclass
 
 from rx import AnonymousObservable, Observable
 from rx.concurrency import timeout_scheduler
+from rx.disposables import CompositeDisposable, SerialDisposable, \
+    SingleAssignmentDisposable
 from rx.internal import ExtensionMethod
 
 @add_metaclass(ExtensionMethod)
@@ -17,7 +23,7 @@ class ObservableBufferWithTime(Observable):
 
         Keyword arguments:
         timespan -- Length of each buffer (specified as an integer denoting
-            milliseconds).
+            milliseconds or a timedelta).
         timeshift -- [Optional] Interval between creation of consecutive
             buffers (specified as an integer denoting milliseconds), or an
             optional scheduler parameter. If not specified, the time shift
@@ -26,12 +32,79 @@ class ObservableBufferWithTime(Observable):
         scheduler -- [Optional] Scheduler to run buffer timers on. If not
             specified, the timeout scheduler is used.
 
+        Elements are appended directly to a list per open buffer, and a
+        single timer is pending at a time for the next buffer to open or
+        close.
+
         Returns an observable sequence of buffers.
         """
+        source = self
+
         if not timeshift:
             timeshift = timespan
 
+        if not isinstance(timespan, timedelta):
+            timespan = timedelta(milliseconds=timespan)
+        if not isinstance(timeshift, timedelta):
+            timeshift = timedelta(milliseconds=timeshift)
+
         scheduler = scheduler or timeout_scheduler
 
-        return self.window_with_time(timespan, timeshift, scheduler) \
-            .select_many(lambda x: x.to_array())
\ No newline at end of file
+        def subscribe(observer):
+            timer_d = SerialDisposable()
+            next_shift = [timeshift]
+            next_span = [timespan]
+            total_time = [timedelta(0)]
+            buffers = deque([[]])
+            gate = threading.RLock()
+
+            # One timer at a time, set for whichever comes first of the next
+            # buffer to open and the oldest buffer to close
+            def create_timer():
+                is_span = next_span[0] <= next_shift[0]
+                is_shift = next_shift[0] <= next_span[0]
+
+                new_total_time = next_span[0] if is_span else next_shift[0]
+                ts = new_total_time - total_time[0]
+                total_time[0] = new_total_time
+                if is_span:
+                    next_span[0] += timeshift
+                if is_shift:
+                    next_shift[0] += timeshift
+
+                def action(scheduler, state=None):
+                    with gate:
+                        if is_shift:
+                            buffers.append([])
+                        if is_span:
+                            observer.on_next(buffers.popleft())
+
+                    create_timer()
+
+                # Set before scheduling, so a timer that fires and creates
+                # the next one on another thread is not replaced afterwards
+                m = SingleAssignmentDisposable()
+                timer_d.disposable = m
+                m.disposable = scheduler.schedule_relative(ts, action)
+
+            create_timer()
+
+            def on_next(x):
+                with gate:
+                    for buffer in buffers:
+                        buffer.append(x)
+
+            def on_error(e):
+                with gate:
+                    buffers.clear()
+                    observer.on_error(e)
+
+            def on_completed():
+                with gate:
+                    while buffers:
+                        observer.on_next(buffers.popleft())
+                    observer.on_completed()
+
+            subscription = source.subscribe(on_next, on_error, on_completed)
+            return CompositeDisposable(subscription, timer_d)
+        return AnonymousObservable(subscribe)
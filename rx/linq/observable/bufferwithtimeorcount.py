@@ -1,29 +1,86 @@
+import threading
+from datetime import timedelta
+
 from six import add_metaclass
 
 from rx import AnonymousObservable, Observable
 from rx.concurrency import timeout_scheduler
+from rx.disposables import CompositeDisposable, SerialDisposable, \
+    SingleAssignmentDisposable
 from rx.internal import ExtensionMethod
 
 @add_metaclass(ExtensionMethod)
-class ObservableBufferWithTime(Observable):
+class ObservableBufferWithTimeOrCount(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def buffer_with_time_or_count(self, timespan, count, scheduler):
+    def buffer_with_time_or_count(self, timespan, count, scheduler=None):
         """Projects each element of an observable sequence into a buffer that
         is completed when either it's full or a given amount of time has
         elapsed.
 
-        1 - res = source.bufferWithTimeOrCount(5000, 50); # 5s or 50 items in an array
-        2 - res = source.bufferWithTimeOrCount(5000, 50, Scheduler.timeout); # 5s or 50 items in an array
+        1 - res = source.buffer_with_time_or_count(5000, 50) # 5s or 50 items in an array
+        2 - res = source.buffer_with_time_or_count(5000, 50, Scheduler.timeout) # 5s or 50 items in an array
 
         Keyword arguments:
-        timespan -- Maximum time length of a buffer.
+        timespan -- Maximum time length of a buffer, in milliseconds or as a
+            timedelta. The timer restarts whenever a buffer is emitted.
         count -- Maximum element count of a buffer.
         scheduler -- [Optional] Scheduler to run bufferin timers on. If not
             specified, the timeout scheduler is used.
 
         Returns an observable sequence of buffers.
         """
+        source = self
+        if not isinstance(timespan, timedelta):
+            timespan = timedelta(milliseconds=timespan)
+
         scheduler = scheduler or timeout_scheduler
-        return self.window_with_time_or_count(timespan, count, scheduler) \
-            .select_many(lambda x: x.to_array())
+
+        def subscribe(observer):
+            buffer = [[]]
+            buffer_id = [0]
+            timer_d = SerialDisposable()
+            gate = threading.RLock()
+
+            def flush():
+                """Emits the current buffer and starts a new one. Call with
+                the gate held."""
+
+                observer.on_next(buffer[0])
+                buffer[0] = []
+                buffer_id[0] += 1
+                create_timer(buffer_id[0])
+
+            def create_timer(_id):
+                def action(scheduler, state=None):
+                    with gate:
+                        if _id == buffer_id[0]:
+                            flush()
+
+                # Set before scheduling, so a timer that fires and creates
+                # the next one on another thread is not replaced afterwards
+                m = SingleAssignmentDisposable()
+                timer_d.disposable = m
+                m.disposable = scheduler.schedule_relative(timespan, action)
+
+            create_timer(0)
+
+            def on_next(x):
+                with gate:
+                    buffer[0].append(x)
+                    if len(buffer[0]) == count:
+                        flush()
+
+            def on_error(e):
+                with gate:
+                    buffer[0] = []
+                    observer.on_error(e)
+
+            def on_completed():
+                with gate:
+                    observer.on_next(buffer[0])
+                    observer.on_completed()
+
+            subscription = source.subscribe(on_next, on_error, on_completed)
+            return CompositeDisposable(subscription, timer_d)
+        return AnonymousObservable(subscribe)
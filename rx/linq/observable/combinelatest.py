@@ -1,3 +1,5 @@
+import threading
+
 from six import add_metaclass
 
 from rx.observable import Observable
@@ -12,7 +14,7 @@ class ObservableCombineLatest(Observable):
     def __init__(self, subscribe):
         self.combine_latest = self.__combine_latest
 
-    def __combine_latest(self, *args):
+    def __combine_latest(self, *args, **kwargs):
         """Merges the specified observable sequences into one observable 
         sequence by using the selector function whenever any of the observable
         sequences produces an element. This can be in the form of an argument 
@@ -20,6 +22,12 @@ class ObservableCombineLatest(Observable):
      
         1 - obs = observable.combine_latest(obs1, obs2, obs3, function (o1, o2, o3) { return o1 + o2 + o3; })
         2 - obs = observable.combine_latest([obs1, obs2, obs3], function (o1, o2, o3) { return o1 + o2 + o3; })
+        3 - obs = observable.combine_latest(obs1, fn, conflate_on=rx.Scheduler.timeout)
+
+        Keyword arguments:
+        conflate_on -- [Optional] Scheduler to call the selector on, once
+            per scheduler turn with the latest values. See
+            Observable.combine_latest.
      
         Returns an observable sequence containing the result of combining 
         elements of the sources using the specified result selector function.
@@ -31,17 +39,24 @@ class ObservableCombineLatest(Observable):
 
         args.insert(0, self)
         
-        return Observable.combine_latest(*args)
+        return Observable.combine_latest(*args, **kwargs)
     
     @classmethod
-    def combine_latest(cls, *args):
+    def combine_latest(cls, *args, **kwargs):
         """Merges the specified observable sequences into one observable 
         sequence by using the selector function whenever any of the observable 
         sequences produces an element.
      
         1 - obs = Observable.combine_latest(obs1, obs2, obs3, function (o1, o2, o3) { return o1 + o2 + o3; })
         2 - obs = Observable.combine_latest([obs1, obs2, obs3], function (o1, o2, o3) { return o1 + o2 + o3; })     
-     
+        3 - obs = Observable.combine_latest(obs1, obs2, fn, conflate_on=rx.Scheduler.timeout)
+
+        Keyword arguments:
+        conflate_on -- [Optional] Scheduler to run the selector on. Instead
+            of once per element, the selector is then called once per
+            scheduler turn with the latest values, however many elements
+            arrived since the previous turn.
+
         Returns an observable sequence containing the result of combining 
         elements of the sources using the specified result selector function.
         """
@@ -52,49 +67,105 @@ class ObservableCombineLatest(Observable):
             args = list(args)
         
         result_selector = args.pop()
+        scheduler = kwargs.pop("conflate_on", None)
+        if kwargs:
+            raise TypeError("combine_latest() got an unexpected keyword argument '%s'" % next(iter(kwargs)))
          
         def subscribe(observer):
             n = len(args)
             has_value = [False] * n
-            has_value_all = [False]
             is_done = [False] * n
             values = [None] * n
 
-            def next(i):
-                has_value[i] = True
+            # Number of sources with a value and of completed sources, so
+            # readiness costs O(1) per element
+            ready, done_count = [0], [0]
+
+            # Conflation state: whether a selector turn is scheduled, and
+            # whether to complete after it
+            state = {"is_pending": False, "is_completed": False}
+            lock = threading.Lock()
+            turns = CompositeDisposable()
+
+            def select(latest):
+                try:
+                    res = result_selector(*latest)
+                except Exception as ex:
+                    observer.on_error(ex)
+                    return
                 
-                if has_value_all[0] or all(has_value):
-                    try:
-                        res = result_selector(*values)
-                    except Exception as ex:
-                        observer.on_error(ex)
-                        return
-                    
-                    observer.on_next(res)
-                elif all([x for j, x in enumerate(is_done) if j != i]):
+                observer.on_next(res)
+
+            def action(scheduler, turn):
+                turns.remove(turn)
+                with lock:
+                    state["is_pending"] = False
+                    latest = list(values)
+                    is_completed = state["is_completed"]
+                select(latest)
+                if is_completed:
                     observer.on_completed()
 
-                has_value_all[0] = all(has_value)
+            def next(i):
+                if not has_value[i]:
+                    has_value[i] = True
+                    ready[0] += 1
+
+                if ready[0] == n:
+                    if scheduler is None:
+                        select(values)
+                    elif not state["is_pending"]:
+                        state["is_pending"] = True
+                        return True
+                elif done_count[0] == n - 1:
+                    observer.on_completed()
 
             def done(i):
+                if is_done[i]:
+                    return
                 is_done[i] = True
-                if all(is_done):
-                    observer.on_completed()
+                done_count[0] += 1
+                if done_count[0] == n:
+                    if state["is_pending"]:
+                        state["is_completed"] = True
+                    else:
+                        observer.on_completed()
              
             subscriptions = [None] * n
             def func(i):
                 subscriptions[i] = SingleAssignmentDisposable()
                 
                 def on_next(x):
-                    values[i] = x
-                    next(i)
+                    if scheduler is None:
+                        values[i] = x
+                        next(i)
+                        return
+
+                    # The selector turn may run on another thread, or right
+                    # away on a synchronous scheduler, so it is scheduled
+                    # after the lock is released
+                    with lock:
+                        values[i] = x
+                        should_schedule = next(i)
+                    if should_schedule:
+                        # Each turn has its own disposable, so a turn that
+                        # finishes early on another thread cannot get its
+                        # successor cancelled by a late assignment
+                        turn = SingleAssignmentDisposable()
+                        turns.add(turn)
+                        turn.disposable = scheduler.schedule(action, turn)
                 
                 def on_completed():
-                    done(i)
+                    if scheduler is None:
+                        done(i)
+                        return
+
+                    with lock:
+                        done(i)
                 
                 subscriptions[i].disposable = args[i].subscribe(on_next, observer.on_error, on_completed)
 
             for idx in range(n):
                 func(idx)
-            return CompositeDisposable(subscriptions)
+            return CompositeDisposable(subscriptions + [turns])
         return AnonymousObservable(subscribe)
@@ -1,93 +1,104 @@
 import logging
+import threading
+from collections import deque
 from datetime import datetime, timedelta
 from six import add_metaclass
 
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
-from rx.disposables import CompositeDisposable, \
-    SingleAssignmentDisposable, SerialDisposable
+from rx.disposables import CompositeDisposable, SingleAssignmentDisposable
 from rx.concurrency import timeout_scheduler
 from rx.internal import ExtensionMethod
+from rx.notification import OnNext, OnCompleted
 
 log = logging.getLogger("Rx")
 
-class Timestamp(object):
-    def __init__(self, value, timestamp):
-        self.value = value
-        self.timestamp = timestamp
-
 @add_metaclass(ExtensionMethod)
 class ObservableDelay(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
     def observable_delay_timespan(self, duetime, scheduler):
         source = self
-        
+
         def subscribe(observer):
-            cancelable = SerialDisposable()
+            # One disposable per timer, added before the timer is
+            # scheduled, so a timer that fires and reschedules on another
+            # thread cannot be cancelled by a late assignment
+            timers = CompositeDisposable()
             exception = [None]
             active = [False]
             running = [False]
-            q = []
+            queue = deque()
+            lock = threading.Lock()
 
-            def on_next(notification):
-                log.debug("observable_delay_timespan:subscribe:on_next()")
-                should_run = False
-                d = None
+            # Pairs of (due time, notification) are timestamped on arrival.
+            # At most one timer is pending, for the head of the queue.
+            def schedule_drain(duetime):
+                timer = SingleAssignmentDisposable()
+                timers.add(timer)
+                timer.disposable = scheduler.schedule_relative(duetime, drain, timer)
 
-                if notification.value.kind == 'E':
-                    del q[:]
-                    q.append(notification)
-                    exception[0] = notification.value.exception
-                    should_run = not running[0]
-                else:
-                    q.append(Timestamp(value=notification.value, timestamp=notification.timestamp + duetime))
+            def drain(scheduler, timer):
+                timers.remove(timer)
+                with lock:
+                    if exception[0]:
+                        return
+                    running[0] = True
+
+                while True:
+                    with lock:
+                        if not queue or queue[0][0] > scheduler.now():
+                            break
+                        notification = queue.popleft()[1]
+
+                    notification.accept(observer)
+
+                with lock:
+                    running[0] = False
+                    error = exception[0]
+                    if queue:
+                        recurse_duetime = max(timedelta(0), queue[0][0] - scheduler.now())
+                    else:
+                        recurse_duetime = None
+                        active[0] = False
+
+                if error:
+                    log.error("observable_delay_timespan:subscribe:drain(), exception: %s", error)
+                    observer.on_error(error)
+                elif recurse_duetime is not None:
+                    schedule_drain(recurse_duetime)
+
+            def enqueue(notification):
+                with lock:
+                    queue.append((scheduler.now() + duetime, notification))
                     should_run = not active[0]
                     active[0] = True
-                
+
                 if should_run:
-                    if exception[0]:
-                        log.error("*** Exception: %s", exception[0])
-                        observer.on_error(exception[0])
-                    else:
-                        d = SingleAssignmentDisposable()
-                        cancelable.disposable = d
-
-                        def action(self):
-                            if exception[0]:
-                                log.error("observable_delay_timespan:subscribe:on_next:action(), exception: %s", exception[0])
-                                return
-                            
-                            running[0] = True
-                            while True:
-                                result = None
-                                if len(q) and q[0].timestamp <= scheduler.now():
-                                    result = q.pop(0).value
-                                
-                                if result:
-                                    result.accept(observer)
-                                
-                                if not result:
-                                    break
-                            
-                            should_recurse = False
-                            recurse_duetime = 0
-                            if len(q) > 0:
-                                should_recurse = True
-                                recurse_duetime = max(timedelta(0), q[0].timestamp - scheduler.now())
-                            else:
-                                active[0] = False
-                            
-                            e = exception[0]
-                            running[0] = False
-                            if e:
-                                observer.on_error(e)
-                            elif should_recurse:
-                                self(recurse_duetime)
-
-                        d.disposable = scheduler.schedule_recursive_with_relative(duetime, action)
-            subscription = source.materialize().timestamp(scheduler).subscribe(on_next)
-            return CompositeDisposable(subscription, cancelable)
+                    schedule_drain(duetime)
+
+            # The source is done once it terminates, as if materialized
+            subscription = SingleAssignmentDisposable()
+
+            def on_next(value):
+                enqueue(OnNext(value))
+
+            def on_error(ex):
+                subscription.dispose()
+                with lock:
+                    queue.clear()
+                    exception[0] = ex
+                    should_run = not running[0]
+
+                if should_run:
+                    observer.on_error(ex)
+
+            def on_completed():
+                subscription.dispose()
+                enqueue(OnCompleted())
+
+            subscription.disposable = source.subscribe(on_next, on_error, on_completed)
+            return CompositeDisposable(subscription, timers)
         return AnonymousObservable(subscribe)
 
     def observable_delay_date(self, duetime, scheduler):
@@ -1,10 +1,12 @@
+from collections import OrderedDict
+
 import six
 from six import add_metaclass
 
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
 from rx.internal.basic import identity, default_comparer
-from rx.internal import ExtensionMethod
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
 
 # Swap out for Array.findIndex
 def array_index_of_comparer(array, item, comparer):
@@ -14,44 +16,95 @@ def array_index_of_comparer(array, item, comparer):
     return -1
 
 class HashSet(object):
-    def __init__(self, comparer):
-        self.comparer = comparer
+    """Set of the keys seen by distinct. Keys are hashed if no comparer is
+    given, and scanned with the comparer otherwise or if they are not
+    hashable. With max_keys only that many keys of each kind are kept, and
+    the least recently seen key is forgotten first."""
+
+    def __init__(self, comparer=None, max_keys=None):
+        self.comparer = comparer or default_comparer
+        self.max_keys = max_keys
         self.set = []
 
+        if comparer:
+            self.hashed = None
+        elif max_keys:
+            self.hashed = OrderedDict()
+        else:
+            self.hashed = set()
+
     def push(self, value):
-        ret_value = array_index_of_comparer(self.set, value, self.comparer) == -1
-        ret_value and self.set.append(value)
-        return ret_value
+        """Adds value to the set. Returns True if it was not in the set."""
+
+        hashed = self.hashed
+        if hashed is not None:
+            try:
+                is_new = value not in hashed
+            except TypeError:
+                pass # Not hashable, fall back to the list
+            else:
+                if not self.max_keys:
+                    if is_new:
+                        hashed.add(value)
+                    return is_new
+
+                if not is_new:
+                    del hashed[value]
+                hashed[value] = None
+                if len(hashed) > self.max_keys:
+                    hashed.popitem(last=False)
+                return is_new
+
+        index = array_index_of_comparer(self.set, value, self.comparer)
+        if index == -1:
+            self.set.append(value)
+            if self.max_keys and len(self.set) > self.max_keys:
+                del self.set[0]
+            return True
+
+        if self.max_keys:
+            self.set.append(self.set.pop(index))
+        return False
 
 @add_metaclass(ExtensionMethod)
 class ObservableDistinct(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def distinct(self, key_selector=None, comparer=None):
+    def distinct(self, key_selector=None, comparer=None, max_keys=None):
         """Returns an observable sequence that contains only distinct elements
         according to the key_selector and the comparer. Usage of this operator
         should be considered carefully due to the maintenance of an internal
-        lookup structure which can grow large.
+        lookup structure which can grow large, unless max_keys is given.
+
+        Without a comparer the keys are kept in a hash set, so each element
+        costs O(1). With a comparer every element is compared to all keys
+        seen so far.
 
         Example:
         res = obs = xs.distinct()
         obs = xs.distinct(lambda x: x.id)
         obs = xs.distinct(lambda x: x.id, lambda a,b: a == b)
+        obs = xs.distinct(lambda x: x.id, max_keys=10000)
 
         Keyword arguments:
         key_selector -- {Function} [Optional]  A function to compute the
             comparison key for each element.
         comparer -- {Function} [Optional]  Used to compare items in the
             collection.
+        max_keys -- {Number} [Optional] Maximum number of keys to remember.
+            When exceeded, the least recently seen key is forgotten, and a
+            later element with that key is passed on again.
 
         Returns an observable {Observable} sequence only containing the distinct
         elements, based on a computed key value, from the source sequence."""
 
+        if max_keys is not None and max_keys < 1:
+            raise ArgumentOutOfRangeException()
+
         source = self
-        comparer = comparer or default_comparer
 
         def subscribe(observer):
-            hashset = HashSet(comparer)
+            hashset = HashSet(comparer, max_keys)
 
             def on_next(x):
                 key = x
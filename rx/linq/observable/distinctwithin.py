@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from datetime import timedelta
+
+import six
+from six import add_metaclass
+
+from rx.observable import Observable
+from rx.anonymousobservable import AnonymousObservable
+from rx.concurrency import timeout_scheduler
+from rx.internal import ExtensionMethod
+
+@add_metaclass(ExtensionMethod)
+class ObservableDistinctWithin(Observable):
+    """Uses a meta class to extend Observable with the methods in this class"""
+
+    def distinct_within(self, timespan, key_selector=None, scheduler=None):
+        """Returns an observable sequence that drops elements whose key was
+        already seen in an element passed on less than timespan ago. Only
+        the keys passed on during the last timespan are remembered, so
+        memory is bounded by the rate of distinct keys.
+
+        1 - res = source.distinct_within(5000)
+        2 - res = source.distinct_within(timedelta(seconds=5), lambda x: x.id)
+
+        Keyword arguments:
+        timespan -- Time in milliseconds, or a timedelta, during which an
+            element with the same key as a passed on element is dropped.
+        key_selector -- [Optional] A function to compute the hashable key
+            for each element. Defaults to the element itself.
+        scheduler -- [Optional] Scheduler to read the time from. Defaults to
+            rx.Scheduler.timeout.
+
+        Returns an observable sequence with the elements whose key was not
+        passed on during the timespan before them.
+        """
+
+        source = self
+        scheduler = scheduler or timeout_scheduler
+        if not isinstance(timespan, timedelta):
+            timespan = timedelta(milliseconds=timespan)
+
+        def subscribe(observer):
+            # Keys in the order they were passed on, so expired keys are at
+            # the front
+            passed = OrderedDict()
+
+            def on_next(x):
+                now = scheduler.now()
+                while passed and now - next(six.itervalues(passed)) >= timespan:
+                    passed.popitem(last=False)
+
+                try:
+                    key = key_selector(x) if key_selector else x
+                    if key in passed:
+                        return
+                except Exception as ex:
+                    observer.on_error(ex)
+                    return
+
+                passed[key] = now
+                observer.on_next(x)
+            return source.subscribe(on_next, observer.on_error, observer.on_completed)
+        return AnonymousObservable(subscribe)
@@ -0,0 +1,63 @@
+from six import add_metaclass
+
+from rx.observable import Observable
+from rx.anonymousobservable import AnonymousObservable
+from rx.concurrency import current_thread_scheduler
+from rx.disposables import CompositeDisposable, Disposable
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
+
+@add_metaclass(ExtensionMethod)
+class ObservableFromBuffer(Observable):
+    """Uses a meta class to extend Observable with the methods in this class"""
+
+    @classmethod
+    def from_buffer(cls, buffer, batch_size=1024, scheduler=None):
+        """Converts a sliceable sequence, like a list or a NumPy array, to an
+        observable sequence of chunks. Each chunk is a slice of at most
+        batch_size elements of the buffer, so NumPy chunks are views and are
+        not copied. Use select_batch and where_batch to process the chunks
+        and unbatch to turn them back into single elements.
+
+        1 - res = rx.Observable.from_buffer(values)
+        2 - res = rx.Observable.from_buffer(values, 4096, rx.Scheduler.timeout)
+
+        Keyword arguments:
+        buffer -- Sequence supporting len() and slicing.
+        batch_size -- [Optional] Maximum number of elements per chunk.
+            Defaults to 1024.
+        scheduler -- [Optional] Scheduler to send the chunks on, one chunk
+            per scheduler turn.
+
+        Returns the observable sequence of chunks of the buffer.
+        """
+
+        if batch_size < 1:
+            raise ArgumentOutOfRangeException()
+
+        scheduler = scheduler or current_thread_scheduler
+
+        def subscribe(observer):
+            start = [0]
+            is_disposed = [False]
+
+            def action(action1, state=None):
+                if is_disposed[0]:
+                    return
+
+                length = len(buffer)
+                if start[0] < length:
+                    end = start[0] + batch_size
+                    observer.on_next(buffer[start[0]:end])
+                    start[0] = end
+
+                if start[0] < length:
+                    action1(action)
+                else:
+                    observer.on_completed()
+
+            cancelable = scheduler.schedule_recursive(action)
+
+            def dispose():
+                is_disposed[0] = True
+            return CompositeDisposable(cancelable, Disposable(dispose))
+        return AnonymousObservable(subscribe)
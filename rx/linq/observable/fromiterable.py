@@ -3,42 +3,64 @@ from six import add_metaclass
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
 from rx.concurrency import current_thread_scheduler
-from rx.internal import ExtensionMethod
+from rx.disposables import CompositeDisposable, Disposable
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
 
 @add_metaclass(ExtensionMethod)
 class ObservableFromIterable(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
     @classmethod
-    def from_iterable(cls, iterable, scheduler=None):
+    def from_iterable(cls, iterable, scheduler=None, batch_size=1):
         """Converts an array to an observable sequence, using an optional
         scheduler to enumerate the array.
 
         1 - res = rx.Observable.from_array([1,2,3])
         2 - res = rx.Observable.from_array([1,2,3], rx.Scheduler.timeout)
+        3 - res = rx.Observable.from_array(range(1000000), batch_size=1000)
 
         Keyword arguments:
         scheduler -- [Optional] Scheduler to run the enumeration of the input
             sequence on.
+        batch_size -- [Optional] Number of elements sent per scheduler turn.
+            Larger batches cut the scheduling overhead per element, but the
+            scheduler can interleave other work less often. Defaults to 1.
 
         Returns the observable sequence whose elements are pulled from the
         given enumerable sequence.
         """
 
+        if batch_size < 1:
+            raise ArgumentOutOfRangeException()
+
         scheduler = scheduler or current_thread_scheduler
-        it = iter(iterable)
-        
+
         def subscribe(observer):
+            it = iter(iterable)
+            is_disposed = [False]
+
             def action(action1, state=None):
-                try:
-                    item = next(it)
-                except StopIteration:
-                    observer.on_completed()
-                else:
+                # Checked before every pull, so a generator is not advanced
+                # after the observer has gone
+                for _ in range(batch_size):
+                    if is_disposed[0]:
+                        return
+
+                    try:
+                        item = next(it)
+                    except StopIteration:
+                        observer.on_completed()
+                        return
+
                     observer.on_next(item)
-                    action1(action)
 
-            return scheduler.schedule_recursive(action)
+                action1(action)
+
+            cancelable = scheduler.schedule_recursive(action)
+
+            def dispose():
+                is_disposed[0] = True
+            return CompositeDisposable(cancelable, Disposable(dispose))
         return AnonymousObservable(subscribe)
 
-    from_array = from_list = from_iterable # Compatibility
\ No newline at end of file
+    from_array = from_list = from_iterable # Compatibility
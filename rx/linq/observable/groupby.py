@@ -7,7 +7,8 @@ from rx.internal import ExtensionMethod
 class ObservableGroupBy(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def group_by(self, key_selector, element_selector=None, key_serializer=None):
+    def group_by(self, key_selector, element_selector=None, key_serializer=None,
+                 max_groups=None):
         """Groups the elements of an observable sequence according to a 
         specified key selector function and comparer and selects the resulting
         elements by using a specified function.
@@ -23,15 +24,17 @@ class ObservableGroupBy(Observable):
         key_selector -- A function to extract the key for each element.
         element_selector -- [Optional] A function to map each source element to
             an element in an observable group.
-        comparer -- {Function} [Optional] Used to determine whether the objects 
-            are equal.
+        key_serializer -- [Optional] A function to map a key to the hashable
+            value the groups are looked up by. Defaults to the key itself.
+        max_groups -- [Optional] Maximum number of open groups. The group
+            that has gone longest without an element is completed to make
+            room for a new one. See group_by_until.
         
         Returns a sequence of observable groups, each of which corresponds to a 
         unique key value, containing all elements that share that same key 
         value.        
         """
 
-        def duration_selector(x):
-            return Observable.never()
-
-        return self.group_by_until(key_selector, element_selector, duration_selector, key_serializer)
+        return self.group_by_until(key_selector, element_selector, None,
+                                   key_serializer=key_serializer,
+                                   max_groups=max_groups)
@@ -6,16 +6,16 @@ from rx import Observable, AnonymousObservable
 from rx.subjects import Subject
 from rx.disposables import CompositeDisposable, RefCountDisposable, \
     SingleAssignmentDisposable
-from rx.internal.basic import default_comparer, identity
+from rx.internal.basic import identity
 from rx.linq.groupedobservable import GroupedObservable
-from rx.internal import ExtensionMethod
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
 
 @add_metaclass(ExtensionMethod)
 class ObservableGroupByUntil(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def group_by_until(self, key_selector, element_selector, duration_selector, 
-                       comparer=None):
+    def group_by_until(self, key_selector, element_selector, duration_selector,
+                       comparer=None, key_serializer=None, max_groups=None):
         """Groups the elements of an observable sequence according to a
         specified key selector function. A duration selector function is used
         to control the lifetime of groups. When a group expires, it receives
@@ -37,15 +37,33 @@ class ObservableGroupByUntil(Observable):
                 lambda x: x.id,
                 lambda x: x.name,
                 lambda:  Rx.Observable.never(),
-                lambda x: str(x))
+                key_serializer=lambda x: str(x))
+        4 - observable.group_by_until(
+                lambda x: x.device_id,
+                None,
+                lambda g: g.throttle(60000),
+                max_groups=10000)
 
         Keyword arguments:
         key_selector -- A function to extract the key for each element.
         duration_selector -- A function to signal the expiration of a group.
+            If None, groups only end when the source ends or they are evicted.
         comparer -- [Optional] {Function} Used to compare objects. When not
             specified, the default comparer is used. Note: this argument will be
             ignored in the Python implementation of Rx. Python objects knows,
             or should know how to compare themselves.
+        key_serializer -- [Optional] A function to map a key to the hashable
+            value the groups are looked up by, e.g. for keys that are not
+            hashable. Defaults to the key itself.
+        max_groups -- [Optional] Maximum number of open groups. When a new
+            group would exceed it, the group that has gone longest without
+            an element is completed and forgotten. A later element with its
+            key starts a new group.
+
+        The open groups are kept in a dict, so each element costs one hash
+        lookup. The returned observable has a stats dict with the number of
+        open groups and the totals of groups created, expired and evicted,
+        summed over all subscriptions.
 
         Returns a sequence of observable groups, each of which corresponds to
         a unique key value, containing all elements that share that same key
@@ -54,96 +72,108 @@ class ObservableGroupByUntil(Observable):
         encoutered.
         """
 
+        if max_groups is not None and max_groups <= 0:
+            raise ArgumentOutOfRangeException()
+
         source = self
         element_selector = element_selector or identity
-        comparer = comparer or default_comparer
+        key_serializer = key_serializer or identity
+        stats = {"groups": 0, "created": 0, "expired": 0, "evicted": 0}
 
         def subscribe(observer):
+            # Serialized key to (writer, duration disposable), least recently
+            # used first if there is a max_groups
             mapping = OrderedDict()
             group_disposable = CompositeDisposable()
             ref_count_disposable = RefCountDisposable(group_disposable)
 
-            def on_next(x):
-                writer = None
-                element = None
-                duration = None
-                key = None
+            def fail(e):
+                entries = list(six.itervalues(mapping))
+                stats["groups"] -= len(entries)
+                mapping.clear()
+                for w, _ in entries:
+                    w.on_error(e)
+
+                observer.on_error(e)
+
+            def close(serialized_key, entry):
+                del mapping[serialized_key]
+                stats["groups"] -= 1
+                entry[0].on_completed()
+                if entry[1] is not None:
+                    group_disposable.remove(entry[1])
 
+            def on_next(x):
                 try:
                     key = key_selector(x)
+                    serialized_key = key_serializer(key)
+                    entry = mapping.get(serialized_key)
                 except Exception as e:
-                    for w in six.itervalues(mapping):
-                        w.on_error(e)
-
-                    observer.on_error(e)
+                    fail(e)
                     return
-                
-                fire_new_map_entry = False
-                writer = mapping.get(key)
-                if not writer:
-                    writer = Subject()
-                    mapping[key] = writer
-                    fire_new_map_entry = True
-
-                if fire_new_map_entry:
-                    group = GroupedObservable(key, writer, ref_count_disposable)
-                    duration_group = GroupedObservable(key, writer)
-                    try:
-                        duration = duration_selector(duration_group)
-                    except Exception as e:
-                        for w in six.itervalues(mapping):
-                            w.on_error(e)
 
-                        observer.on_error(e)
-                        return
+                if entry is None:
+                    if max_groups and len(mapping) >= max_groups:
+                        stats["evicted"] += 1
+                        oldest = next(iter(mapping))
+                        close(oldest, mapping[oldest])
 
-                    observer.on_next(group)
-                    md = SingleAssignmentDisposable()
-                    group_disposable.add(md)
-
-                    def expire():
-                        if mapping[serialized_key]:
-                            del mapping[serialized_key]
-                            writer.on_completed()
-
-                        group_disposable.remove(md)
-
-                    def on_next(value):
-                        pass
-
-                    def on_error(exn):
-                        for wr in six.itervalues(mapping):
-                            wr.on_error(exn)
-                        observer.on_error(exn)
-
-                    def on_completed():
-                        expire()
+                    writer = Subject()
+                    md = SingleAssignmentDisposable() if duration_selector else None
+                    entry = mapping[serialized_key] = (writer, md)
+                    stats["groups"] += 1
+                    stats["created"] += 1
 
-                    md.disposable = duration.take(1).subscribe(on_next, on_error, on_completed)
+                    group = GroupedObservable(key, writer, ref_count_disposable)
+                    if md is None:
+                        observer.on_next(group)
+                    else:
+                        duration_group = GroupedObservable(key, writer)
+                        try:
+                            duration = duration_selector(duration_group)
+                        except Exception as e:
+                            fail(e)
+                            return
+
+                        observer.on_next(group)
+                        group_disposable.add(md)
+
+                        def expire(serialized_key=serialized_key, entry=entry):
+                            if mapping.get(serialized_key) is entry:
+                                stats["expired"] += 1
+                                close(serialized_key, entry)
+
+                        def on_next(value):
+                            pass
+
+                        md.disposable = duration.take(1).subscribe(on_next, fail, expire)
+                elif max_groups:
+                    del mapping[serialized_key]
+                    mapping[serialized_key] = entry
 
                 try:
                     element = element_selector(x)
                 except Exception as e:
-                    for w in six.itervalues(mapping):
-                        w.on_error(e)
-
-                    observer.on_error(e)
+                    fail(e)
                     return
 
-                writer.on_next(element)
+                entry[0].on_next(element)
 
             def on_error(ex):
-                for w in six.itervalues(mapping):
-                    w.on_error(ex)
-
-                observer.on_error(ex)
+                fail(ex)
 
             def on_completed():
-                for w in six.itervalues(mapping):
+                entries = list(six.itervalues(mapping))
+                stats["groups"] -= len(entries)
+                mapping.clear()
+                for w, _ in entries:
                     w.on_completed()
 
                 observer.on_completed()
 
             group_disposable.add(source.subscribe(on_next, on_error, on_completed))
             return ref_count_disposable
-        return AnonymousObservable(subscribe)
+
+        observable = AnonymousObservable(subscribe)
+        observable.stats = stats
+        return observable
@@ -1,5 +1,4 @@
 import logging
-from collections import OrderedDict
 
 from six import add_metaclass
 
@@ -9,7 +8,7 @@ from rx.internal import noop
 from rx.observeonobserver import ObserveOnObserver
 from rx.disposables import SingleAssignmentDisposable, SerialDisposable, CompositeDisposable, RefCountDisposable
 from rx.subjects import Subject
-from rx.internal import ExtensionMethod
+from rx.internal import ExtensionMethod, JoinIndex
 
 log = logging.getLogger("Rx")
 
@@ -17,7 +16,8 @@ log = logging.getLogger("Rx")
 class ObservableGroupJoin(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def group_join(self, right, left_duration_selector, right_duration_selector, result_selector):
+    def group_join(self, right, left_duration_selector, right_duration_selector,
+                   result_selector, left_key=None, right_key=None):
         """Correlates the elements of two sequences based on overlapping
         durations, and groups the results.
 
@@ -35,26 +35,39 @@ class ObservableGroupJoin(Observable):
             function is an element of the left sequence. The second parameter
             passed to the function is an observable sequence with elements from
             the right sequence that overlap with the left sequence's element.
+        left_key -- [Optional] A function to compute a hashable key for each
+            element of the left sequence. If given, each group only gets the
+            overlapping right elements with an equal key.
+        right_key -- [Optional] Key function for the right sequence. Defaults
+            to left_key, and left_key defaults to right_key.
 
         Returns an observable sequence that contains result elements computed
         from source elements that have an overlapping duration.
         """
         left = self
+        left_key = left_key or right_key
+        right_key = right_key or left_key
 
         def subscribe(observer):
             nothing = lambda _: None
             group = CompositeDisposable()
             r = RefCountDisposable(group)
-            left_map = OrderedDict()
-            right_map = OrderedDict()
+            left_map = JoinIndex()
+            right_map = JoinIndex()
             left_id = [0]
             right_id = [0]
 
             def on_next_left(value):
+                try:
+                    key = left_key(value) if left_key else None
+                except Exception as e:
+                    on_error_left(e)
+                    return
+
                 s = Subject()
                 _id = left_id[0]
                 left_id[0] += 1
-                left_map[_id] = s
+                left_map.add(key, _id, s)
 
                 try:
                     result = result_selector(value, add_ref(s, r))
@@ -68,15 +81,14 @@ class ObservableGroupJoin(Observable):
 
                 observer.on_next(result)
 
-                for right_value in right_map.values():
+                for right_value in right_map.get(key):
                     s.on_next(right_value)
 
                 md = SingleAssignmentDisposable()
                 group.add(md)
 
                 def expire():
-                    if _id in left_map:
-                        del left_map[_id]
+                    if left_map.remove(key, _id):
                         s.on_completed()
 
                     group.remove(md)
@@ -110,15 +122,21 @@ class ObservableGroupJoin(Observable):
             group.add(left.subscribe(on_next_left, on_error_left, observer.on_completed))
 
             def on_next_right(value):
+                try:
+                    key = right_key(value) if right_key else None
+                except Exception as e:
+                    on_error_right(e)
+                    return
+
                 _id = right_id[0]
                 right_id[0] += 1
-                right_map[_id] = value
+                right_map.add(key, _id, value)
 
                 md = SingleAssignmentDisposable()
                 group.add(md)
 
                 def expire():
-                    del right_map[_id]
+                    right_map.remove(key, _id)
                     group.remove(md)
 
                 try:
@@ -141,7 +159,7 @@ class ObservableGroupJoin(Observable):
                     on_error,
                     expire)
 
-                for left_value in left_map.values():
+                for left_value in left_map.get(key):
                     left_value.on_next(value)
 
             def on_error_right(e):
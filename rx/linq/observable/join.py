@@ -1,5 +1,4 @@
 import logging
-from collections import OrderedDict
 
 from six import add_metaclass
 
@@ -9,7 +8,7 @@ from rx.internal import noop
 from rx.observeonobserver import ObserveOnObserver
 from rx.disposables import SingleAssignmentDisposable, SerialDisposable, CompositeDisposable, RefCountDisposable
 from rx.subjects import Subject
-from rx.internal import ExtensionMethod
+from rx.internal import ExtensionMethod, JoinIndex
 
 log = logging.getLogger("Rx")
 
@@ -17,7 +16,8 @@ log = logging.getLogger("Rx")
 class ObservableJoin(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def join(self, right, left_duration_selector, right_duration_selector, result_selector):
+    def join(self, right, left_duration_selector, right_duration_selector,
+             result_selector, left_key=None, right_key=None):
         """Correlates the elements of two sequences based on overlapping 
         durations.
     
@@ -34,34 +34,47 @@ class ObservableJoin(Observable):
             sequences. The parameters passed to the function correspond with 
             the elements from the left and right source sequences for which 
             overlap occurs.
+        left_key -- [Optional] A function to compute a hashable key for each
+            element of the left sequence. If given, only overlapping elements
+            with equal keys are joined, and each element only visits the live
+            elements of the other side with its key.
+        right_key -- [Optional] Key function for the right sequence. Defaults
+            to left_key, and left_key defaults to right_key.
         
         Return an observable sequence that contains result elements computed 
         from source elements that have an overlapping duration.
         """   
 
         left = self
+        left_key = left_key or right_key
+        right_key = right_key or left_key
 
         def subscribe(observer):
             group = CompositeDisposable()
             left_done = [False]
-            left_map = OrderedDict()
+            left_map = JoinIndex()
             left_id = [0]
             right_done = [False]
-            right_map = OrderedDict()
+            right_map = JoinIndex()
             right_id = [0]
             
             def on_next_left(value):
                 duration = None
+                try:
+                    key = left_key(value) if left_key else None
+                except Exception as exception:
+                    observer.on_error(exception)
+                    return
+
                 current_id = left_id[0]
                 left_id[0] += 1
                 md = SingleAssignmentDisposable()
                 
-                left_map[current_id] = value
+                left_map.add(key, current_id, value)
                 group.add(md)
 
                 def expire():
-                    if current_id in left_map:
-                        del left_map[current_id]
+                    left_map.remove(key, current_id)
                     if not len(left_map) and left_done[0]:
                         observer.on_completed()
                 
@@ -76,7 +89,7 @@ class ObservableJoin(Observable):
                 
                 md.disposable = duration.take(1).subscribe(noop, observer.on_error, lambda: expire())
                 
-                for val in right_map.values():
+                for val in right_map.get(key):
                     try:
                         result = result_selector(value, val)
                     except Exception as exception:
@@ -95,15 +108,20 @@ class ObservableJoin(Observable):
 
             def on_next_right(value):
                 duration = None
+                try:
+                    key = right_key(value) if right_key else None
+                except Exception as exception:
+                    observer.on_error(exception)
+                    return
+
                 current_id = right_id[0]
                 right_id[0] += 1
                 md = SingleAssignmentDisposable()
-                right_map[current_id] = value
+                right_map.add(key, current_id, value)
                 group.add(md)
 
                 def expire():
-                    if current_id in right_map:
-                        del right_map[current_id]
+                    right_map.remove(key, current_id)
                     if not len(right_map) and right_done[0]:
                         observer.on_completed()
                         
@@ -118,7 +136,7 @@ class ObservableJoin(Observable):
                 
                 md.disposable = duration.take(1).subscribe(noop, observer.on_error, lambda: expire())
                 
-                for val in left_map.values():
+                for val in left_map.get(key):
                     try:
                         result = result_selector(val, value)
                     except Exception as exception:
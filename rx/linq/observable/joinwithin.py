@@ -0,0 +1,131 @@
+from collections import deque
+from datetime import timedelta
+
+from six import add_metaclass
+
+from rx.observable import Observable
+from rx.anonymousobservable import AnonymousObservable
+from rx.concurrency import timeout_scheduler
+from rx.disposables import CompositeDisposable, SingleAssignmentDisposable
+from rx.internal import ExtensionMethod, JoinIndex
+
+@add_metaclass(ExtensionMethod)
+class ObservableJoinWithin(Observable):
+    """Uses a meta class to extend Observable with the methods in this class"""
+
+    def join_within(self, right, window, result_selector, left_key=None,
+                    right_key=None, scheduler=None):
+        """Correlates the elements of two sequences that arrive less than
+        window apart. This is join where every element has the same
+        duration, e.g.
+
+        left.join(right,
+                  lambda x: Observable.timer(window, scheduler=scheduler),
+                  lambda x: Observable.timer(window, scheduler=scheduler),
+                  result_selector)
+
+        but without a timer per element. Elements expire in the order they
+        arrive, so they are kept in a queue per side and expired elements
+        are dropped from its front before each arrival is matched.
+
+        1 - res = left.join_within(right, 1000, lambda l, r: (l, r))
+        2 - res = left.join_within(right, timedelta(seconds=5),
+                                   lambda l, r: (l, r),
+                                   left_key=lambda x: x.id)
+
+        Keyword arguments:
+        right -- The right observable sequence to join elements for.
+        window -- Time in milliseconds, or a timedelta, that each element
+            stays live for.
+        result_selector -- A function invoked to compute a result element for
+            any two live elements of the left and right observable sequences.
+        left_key -- [Optional] A function to compute a hashable key for each
+            element of the left sequence. If given, only elements with equal
+            keys are joined.
+        right_key -- [Optional] Key function for the right sequence. Defaults
+            to left_key, and left_key defaults to right_key.
+        scheduler -- [Optional] Scheduler to read the time from and to run
+            the completion timer on. Defaults to rx.Scheduler.timeout.
+
+        Returns an observable sequence that contains result elements computed
+        from source elements that arrived within window of each other.
+        """
+
+        left = self
+        left_key = left_key or right_key
+        right_key = right_key or left_key
+        scheduler = scheduler or timeout_scheduler
+        if not isinstance(window, timedelta):
+            window = timedelta(milliseconds=window)
+
+        def subscribe(observer):
+            group = CompositeDisposable()
+            done = [False, False]
+            maps = (JoinIndex(), JoinIndex())
+            # (due, key, id) of the live elements of each side, in the order
+            # they expire
+            queues = (deque(), deque())
+            ids = [0, 0]
+
+            def expire(now):
+                for index, queue in zip(maps, queues):
+                    while queue and queue[0][0] < now:
+                        _, key, _id = queue.popleft()
+                        index.remove(key, _id)
+
+            def on_next(side, key_selector, value):
+                try:
+                    key = key_selector(value) if key_selector else None
+                except Exception as exception:
+                    observer.on_error(exception)
+                    return
+
+                now = scheduler.now()
+                expire(now)
+
+                _id = ids[side]
+                ids[side] += 1
+                maps[side].add(key, _id, value)
+                queues[side].append((now + window, key, _id))
+
+                for other in maps[1 - side].get(key):
+                    try:
+                        if side:
+                            result = result_selector(other, value)
+                        else:
+                            result = result_selector(value, other)
+                    except Exception as exception:
+                        observer.on_error(exception)
+                        return
+
+                    observer.on_next(result)
+
+            def on_completed(side):
+                done[side] = True
+                now = scheduler.now()
+                expire(now)
+
+                # Nothing can be joined once the last live element of this
+                # side has expired
+                queue = queues[side]
+                if done[1 - side] or not queue or queue[-1][0] <= now:
+                    observer.on_completed()
+                    return
+
+                def action(scheduler, state):
+                    observer.on_completed()
+
+                md = SingleAssignmentDisposable()
+                group.add(md)
+                md.disposable = scheduler.schedule_relative(queue[-1][0] - now, action)
+
+            group.add(left.subscribe(
+                lambda value: on_next(0, left_key, value),
+                observer.on_error,
+                lambda: on_completed(0)))
+            group.add(right.subscribe(
+                lambda value: on_next(1, right_key, value),
+                observer.on_error,
+                lambda: on_completed(1)))
+            return group
+        return AnonymousObservable(subscribe)
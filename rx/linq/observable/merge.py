@@ -1,10 +1,13 @@
+import threading
+from collections import deque
+
 from six import add_metaclass
 
 from rx.observable import Observable
 from rx.anonymousobservable import AnonymousObservable
 from rx.disposables import CompositeDisposable, SingleAssignmentDisposable
-from rx.concurrency import immediate_scheduler
-from rx.internal import ExtensionMethod
+from rx.concurrency import immediate_scheduler, Scheduler
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
 
 @add_metaclass(ExtensionMethod)
 class ObservableMerge(Observable):
@@ -20,6 +23,9 @@ class ObservableMerge(Observable):
         1 - merged = sources.merge(1)
         2 - merged = source.merge(otherSource)
 
+        Inner sequences arriving while max_concurrent of them are active
+        are queued, and subscribed to in order as active ones complete.
+
         max_concurrent_or_other [Optional] Maximum number of inner observable
             sequences being subscribed to concurrently or the second
             observable sequence.
@@ -27,8 +33,12 @@ class ObservableMerge(Observable):
         Returns the observable sequence that merges the elements of the inner
         sequences.
         """
-        if isinstance(max_concurrent_or_other, int):
-            return Observable.merge(max_concurrent_or_other)
+        if not isinstance(max_concurrent_or_other, int):
+            return Observable.merge(self, max_concurrent_or_other)
+
+        max_concurrent = max_concurrent_or_other
+        if max_concurrent < 1:
+            raise ArgumentOutOfRangeException()
 
         sources = self
 
@@ -36,37 +46,59 @@ class ObservableMerge(Observable):
             active_count = [0]
             group = CompositeDisposable()
             is_stopped = [False]
-            q = []
+            is_draining = [False]
+            queue = deque()
+            gate = threading.RLock()
+
+            def on_next(x):
+                with gate:
+                    observer.on_next(x)
+
+            def on_error(ex):
+                with gate:
+                    observer.on_error(ex)
 
             def subscribe(xs):
                 subscription = SingleAssignmentDisposable()
                 group.add(subscription)
 
                 def on_completed():
-                    group.remove(subscription)
-                    if q.length > 0:
-                        s = q.shift()
-                        subscribe(s)
-                    else:
+                    with gate:
+                        group.remove(subscription)
                         active_count[0] -= 1
-                        if is_stopped[0] and active_count[0] == 0:
-                            observer.on_completed()
-
-                subscription.disposable = xs.subscribe(observer.on_next, observer.on_error, on_completed)
+                        drain()
+
+                xs = Observable.from_future(xs)
+                subscription.disposable = xs.subscribe(on_next, on_error, on_completed)
+
+            def drain():
+                # Inner sequences that complete while being subscribed to
+                # return here instead of recursing into the next one
+                if is_draining[0]:
+                    return
+
+                is_draining[0] = True
+                try:
+                    while queue and active_count[0] < max_concurrent and not group.is_disposed:
+                        active_count[0] += 1
+                        subscribe(queue.popleft())
+                finally:
+                    is_draining[0] = False
+
+                if is_stopped[0] and not active_count[0]:
+                    observer.on_completed()
 
-            def on_next(inner_source):
-                if active_count[0] < max_concurrent_or_other:
-                    active_count[0] += 1
-                    subscribe(inner_source)
-                else:
-                    q.append(inner_source)
+            def on_next_source(inner_source):
+                with gate:
+                    queue.append(inner_source)
+                    drain()
 
             def on_completed():
-                is_stopped[0] = True
-                if active_count[0] == 0:
-                    observer.on_completed()
+                with gate:
+                    is_stopped[0] = True
+                    drain()
 
-            group.add(sources.subscribe(on_next, observer.on_error, on_completed))
+            group.add(sources.subscribe(on_next_source, on_error, on_completed))
             return group
         return AnonymousObservable(subscribe)
 
@@ -84,62 +116,21 @@ class ObservableMerge(Observable):
         Returns the observable sequence that merges the elements of the observable sequences.
         """
 
-        if not args[0]:
+        if args[0] is None:
             scheduler = immediate_scheduler
             sources = args[1:]
-        elif args[0].now:
+        elif isinstance(args[0], Scheduler):
             scheduler = args[0]
             sources = args[1:]
         else:
             scheduler = immediate_scheduler
-            sources = args[0]
+            sources = args
 
         if isinstance(sources[0], list):
             sources = sources[0]
 
         return Observable.from_array(sources, scheduler).merge_observable()
 
-    def merge_all(self):
-        """Merges an observable sequence of observable sequences into an
-        observable sequence.
-
-        Returns the observable sequence that merges the elements of the inner
-        sequences.
-        """
-        sources = self
-
-        def subscribe(observer):
-            group = CompositeDisposable()
-            is_stopped = False
-            m = SingleAssignmentDisposable()
-            group.add(m)
-
-            def on_next(inner_source):
-                inner_subscription = SingleAssignmentDisposable()
-                group.add(inner_subscription)
-
-                inner_source = Observable.from_future(inner_source)
-
-                def on_next(x):
-                    observer.on_next(x)
-
-                def on_completed():
-                    group.remove(inner_subscription)
-                    if is_stopped and group.length == 1:
-                        observer.on_completed()
-
-                inner_subscription.disposable = inner_source.subscribe(on_next, observer.on_error, on_completed)
-
-            def on_completed():
-                is_stopped = True
-                if len(group) == 1:
-                    observer.on_completed()
-
-            m.disposable = sources.subscribe(on_next, observer.on_error, on_completed)
-            return group
-
-        return AnonymousObservable(subscribe)
-
     def merge_observable(self):
         """Merges an observable sequence of observable sequences into an
         observable sequence.
@@ -182,3 +173,5 @@ class ObservableMerge(Observable):
             return group
 
         return AnonymousObservable(subscribe)
+
+    merge_all = merge_observable
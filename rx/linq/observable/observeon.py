@@ -8,12 +8,15 @@ from rx.observeonobserver import ObserveOnObserver
 class ObservableObserveOn(Observable):
     """Uses a meta class to extend Observable with the methods in this class"""
 
-    def observe_on(self, scheduler):
+    def observe_on(self, scheduler, batch_size=None):
         """Wraps the source sequence in order to run its observer callbacks on 
         the specified scheduler.
         
         Keyword arguments:
         scheduler -- Scheduler to notify observers on.</param>
+        batch_size -- [Optional] Maximum number of notifications delivered
+            per scheduler turn. By default all notifications pending at the
+            start of a turn are delivered in that turn.
         
         Returns the source sequence whose observations happen on the specified 
         scheduler.
@@ -25,7 +28,7 @@ class ObservableObserveOn(Observable):
         source = self
 
         def subscribe(observer):
-            return source.subscribe(ObserveOnObserver(scheduler, observer))
+            return source.subscribe(ObserveOnObserver(scheduler, observer, batch_size))
      
         return AnonymousObservable(subscribe)
 
@@ -1,6 +1,7 @@
 from six import add_metaclass
 
-from rx import Observable, AnonymousObservable
+from rx import Observable
+from rx.linq.fusedobservable import FusedObservable
 from rx.internal.utils import adapt_call
 from rx.internal import ExtensionMethod
 
@@ -26,20 +27,18 @@ class ObservableSelect(Observable):
 
         selector = adapt_call(selector)
 
-        def subscribe(observer):
+        def stage(sink, on_next):
             count = [0]
 
-            def on_next(value):
-                result = None
+            def next(value):
                 try:
                     result = selector(value, count[0])
                 except Exception as err:
-                    observer.on_error(err)
+                    sink.on_error(err)
                 else:
                     count[0] += 1
-                    observer.on_next(result)
-
-            return self.subscribe(on_next, observer.on_error, observer.on_completed)
-        return AnonymousObservable(subscribe)
+                    on_next(result)
+            return next
+        return FusedObservable.fuse(self, stage)
 
     map = select
\ No newline at end of file
@@ -0,0 +1,147 @@
+import threading
+from collections import deque
+from multiprocessing import cpu_count
+
+from six import add_metaclass
+
+from rx import Observable, AnonymousObservable
+from rx.disposables import Disposable, CompositeDisposable
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
+
+ProcessPoolExecutor = None
+
+def map_chunk(selector, chunk):
+    """Runs in the worker process. Module level so it can be pickled."""
+
+    return [selector(value) for value in chunk]
+
+@add_metaclass(ExtensionMethod)
+class ObservableSelectParallel(Observable):
+    """Uses a meta class to extend Observable with the methods in this class"""
+
+    def select_parallel(self, selector, max_workers=None, ordered=True, chunk_size=1):
+        """Projects each element of an observable sequence into a new form
+        using a pool of worker processes. Use this for CPU-bound projections
+        that do not release the GIL.
+
+        Elements are sent to the workers in chunks of chunk_size. A partial
+        chunk is sent when the source completes. The pool is created on
+        subscription and shut down when the sequence terminates or the
+        subscription is disposed.
+
+        1 - source.select_parallel(parse)
+        2 - source.select_parallel(parse, max_workers=4, chunk_size=100)
+        3 - source.select_parallel(parse, ordered=False)
+
+        Keyword arguments:
+        selector -- A transform function to apply to each source element. It
+            is sent to the worker processes, so it must be picklable, e.g. a
+            module level function.
+        max_workers -- [Optional] Number of worker processes. Defaults to the
+            number of processors.
+        ordered -- [Optional] If True (the default) the results are returned
+            in source order, else in the order the chunks finish.
+        chunk_size -- [Optional] Number of elements sent to a worker at a
+            time.
+
+        Returns an observable sequence whose elements are the result of
+        invoking the transform function on each element of source.
+        """
+
+        if chunk_size < 1:
+            raise ArgumentOutOfRangeException()
+
+        # Lazy import concurrent.futures
+        global ProcessPoolExecutor
+        from concurrent.futures import ProcessPoolExecutor
+
+        source = self
+        max_workers = max_workers or cpu_count()
+
+        def subscribe(observer):
+            executor = ProcessPoolExecutor(max_workers)
+            lock = threading.RLock()
+            pending = deque()
+            chunk = []
+            state = {"is_stopped": False, "is_completed": False}
+
+            def shutdown():
+                state["is_stopped"] = True
+                for future in pending:
+                    future.cancel()
+                pending.clear()
+                executor.shutdown(wait=False)
+
+            def emit(future):
+                if future.cancelled():
+                    return False
+
+                error = future.exception()
+                if error is not None:
+                    shutdown()
+                    observer.on_error(error)
+                    return False
+
+                for result in future.result():
+                    observer.on_next(result)
+                return True
+
+            def on_done(future):
+                with lock:
+                    if state["is_stopped"]:
+                        return
+
+                    if ordered:
+                        while pending and pending[0].done():
+                            if not emit(pending.popleft()):
+                                return
+                    else:
+                        pending.remove(future)
+                        if not emit(future):
+                            return
+
+                    if state["is_completed"] and not pending:
+                        shutdown()
+                        observer.on_completed()
+
+            def submit():
+                future = executor.submit(map_chunk, selector, chunk[:])
+                del chunk[:]
+                pending.append(future)
+                future.add_done_callback(on_done)
+
+            def on_next(value):
+                with lock:
+                    if state["is_stopped"]:
+                        return
+
+                    chunk.append(value)
+                    if len(chunk) >= chunk_size:
+                        submit()
+
+            def on_error(error):
+                with lock:
+                    if not state["is_stopped"]:
+                        shutdown()
+                        observer.on_error(error)
+
+            def on_completed():
+                with lock:
+                    if state["is_stopped"]:
+                        return
+
+                    state["is_completed"] = True
+                    if chunk:
+                        submit()
+                    elif not pending:
+                        shutdown()
+                        observer.on_completed()
+
+            def dispose():
+                with lock:
+                    if not state["is_stopped"]:
+                        shutdown()
+
+            subscription = source.subscribe(on_next, on_error, on_completed)
+            return CompositeDisposable(subscription, Disposable(dispose))
+        return AnonymousObservable(subscribe)
@@ -1,6 +1,7 @@
 from six import add_metaclass
 
-from rx import Observable, AnonymousObservable
+from rx import Observable
+from rx.linq.fusedobservable import FusedObservable
 from rx.internal.basic import default_key_serializer, identity
 from rx.internal import ArgumentOutOfRangeException
 from rx.internal import ExtensionMethod
@@ -24,16 +25,13 @@ class ObservableSkip(Observable):
         if count < 0:
             raise ArgumentOutOfRangeException()
         
-        observable = self
-
-        def subscribe(observer):
+        def stage(sink, on_next):
             remaining = [count]
 
-            def on_next(value):
+            def next(value):
                 if remaining[0] <= 0:
-                    observer.on_next(value)
+                    on_next(value)
                 else:
                     remaining[0] -= 1
-                
-            return observable.subscribe(on_next, observer.on_error, observer.on_completed)
-        return AnonymousObservable(subscribe)
+            return next
+        return FusedObservable.fuse(self, stage)
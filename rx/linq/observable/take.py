@@ -1,6 +1,7 @@
 from six import add_metaclass
 
-from rx import Observable, AnonymousObservable
+from rx import Observable
+from rx.linq.fusedobservable import FusedObservable
 from rx.internal import ArgumentOutOfRangeException
 from rx.internal import ExtensionMethod
 
@@ -31,16 +32,14 @@ class ObservableTake(Observable):
         if not count:
             return Observable.Empty(scheduler)
         
-        observable = self
-        def subscribe(observer):
+        def stage(sink, on_next):
             remaining = [count]
 
-            def on_next(value):
+            def next(value):
                 if remaining[0] > 0:
                     remaining[0] -= 1
-                    observer.on_next(value)
+                    on_next(value)
                     if not remaining[0]:
-                        observer.on_completed()
-                    
-            return observable.subscribe(on_next, observer.on_error, observer.on_completed)
-        return AnonymousObservable(subscribe)
+                        sink.on_completed()
+            return next
+        return FusedObservable.fuse(self, stage)
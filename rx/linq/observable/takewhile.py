@@ -1,6 +1,7 @@
 from six import add_metaclass
 
-from rx import Observable, AnonymousObservable
+from rx import Observable
+from rx.linq.fusedobservable import FusedObservable
 from rx.internal import ArgumentOutOfRangeException
 from rx.internal.utils import adapt_call
 from rx.internal import ExtensionMethod
@@ -27,25 +28,23 @@ class ObservableTakeWhile(Observable):
         longer passes.        
         """
         predicate = adapt_call(predicate)
-        observable = self
-        def subscribe(observer):
-            running, i = [True], [0]
 
-            def on_next(value):
-                if running[0]:
-                    try:
-                        running[0] = predicate(value, i[0])
-                    except Exception as exn:
-                        observer.on_error(exn)
-                        return
-                    else:
-                        i[0] += 1
-                    
-                    if running[0]:
-                        observer.on_next(value)
-                    else:
-                        observer.on_completed()
-    
-            return observable.subscribe(on_next, observer.on_error, observer.on_completed)
-        return AnonymousObservable(subscribe)
+        def stage(sink, on_next):
+            i = [0]
+
+            def next(value):
+                try:
+                    running = predicate(value, i[0])
+                except Exception as exn:
+                    sink.on_error(exn)
+                    return
+                else:
+                    i[0] += 1
+
+                if running:
+                    on_next(value)
+                else:
+                    sink.on_completed()
+            return next
+        return FusedObservable.fuse(self, stage)
         
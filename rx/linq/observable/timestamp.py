@@ -8,6 +8,8 @@ from rx.internal import ExtensionMethod
 log = logging.getLogger("Rx")
 
 class Timestamp(object):
+    __slots__ = ("value", "timestamp")
+
     def __init__(self, value, timestamp):
         self.value = value
         self.timestamp = timestamp
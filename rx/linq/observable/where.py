@@ -1,6 +1,7 @@
 from six import add_metaclass
 
-from rx import Observable, AnonymousObservable
+from rx import Observable
+from rx.linq.fusedobservable import FusedObservable
 from rx.internal.utils import adapt_call
 from rx.internal import ExtensionMethod
 
@@ -24,25 +25,22 @@ class ObservableWhere(Observable):
         sequence that satisfy the condition.
         """
         predicate = adapt_call(predicate)
-        parent = self
 
-        def subscribe(observer):
+        def stage(sink, on_next):
             count = [0]
 
-            def on_next(value):
-                should_run = False
+            def next(value):
                 try:
                     should_run = predicate(value, count[0])
                 except Exception as ex:
-                    observer.on_error(ex)
+                    sink.on_error(ex)
                     return
                 else:
                     count[0] += 1
 
                 if should_run:
-                    observer.on_next(value)
-
-            return parent.subscribe(on_next, observer.on_error, observer.on_completed)
-        return AnonymousObservable(subscribe)
+                    on_next(value)
+            return next
+        return FusedObservable.fuse(self, stage)
 
     filter = where
\ No newline at end of file
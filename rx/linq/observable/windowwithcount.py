@@ -1,13 +1,13 @@
 import logging
+from collections import deque
 
 from six import add_metaclass
 
 from rx import AnonymousObservable, Observable
 from rx.internal.utils import add_ref
-from rx.internal import ExtensionMethod
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException
 from rx.disposables import SingleAssignmentDisposable, CompositeDisposable, RefCountDisposable
 from rx.subjects import Subject
-from rx.internal import ExtensionMethod
 
 log = logging.getLogger("Rx")
 
@@ -42,7 +42,7 @@ class ObservableWindowWithCount(Observable):
             m = SingleAssignmentDisposable()
             refCountDisposable = RefCountDisposable(m)
             n = [0]
-            q = []
+            q = deque()
                 
             def create_window():
                 s = Subject()
@@ -57,7 +57,7 @@ class ObservableWindowWithCount(Observable):
                 
                 c = n[0] - count + 1
                 if c >= 0 and c % skip == 0:
-                    s = q.pop(0);
+                    s = q.popleft()
                     s.on_completed()
                 
                 n[0] += 1
@@ -65,13 +65,13 @@ class ObservableWindowWithCount(Observable):
                     create_window()
                 
             def on_error(exception):
-                while len(q):
-                    q.pop(0).on_error(exception)
+                while q:
+                    q.popleft().on_error(exception)
                 observer.on_error(exception)
             
             def on_completed():
-                while len(q):
-                    q.pop(0).on_completed()
+                while q:
+                    q.popleft().on_completed()
                 observer.on_completed()
 
             m.disposable = source.subscribe(on_next, on_error, on_completed)
@@ -1,3 +1,5 @@
+from collections import deque
+
 from six import add_metaclass
 
 from rx.internal import noop
@@ -6,7 +8,8 @@ from rx.anonymousobservable import AnonymousObservable
 from rx.disposables import Disposable, CompositeDisposable, SingleAssignmentDisposable, SerialDisposable
 from rx.concurrency import immediate_scheduler
 from rx.internal.enumerable import Enumerable
-from rx.internal import ExtensionMethod
+from rx.internal import ExtensionMethod, ArgumentOutOfRangeException, \
+    BufferOverflowException
 
 @add_metaclass(ExtensionMethod)
 class ObservableZip(Observable):
@@ -15,7 +18,7 @@ class ObservableZip(Observable):
     def __init__(self, subscribe):
         self.zip = self.__zip # Stitch in instance method
 
-    def __zip(self, *args):
+    def __zip(self, *args, **kwargs):
         """Merges the specified observable sequences into one observable
         sequence by using the selector function whenever all of the observable
         sequences or an array have produced an element at a corresponding index.
@@ -25,6 +28,15 @@ class ObservableZip(Observable):
 
         1 - res = obs1.zip(obs2, fn)
         2 - res = x1.zip([1,2,3], fn)
+        3 - res = obs1.zip(obs2, fn, max_buffer=1000, overflow="drop_oldest")
+
+        Keyword arguments:
+        max_buffer -- [Optional] Maximum number of elements queued per source
+            while waiting for the other sources. Unbounded by default.
+        overflow -- [Optional] What to do with an element arriving at a full
+            queue: "error" (the default) fails the sequence with a
+            BufferOverflowException, "drop_newest" drops the element and
+            "drop_oldest" drops the oldest queued element of that source.
 
         Returns an observable sequence containing the result of combining
         elements of the sources using the specified result selector function.
@@ -34,42 +46,79 @@ class ObservableZip(Observable):
         sources = list(args)
         result_selector = sources.pop()
         sources.insert(0, parent)
+        max_buffer = kwargs.pop("max_buffer", None)
+        overflow = kwargs.pop("overflow", "error")
+        if kwargs:
+            raise TypeError("zip() got an unexpected keyword argument '%s'" % next(iter(kwargs)))
 
         if args and isinstance(args[0], list):
             return self.zip_array(*args)
 
+        if overflow not in ("error", "drop_newest", "drop_oldest"):
+            raise ValueError("Unknown overflow policy: %s" % overflow)
+        if max_buffer is not None and max_buffer < 1:
+            raise ArgumentOutOfRangeException()
+
         def subscribe(observer):
             n = len(sources)
-            queues = [[] for _ in range(n)]
+            queues = [deque() for _ in range(n)]
             is_done = [False] * n
 
+            # Number of non-empty queues and of completed sources, so an
+            # element that does not complete a row costs O(1)
+            ready, done_count = [0], [0]
+
             def next(i):
-                if all([len(q) for q in queues]):
+                if ready[0] == n:
+                    queued_values = []
+                    for queue in queues:
+                        queued_values.append(queue.popleft())
+                        if not queue:
+                            ready[0] -= 1
+
                     try:
-                        queued_values = [x.pop(0) for x in queues]
                         res = result_selector(*queued_values)
                     except Exception as ex:
                         observer.on_error(ex)
                         return
 
                     observer.on_next(res)
-                elif all([x for j, x in enumerate(is_done) if j != i]):
+                elif done_count[0] - is_done[i] == n - 1:
                     observer.on_completed()
 
             def done(i):
-                is_done[i] = True
-                if all(is_done):
+                if not is_done[i]:
+                    is_done[i] = True
+                    done_count[0] += 1
+                if done_count[0] == n:
                     observer.on_completed()
 
             subscriptions = [None]*n
 
             def func(i):
                 source = sources[i]
+                queue = queues[i]
                 sad = SingleAssignmentDisposable()
                 source = Observable.from_future(source)
-          
+
                 def on_next(x):
-                    queues[i].append(x)
+                    if max_buffer and len(queue) >= max_buffer:
+                        if overflow == "drop_newest":
+                            return
+                        elif overflow == "drop_oldest":
+                            # The queue stays non-empty, so it is already
+                            # counted as ready
+                            queue.popleft()
+                            queue.append(x)
+                            next(i)
+                            return
+                        else:
+                            observer.on_error(BufferOverflowException())
+                            return
+
+                    if not queue:
+                        ready[0] += 1
+                    queue.append(x)
                     next(i)
 
                 sad.disposable = source.subscribe(on_next, observer.on_error, lambda: done(i))
@@ -80,7 +129,7 @@ class ObservableZip(Observable):
         return AnonymousObservable(subscribe)
 
     @classmethod
-    def zip(cls, *args):
+    def zip(cls, *args, **kwargs):
         """Merges the specified observable sequences into one observable 
         sequence by using the selector function whenever all of the observable 
         sequences have produced an element at a corresponding index.
@@ -90,10 +139,12 @@ class ObservableZip(Observable):
 
         Arguments:
         args -- Observable sources.
+        max_buffer -- [Optional] Maximum number of elements queued per source.
+            See Observable.zip for this and overflow.
      
         Returns an observable {Observable} sequence containing the result of 
         combining elements of the sources using the specified result selector 
         function."""
         
-        first = args.pop(0);
-        return first.zip(*args)
+        first = args[0]
+        return first.zip(*args[1:], **kwargs)
@@ -46,50 +46,10 @@ class ObservableZipArray(Observable):
         Returns an observable {Observable} sequence containing lists of elements
         at corresponding indexes."""
 
-        sources = args
+        first, sources = args[0], list(args[1:])
 
-        sources = list(args)
-        result_selector = sources.pop()
-        sources.insert(0, parent)
+        def result_selector(*values):
+            return list(values)
 
-        def subscribe(observer):
-            n = len(sources)
-            queues = [[] for _ in range(n)]
-            is_done = [False] * n
-
-            def next(i):
-                if all([len(q) for q in queues]):
-                    res = [x.pop(0) for x in queues]
-                    observer.on_next(res)
-                elif all([x for j, x in enumerate(is_done) if j != i]):
-                    observer.on_completed()
-                    return
-
-            def done(i):
-                is_done[i] = True
-                if all(is_done):
-                    observer.on_completed()
-                    return
-
-            subscriptions = [None]*n
-
-            def func(i):
-                subscriptions[i] = SingleAssignmentDisposable()
-
-                def on_next(x):
-                    queues[i].append(x)
-                    next(i)
-
-                subscriptions[i].disposable = sources[i].subscribe(on_next, observer.on_error, lambda: done(i))
-            for idx in range(n):
-                func(idx)
-
-            composite_disposable = CompositeDisposable(subscriptions)
-
-            def action():
-                queues = [[] for _ in queues]
-
-            composite_disposable.add(Disposable.create(action))
-
-            return composite_disposable
-        return AnonymousObservable(subscribe)
+        sources.append(result_selector)
+        return first.zip(*sources)
@@ -7,11 +7,14 @@ from .anonymousobservable import AnonymousObservable
 
 # Notifications
 class Notification(object):
-    """Represents a notification to an observer."""
+    """Represents a notification to an observer.
 
-    def __init__(self):
-        """Default constructor used by derived types."""
-        self.has_value = False
+    Notifications are allocated per element by e.g. materialize and the
+    scheduled observers, so they use __slots__ and keep kind and has_value
+    on the class."""
+
+    __slots__ = ()
+    has_value = False
     
     def accept(self, on_next, on_error=None, on_completed=None):
         """Invokes the delegate corresponding to the notification or an 
@@ -84,14 +87,15 @@ class Notification(object):
     
 class OnNext(Notification):
     """Represents an OnNext notification to an observer."""
-    
+
+    __slots__ = ("value",)
+    has_value = True
+    kind = 'N'
+
     def __init__(self, value):
         """Constructs a notification of a new value."""
-        
-        super(OnNext, self).__init__()
+
         self.value = value
-        self.has_value = True
-        self.kind = 'N'
 
     def _accept(self, on_next, on_error=None, on_completed=None):
         return on_next(self.value)
@@ -100,17 +104,18 @@ class OnNext(Notification):
         return observer.on_next(self.value)
     
     def __str__(self):
-        return "OnNext(%s)" % self.value
+        return "OnNext(%s)" % (self.value,)
     
 class OnError(Notification):
     """Represents an OnError notification to an observer."""
 
+    __slots__ = ("exception",)
+    kind = 'E'
+
     def __init__(self, exception):
         """Constructs a notification of an exception."""
 
-        super(OnError, self).__init__()
         self.exception = exception
-        self.kind = 'E'
 
     def _accept(self, on_next, on_error, on_completed):
         return on_error(self.exception)
@@ -119,16 +124,21 @@ class OnError(Notification):
         return observer.on_error(self.exception)
     
     def __str__(self):
-        return "OnError(%s)" % self.exception
+        return "OnError(%s)" % (self.exception,)
 
 class OnCompleted(Notification):
-    """Represents an OnCompleted notification to an observer."""
-
-    def __init__(self):
-        """Constructs a notification of the end of a sequence."""
-        
-        super(OnCompleted, self).__init__()
-        self.kind = 'C'
+    """Represents an OnCompleted notification to an observer. It carries no
+    data, so all OnCompleted() calls return the same instance."""
+
+    __slots__ = ()
+    kind = 'C'
+
+    def __new__(cls):
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super(OnCompleted, cls).__new__(cls)
+            cls._instance = instance
+        return instance
 
     def _accept(self, on_next, on_error, on_completed):
         return on_completed()
@@ -1,8 +1,8 @@
 from rx.scheduledobserver import ScheduledObserver
 
 class ObserveOnObserver(ScheduledObserver):
-    def __init__(self, scheduler, observer):
-        super(ObserveOnObserver, self).__init__(scheduler, observer)
+    def __init__(self, scheduler, observer, batch_size=None):
+        super(ObserveOnObserver, self).__init__(scheduler, observer, batch_size)
 
     def next(self, value):
         super(ObserveOnObserver, self).next(value);
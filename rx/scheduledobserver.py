@@ -1,56 +1,77 @@
+import threading
+from collections import deque
+
 from rx.abstractobserver import AbstractObserver
 from rx.disposables import SerialDisposable
+from rx.notification import OnNext, OnError, OnCompleted
 
 class ScheduledObserver(AbstractObserver):
-    def __init__(self, scheduler, observer):
+    def __init__(self, scheduler, observer, batch_size=1):
+        """Creates an observer that queues notifications and forwards them
+        to the given observer on the scheduler.
+
+        Keyword arguments:
+        scheduler -- Scheduler to forward the notifications on.
+        observer -- Observer to forward the notifications to.
+        batch_size -- [Optional] Maximum number of notifications forwarded
+            per scheduler turn. None forwards all notifications that are
+            pending when the turn starts. Defaults to 1.
+        """
         super(ScheduledObserver, self).__init__()
         self.scheduler = scheduler
         self.observer = observer
+        self.batch_size = batch_size
         self.is_acquired = False
         self.has_faulted = False
-        self.queue = []
+        self.queue = deque()
+        self.lock = threading.Lock()
         self.disposable = SerialDisposable()
 
     def next(self, value):
-        def func():
-            self.observer.on_next(value)
-        self.queue.append(func)
-    
+        self.queue.append(OnNext(value))
+
     def error(self, exception):
-        def func():
-            self.observer.on_error(exception)    
-        self.queue.append(func)
-                
+        self.queue.append(OnError(exception))
+
     def completed(self):
-        def func():
-            self.observer.on_completed()        
-        self.queue.append(func)
-            
+        self.queue.append(OnCompleted())
+
     def ensure_active(self):
-        is_owner, parent = False, self
-        if not self.has_faulted and len(self.queue):
-            is_owner = not self.is_acquired
+        if self.has_faulted or not self.queue:
+            return
+
+        with self.lock:
+            if self.is_acquired:
+                return
             self.is_acquired = True
-        
-        if is_owner:
-            def action(action1, state):
-                work = None
-                if len(parent.queue):
-                    work = parent.queue.pop(0)
-                else:
-                    parent.is_acquired = False
-                    return
-                
-                try:
-                    work()
-                except Exception as ex:
-                    parent.queue = []
-                    parent.has_faulted = True
-                    raise ex
-        
-                action1()
-            self.disposable.disposable = self.scheduler.schedule_recursive(action)
-    
+
+        # The recursive scheduler keeps the disposable of every turn, so a
+        # turn rescheduled from another thread is never cancelled by the
+        # assignment below
+        self.disposable.disposable = self.scheduler.schedule_recursive(self.run)
+
+    def run(self, action, state):
+        queue, observer = self.queue, self.observer
+        count = len(queue) if self.batch_size is None else self.batch_size
+
+        while count > 0 and queue:
+            count -= 1
+            try:
+                queue.popleft().accept(observer)
+            except Exception:
+                queue.clear()
+                self.has_faulted = True
+                raise
+
+        # Release under the lock, so a notification queued by another thread
+        # meanwhile is either seen here or activates a new turn
+        with self.lock:
+            if not queue:
+                self.is_acquired = False
+                return
+
+        action()
+
     def dispose(self):
         super(ScheduledObserver, self).dispose()
         self.disposable.dispose()
@@ -1,3 +1,5 @@
+import threading
+
 from rx.observable import Observable
 from rx.internal import DisposedException
 from rx.disposables import Disposable
@@ -22,22 +24,25 @@ class AsyncSubject(Observable, AbstractObserver):
         self.is_stopped = False
         self.value = None
         self.has_value = False
-        self.observers = []
+        self.observers = ()
         self.exception = None
+        self.lock = threading.RLock()
 
     def check_disposed(self):
         if self.is_disposed:
             raise DisposedException()
 
     def __subscribe(self, observer):
-        self.check_disposed()
-        if not self.is_stopped:
-            self.observers.append(observer)
-            return InnerSubscription(self, observer)
-
-        ex = self.exception
-        hv = self.has_value
-        v = self.value
+        with self.lock:
+            self.check_disposed()
+            if not self.is_stopped:
+                self.observers += (observer,)
+                return InnerSubscription(self, observer)
+
+            ex = self.exception
+            hv = self.has_value
+            v = self.value
+
         if ex:
             observer.on_error(ex)
         elif hv:
@@ -49,42 +54,48 @@ class AsyncSubject(Observable, AbstractObserver):
         return Disposable.empty()
 
     def on_completed(self):
-        self.check_disposed()
-        if not self.is_stopped:
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
             self.is_stopped = True
             v = self.value
             hv = self.has_value
+            observers, self.observers = self.observers, ()
 
-            if hv:
-                for o in self.observers[:]:
-                    o.on_next(v)
-                    o.on_completed()
-            else:
-                for o in self.observers[:]:
-                    o.on_completed()
-
-            self.observers = []
+        if hv:
+            for o in observers:
+                o.on_next(v)
+                o.on_completed()
+        else:
+            for o in observers:
+                o.on_completed()
 
     def on_error(self, exception):
-        self.check_disposed()
-        if not self.is_stopped:
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
             self.is_stopped = True
             self.exception = exception
+            observers, self.observers = self.observers, ()
 
-            for o in self.observers[:]:
-                o.on_error(exception)
-
-            self.observers = []
+        for o in observers:
+            o.on_error(exception)
 
     def on_next(self, value):
-        self.check_disposed()
-        if not self.is_stopped:
-            self.value = value
-            self.has_value = True
+        with self.lock:
+            self.check_disposed()
+            if not self.is_stopped:
+                self.value = value
+                self.has_value = True
 
     def dispose(self):
-        self.is_disposed = True
-        self.observers = None
-        self.exception = None
-        self.value = None
+        with self.lock:
+            self.is_disposed = True
+            self.observers = None
+            self.exception = None
+            self.value = None
 
@@ -1,3 +1,5 @@
+import threading
+
 from rx.observable import Observable
 from rx.internal import DisposedException
 from rx.disposables import Disposable
@@ -23,21 +25,25 @@ class BehaviorSubject(Observable, AbstractObserver):
         super(BehaviorSubject, self).__init__(self.__subscribe)
 
         self.value = value
-        self.observers = []
+        self.observers = ()
         self.is_disposed = False
         self.is_stopped = False
         self.exception = None
+        self.lock = threading.RLock()
     
     def check_disposed(self):
         if self.is_disposed:
             raise DisposedException()
     
     def __subscribe(self, observer):
-        self.check_disposed()
-        if not self.is_stopped:
-            self.observers.append(observer)
-            observer.on_next(self.value)
-            return InnerSubscription(self, observer)
+        with self.lock:
+            self.check_disposed()
+            if not self.is_stopped:
+                self.observers += (observer,)
+
+                # Sent under the lock so no newer value can overtake it
+                observer.on_next(self.value)
+                return InnerSubscription(self, observer)
         
         ex = self.exception
         if ex:
@@ -48,37 +54,48 @@ class BehaviorSubject(Observable, AbstractObserver):
         return Disposable.empty()
     
     def on_completed(self):
-        self.check_disposed()
-        if not self.is_stopped:
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
             self.is_stopped = True
-            for o in self.observers[:]:
-                o.on_completed()
+            observers, self.observers = self.observers, ()
 
-            self.observers = []
+        for o in observers:
+            o.on_completed()
     
     def on_error(self, error):
-        self.check_disposed()
-        if not self.is_stopped:
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
             self.is_stopped = True
             self.exception = error
+            observers, self.observers = self.observers, ()
 
-            for o in self.observers[:]:
-                o.on_error(error)
-
-            self.observers = []
+        for o in observers:
+            o.on_error(error)
         
     def on_next(self, value):
-        self.check_disposed()
-        if not self.is_stopped:
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
             self.value = value
-            for o in self.observers[:]:
-                o.on_next(value)
+            observers = self.observers
+
+        for o in observers:
+            o.on_next(value)
     
     def dispose(self):
-        self.is_disposed = True
-        self.observers = None
-        self.value = None
-        self.exception = None
+        with self.lock:
+            self.is_disposed = True
+            self.observers = None
+            self.value = None
+            self.exception = None
     
 
 
@@ -4,8 +4,10 @@ class InnerSubscription(object):
         self.observer = observer
 
     def dispose(self):
-        if not self.subject.is_disposed and self.observer:
-            if self.observer in self.subject.observers:
-                self.subject.observers.remove(self.observer)
-            self.observer = None
-
+        with self.subject.lock:
+            if not self.subject.is_disposed and self.observer:
+                if self.observer in self.subject.observers:
+                    observers = list(self.subject.observers)
+                    observers.remove(self.observer)
+                    self.subject.observers = tuple(observers)
+                self.observer = None
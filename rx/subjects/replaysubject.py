@@ -1,4 +1,6 @@
 import sys
+import threading
+from collections import deque
 from datetime import timedelta
 
 from rx.observable import Observable
@@ -18,8 +20,11 @@ class RemovableDisposable(object):
 
     def dispose(self):
         self.observer.dispose()
-        if not self.subject.is_disposed and self.observer in self.subject.observers:
-            self.subject.observers.remove(self.observer)
+        with self.subject.lock:
+            if not self.subject.is_disposed and self.observer in self.subject.observers:
+                observers = list(self.subject.observers)
+                observers.remove(self.observer)
+                self.subject.observers = tuple(observers)
             
 # Replay Subject
 class ReplaySubject(Observable, AbstractObserver):
@@ -43,12 +48,17 @@ class ReplaySubject(Observable, AbstractObserver):
         if not isinstance(self.window, timedelta):
             self.window = timedelta(milliseconds=self.window)
         self.scheduler = scheduler or current_thread_scheduler
-        self.q = []
-        self.observers = []
+
+        # Bounded deques drop the oldest value on append, so the buffer size
+        # needs no trimming. Timestamps are only kept if there is a window.
+        self.values = deque(maxlen=buffer_size)
+        self.times = None if window is None else deque(maxlen=buffer_size)
+        self.observers = ()
         self.is_stopped = False
         self.is_disposed = False
         self.has_error = False
         self.error = None
+        self.lock = threading.RLock()
 
         super(ReplaySubject, self).__init__(self.__subscribe)
 
@@ -59,71 +69,96 @@ class ReplaySubject(Observable, AbstractObserver):
     def __subscribe(self, observer):
         so = ScheduledObserver(self.scheduler, observer)
         subscription = RemovableDisposable(self, so)
-        self.check_disposed()
-        self._trim(self.scheduler.now())
-        self.observers.append(so)
 
-        n = len(self.q)
+        with self.lock:
+            self.check_disposed()
+            self._trim(self.scheduler.now())
+            self.observers += (so,)
 
-        for item in self.q:
-            so.on_next(item['value'])
+            for value in self.values:
+                so.on_next(value)
 
-        if self.has_error:
-            n += 1
-            so.on_error(self.error)
-        elif self.is_stopped:
-            n += 1
-            so.on_completed()
+            if self.has_error:
+                so.on_error(self.error)
+            elif self.is_stopped:
+                so.on_completed()
 
-        so.ensure_active() # n)
+        so.ensure_active()
         return subscription
     
     def _trim(self, now):
-        while len(self.q) > self.buffer_size:
-            self.q.pop(0)
-        
-        while len(self.q) > 0 and (now - self.q[0]['interval']) > self.window:
-            self.q.pop(0)
+        times = self.times
+        if not times:
+            return
+
+        if now - times[-1] > self.window:
+            times.clear()
+            self.values.clear()
+            return
+
+        values, window = self.values, self.window
+        while now - times[0] > window:
+            times.popleft()
+            values.popleft()
 
     def on_next(self, value):
-        self.check_disposed()
-        if not self.is_stopped:
-            now = self.scheduler.now()
-            self.q.append(dict(interval=now, value=value))
-            self._trim(now)
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
+            self.values.append(value)
+            if self.times is not None:
+                now = self.scheduler.now()
+                self.times.append(now)
+                self._trim(now)
 
-            for observer in self.observers[:]:
+            # Enqueued under the lock so replay and live values keep order
+            observers = self.observers
+            for observer in observers:
                 observer.on_next(value)
-                observer.ensure_active()
+
+        for observer in observers:
+            observer.ensure_active()
     
     def on_error(self, error):
-        self.check_disposed()
-        if not self.is_stopped:
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
             self.is_stopped = True
             self.error = error
             self.has_error = True
             now = self.scheduler.now()
             self._trim(now)
-            
-            for observer in self.observers[:]:
+
+            observers, self.observers = self.observers, ()
+            for observer in observers:
                 observer.on_error(error)
-                observer.ensure_active()
-            
-            self.observers = []
+
+        for observer in observers:
+            observer.ensure_active()
         
     def on_completed(self):
-        self.check_disposed()
-        if not self.is_stopped:
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
             self.is_stopped = True
             now = self.scheduler.now()
             self._trim(now)
-            for observer in self.observers[:]:
+
+            observers, self.observers = self.observers, ()
+            for observer in observers:
                 observer.on_completed()
-                observer.ensure_active()
-            
-            self.observers = []
+
+        for observer in observers:
+            observer.ensure_active()
         
     def dispose(self):
-        self.is_disposed = True
-        self.observers = None
+        with self.lock:
+            self.is_disposed = True
+            self.observers = None
     
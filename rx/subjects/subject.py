@@ -1,32 +1,42 @@
+import threading
+
 from rx.observable import Observable
 from rx.internal import DisposedException
 from rx.disposables import Disposable
 from rx.abstractobserver import AbstractObserver
+from rx.synchronizedobserver import SynchronizedObserver
 
 from .anonymoussubject import AnonymousSubject
 from .innersubscription import InnerSubscription
 
 class Subject(Observable, AbstractObserver):
     """Represents an object that is both an observable sequence as well as an
-    observer. Each notification is broadcasted to all subscribed observers."""
+    observer. Each notification is broadcasted to all subscribed observers.
+
+    The observers are kept in a tuple that is replaced, under a lock, when
+    observers subscribe or unsubscribe. Notifications iterate over the
+    current tuple without copying or locking. Use Subject.synchronize() if
+    notifications may arrive from more than one thread at a time."""
 
     def __init__(self):
         super(Subject, self).__init__(self.__subscribe)
 
         self.is_disposed = False
         self.is_stopped = False
-        self.observers = []
+        self.observers = ()
         self.exception = None
+        self.lock = threading.RLock()
 
     def check_disposed(self):
         if self.is_disposed:
             raise DisposedException()
 
     def __subscribe(self, observer):
-        self.check_disposed()
-        if not self.is_stopped:
-            self.observers.append(observer)
-            return InnerSubscription(self, observer)
+        with self.lock:
+            self.check_disposed()
+            if not self.is_stopped:
+                self.observers += (observer,)
+                return InnerSubscription(self, observer)
 
         if self.exception:
             observer.on_error(self.exception)
@@ -39,14 +49,16 @@ class Subject(Observable, AbstractObserver):
     def on_completed(self):
         """Notifies all subscribed observers of the end of the sequence."""
 
-        self.check_disposed()
-        if not self.is_stopped:
-            self.is_stopped = True
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
 
-            for os in self.observers[:]:
-                os.on_completed()
+            self.is_stopped = True
+            observers, self.observers = self.observers, ()
 
-            self.observers = []
+        for os in observers:
+            os.on_completed()
 
     def on_error(self, exception):
         """Notifies all subscribed observers with the exception.
@@ -54,14 +66,17 @@ class Subject(Observable, AbstractObserver):
         Keyword arguments:
         error -- The exception to send to all subscribed observers.
         """
-        self.check_disposed()
-        if not self.is_stopped:
+        with self.lock:
+            self.check_disposed()
+            if self.is_stopped:
+                return
+
             self.is_stopped = True
             self.exception = exception
-            for os in self.observers[:]:
-                os.on_error(exception)
+            observers, self.observers = self.observers, ()
 
-            self.observers = []
+        for os in observers:
+            os.on_error(exception)
 
     def on_next(self, value):
         """Notifies all subscribed observers with the value.
@@ -71,15 +86,34 @@ class Subject(Observable, AbstractObserver):
         """
         self.check_disposed()
         if not self.is_stopped:
-            for os in self.observers[:]:
+            # A single read of the copy-on-write tuple; dispose() may set it
+            # to None meanwhile
+            for os in self.observers or ():
                 os.on_next(value)
 
     def dispose(self):
         """Unsubscribe all observers and release resources."""
 
-        self.is_disposed = True
-        self.observers = None
+        with self.lock:
+            self.is_disposed = True
+            self.observers = None
 
     @classmethod
     def create(cls, observer, observable):
         return AnonymousSubject(observer, observable)
+
+    @classmethod
+    def synchronize(cls, subject, lock=None):
+        """Creates a subject whose notifications are delivered one at a time
+        to the given subject, so that it can be fed from several threads.
+
+        Keyword arguments:
+        subject -- Subject to synchronize.
+        lock -- [Optional] Lock to synchronize on. Defaults to a new
+            reentrant lock.
+
+        Returns a subject whose observer methods take the lock before
+        forwarding to subject.
+        """
+        observer = SynchronizedObserver(subject, lock or threading.RLock())
+        return AnonymousSubject(observer, subject)
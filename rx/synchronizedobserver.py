@@ -0,0 +1,36 @@
+import threading
+
+from rx import Observer
+
+class SynchronizedObserver(Observer):
+    def __init__(self, observer, lock):
+        self._observer = observer
+        self._lock = lock
+
+    def on_next(self, value):
+        with self._lock:
+            self._observer.on_next(value)
+
+    def on_error(self, err):
+        with self._lock:
+            self._observer.on_error(err)
+
+    def on_completed(self):
+        with self._lock:
+            self._observer.on_completed()
+
+
+def synchronize(self, lock=None):
+    """Synchronizes access to the observer so that notifications from
+    multiple threads are delivered one at a time, and never overlap.
+
+    Keyword arguments:
+    lock -- [Optional] Lock to synchronize on. Defaults to a new reentrant
+        lock, which allows the observer to call back into itself.
+
+    Returns an observer that takes the lock around each call to the
+    specified observer.
+    """
+    return SynchronizedObserver(self, lock or threading.RLock())
+
+Observer.synchronize = synchronize
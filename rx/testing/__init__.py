@@ -1,4 +1,5 @@
 from . import reactivetest, reactive_assert
 from .testscheduler import TestScheduler
+from .preemptingscheduler import PreemptingScheduler
 from .reactivetest import OnNextPredicate, OnErrorPredicate, ReactiveTest, is_prime
 from .mockdisposable import MockDisposable
\ No newline at end of file
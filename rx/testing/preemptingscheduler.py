@@ -0,0 +1,62 @@
+import threading
+from datetime import datetime, timedelta
+
+from rx.concurrency import Scheduler
+from rx.disposables import Disposable
+
+class PreemptingScheduler(Scheduler):
+    """Scheduler for testing the hand-off between an operator and a threaded
+    scheduler. The first action is run on a worker thread that finishes it
+    before schedule returns, as a busy thread pool may, so anything the
+    action schedules is scheduled before the caller gets the first
+    disposable. Every later action is held until run_pending is called.
+
+    The clock only moves when an action is run, by the due time the action
+    was scheduled with."""
+
+    def __init__(self):
+        self.clock = datetime.utcfromtimestamp(0)
+        self.pending = []
+        self.is_first = True
+
+    def now(self):
+        return self.clock
+
+    def schedule(self, action, state=None):
+        return self.schedule_relative(0, action, state)
+
+    def schedule_absolute(self, duetime, action, state=None):
+        return self.schedule_relative(duetime - self.clock, action, state)
+
+    def schedule_relative(self, duetime, action, state=None):
+        duetime = Scheduler.normalize(duetime)
+        if not isinstance(duetime, timedelta):
+            duetime = timedelta(milliseconds=duetime)
+
+        if self.is_first:
+            self.is_first = False
+            worker = threading.Thread(target=self.invoke, args=(duetime, action, state))
+            worker.start()
+            worker.join()
+            return Disposable.empty()
+
+        is_disposed = [False]
+
+        def dispose():
+            is_disposed[0] = True
+
+        self.pending.append((duetime, action, state, is_disposed))
+        return Disposable(dispose)
+
+    def invoke(self, duetime, action, state):
+        self.clock += duetime
+        action(self, state)
+
+    def run_pending(self):
+        """Runs the held actions in the order they were scheduled, skipping
+        those that have been disposed."""
+
+        while self.pending:
+            duetime, action, state, is_disposed = self.pending.pop(0)
+            if not is_disposed[0]:
+                self.invoke(duetime, action, state)
@@ -1,6 +1,8 @@
 from rx.internal.basic import default_comparer
 
 class Recorded(object):
+    __slots__ = ("time", "value", "comparer")
+
     def __init__(self, time, value, comparer=None):
         self.time = time
         self.value = value
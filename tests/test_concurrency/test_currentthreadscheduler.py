@@ -1,4 +1,5 @@
 import unittest
+import threading
 from datetime import datetime, timedelta
 
 from rx.concurrency import Scheduler, CurrentThreadScheduler
@@ -124,3 +125,29 @@ class TestCurrentThreadScheduler(unittest.TestCase):
         scheduler.ensure_trampoline(outer_action)
         assert ran1[0] == True
         assert ran2[0] == False
+
+    def test_currentthread_trampoline_per_thread(self):
+        scheduler = CurrentThreadScheduler()
+        entered, release = threading.Event(), threading.Event()
+        ran = [False]
+
+        def blocking_action(scheduler, state):
+            entered.set()
+            release.wait(5)
+
+        thread = threading.Thread(target=scheduler.schedule, args=(blocking_action,))
+        thread.start()
+        entered.wait(5)
+
+        # The other thread is inside its trampoline, this one is not
+        assert scheduler.schedule_required()
+
+        def action(scheduler, state):
+            ran[0] = True
+
+        scheduler.schedule(action)
+        assert ran[0] == True
+
+        release.set()
+        thread.join()
+        assert scheduler.schedule_required()
@@ -0,0 +1,91 @@
+import unittest
+import threading
+from time import sleep
+from datetime import timedelta
+
+from rx import Observable
+from rx.concurrency import EventLoopScheduler
+
+class TestEventLoopScheduler(unittest.TestCase):
+    def test_eventloop_schedule_action(self):
+        scheduler = EventLoopScheduler()
+        ident = [None]
+        ev = threading.Event()
+
+        def action(scheduler, state):
+            ident[0] = threading.current_thread().ident
+            ev.set()
+
+        scheduler.schedule(action)
+        ev.wait(1)
+        assert ident[0] is not None
+        assert ident[0] != threading.current_thread().ident
+
+    def test_eventloop_same_thread_in_order(self):
+        scheduler = EventLoopScheduler()
+        idents = set()
+        res = []
+        ev = threading.Event()
+
+        def action(scheduler, state):
+            idents.add(threading.current_thread().ident)
+            res.append(state)
+            if state == 99:
+                ev.set()
+
+        for i in range(100):
+            scheduler.schedule(action, i)
+        ev.wait(1)
+
+        assert res == list(range(100))
+        assert len(idents) == 1
+
+    def test_eventloop_schedule_relative_order(self):
+        scheduler = EventLoopScheduler()
+        res = []
+        ev = threading.Event()
+
+        def action(scheduler, state):
+            res.append(state)
+            if len(res) == 3:
+                ev.set()
+
+        scheduler.schedule_relative(timedelta(milliseconds=60), action, 3)
+        scheduler.schedule_relative(timedelta(milliseconds=20), action, 1)
+        scheduler.schedule(action, 0)
+        ev.wait(1)
+        assert res == [0, 1, 3]
+
+    def test_eventloop_observe_on(self):
+        scheduler = EventLoopScheduler()
+        idents = set()
+        res = []
+        ev = threading.Event()
+
+        def on_next(x):
+            idents.add(threading.current_thread().ident)
+            res.append(x)
+
+        Observable.from_iterable(range(50)).observe_on(scheduler).subscribe(
+            on_next, on_completed=ev.set)
+        ev.wait(1)
+        assert res == list(range(50))
+        assert len(idents) == 1
+
+    def test_eventloop_dispose(self):
+        scheduler = EventLoopScheduler()
+        ran = [False]
+        ev = threading.Event()
+
+        def action(scheduler, state):
+            ran[0] = True
+
+        scheduler.schedule(lambda scheduler, state: ev.set())
+        ev.wait(1)
+        scheduler.schedule_relative(timedelta(milliseconds=20), action)
+        scheduler.dispose()
+        scheduler.schedule(action)
+
+        sleep(0.1)
+        assert not ran[0]
+        assert scheduler.timer_thread is None
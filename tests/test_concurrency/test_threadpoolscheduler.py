@@ -0,0 +1,120 @@
+import unittest
+import threading
+from datetime import datetime, timedelta
+from time import sleep
+
+from nose import SkipTest
+try:
+    import concurrent.futures
+except ImportError:
+    raise SkipTest("concurrent.futures not available")
+
+from rx import Observable
+from rx.concurrency import ThreadPoolScheduler
+
+class TestThreadPoolScheduler(unittest.TestCase):
+    def test_threadpool_now(self):
+        scheduler = ThreadPoolScheduler()
+        res = scheduler.now() - datetime.utcnow()
+        assert res < timedelta(microseconds=1000)
+
+    def test_threadpool_schedule_action(self):
+        scheduler = ThreadPoolScheduler(2)
+        ident = [None]
+        ev = threading.Event()
+
+        def action(scheduler, state):
+            ident[0] = threading.current_thread().ident
+            ev.set()
+
+        scheduler.schedule(action)
+        ev.wait(1)
+        assert ident[0] is not None
+        assert ident[0] != threading.current_thread().ident
+
+    def test_threadpool_schedule_action_due(self):
+        scheduler = ThreadPoolScheduler(2)
+        starttime = datetime.utcnow()
+        endtime = [None]
+        ev = threading.Event()
+
+        def action(scheduler, state):
+            endtime[0] = datetime.utcnow()
+            ev.set()
+
+        scheduler.schedule_relative(timedelta(milliseconds=200), action)
+        ev.wait(1)
+        diff = endtime[0] - starttime
+        assert diff > timedelta(milliseconds=180)
+
+    def test_threadpool_schedule_action_cancel(self):
+        scheduler = ThreadPoolScheduler(2)
+        ran = [False]
+
+        def action(scheduler, state):
+            ran[0] = True
+        d = scheduler.schedule_relative(timedelta(milliseconds=10), action)
+        d.dispose()
+
+        sleep(0.1)
+        assert not ran[0]
+
+    def test_threadpool_dispose(self):
+        scheduler = ThreadPoolScheduler(2)
+        ran = [False]
+
+        def action(scheduler, state):
+            ran[0] = True
+
+        scheduler.schedule_relative(timedelta(milliseconds=20), action)
+        scheduler.dispose()
+        scheduler.schedule(action)
+        scheduler.schedule_relative(timedelta(milliseconds=10), action)
+
+        sleep(0.1)
+        assert not ran[0]
+
+    def test_threadpool_schedule_periodic(self):
+        scheduler = ThreadPoolScheduler(2)
+        counter = [0]
+
+        def action(state):
+            counter[0] += 1
+            return state
+
+        d = scheduler.schedule_periodic(20, action)
+        sleep(0.21)
+        d.dispose()
+        assert 7 <= counter[0] <= 11
+
+    def test_threadpool_bounded_workers(self):
+        scheduler = ThreadPoolScheduler(3)
+        idents = set()
+        lock = threading.Lock()
+        done = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            with lock:
+                idents.add(threading.current_thread().ident)
+            sleep(0.01)
+            done.release()
+
+        for _ in range(20):
+            scheduler.schedule(action)
+        for _ in range(20):
+            done.acquire()
+
+        assert len(idents) <= 3
+
+    def test_threadpool_select_many(self):
+        scheduler = ThreadPoolScheduler(4)
+        results = []
+        ev = threading.Event()
+
+        def project(x):
+            return Observable.return_value(x * 10, scheduler)
+
+        Observable.from_iterable(range(10)).select_many(project).to_array().subscribe(
+            lambda xs: results.extend(xs), on_completed=ev.set)
+        ev.wait(2)
+        assert sorted(results) == [x * 10 for x in range(10)]
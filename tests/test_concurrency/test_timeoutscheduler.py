@@ -1,4 +1,5 @@
 import unittest
+import threading
 
 from datetime import datetime, timedelta
 from time import sleep
@@ -47,3 +48,98 @@ class TestTimeoutScheduler(unittest.TestCase):
     
         sleep(0.1)
         assert (not ran)
+
+    def test_timeout_schedule_action_cancel_removes_item(self):
+        scheduler = TimeoutScheduler()
+
+        def action(scheduler, state):
+            pass
+        d = scheduler.schedule_relative(timedelta(seconds=10), action)
+        assert scheduler.queue.length == 1
+        d.dispose()
+        assert scheduler.queue.length == 0
+
+    def test_timeout_schedule_many_one_timer_thread(self):
+        scheduler = TimeoutScheduler(max_workers=2)
+        ran = []
+        lock = threading.Lock()
+
+        def action(scheduler, state):
+            with lock:
+                ran.append(state)
+
+        for i in range(100):
+            scheduler.schedule_relative(timedelta(milliseconds=i % 10 + 1), action, i)
+
+        sleep(0.3)
+        assert sorted(ran) == list(range(100))
+        assert scheduler.pool.workers <= 2
+
+    def test_timeout_schedule_due_order(self):
+        scheduler = TimeoutScheduler(max_workers=1)
+        ran = []
+
+        def action(scheduler, state):
+            ran.append(state)
+
+        scheduler.schedule_relative(timedelta(milliseconds=60), action, 3)
+        scheduler.schedule_relative(timedelta(milliseconds=20), action, 1)
+        scheduler.schedule_relative(timedelta(milliseconds=40), action, 2)
+
+        sleep(0.2)
+        assert ran == [1, 2, 3]
+
+    def test_timeout_schedule_periodic(self):
+        scheduler = TimeoutScheduler()
+        counter = [0]
+
+        def action(state):
+            counter[0] += 1
+            return state + 1
+
+        d = scheduler.schedule_periodic(20, action, 0)
+        sleep(0.21)
+        d.dispose()
+        count = counter[0]
+        assert 7 <= count <= 11
+
+        sleep(0.1)
+        assert counter[0] == count
+
+    def test_timeout_timer_survives_failed_dispatch(self):
+        class FailingScheduler(TimeoutScheduler):
+            failed = [False]
+
+            def dispatch(self, item):
+                if not self.failed[0]:
+                    self.failed[0] = True
+                    raise RuntimeError("cannot dispatch")
+                super(FailingScheduler, self).dispatch(item)
+
+        scheduler = FailingScheduler()
+        ev = threading.Event()
+
+        def action(scheduler, state):
+            ev.set()
+
+        scheduler.schedule_relative(timedelta(milliseconds=10), action)
+        scheduler.schedule_relative(timedelta(milliseconds=20), action)
+
+        assert ev.wait(1)
+
+    def test_timeout_dispose(self):
+        scheduler = TimeoutScheduler()
+        ran = [False]
+
+        def action(scheduler, state):
+            ran[0] = True
+
+        scheduler.schedule_relative(timedelta(milliseconds=20), action)
+        scheduler.dispose()
+        scheduler.schedule_relative(timedelta(milliseconds=10), action)
+        scheduler.schedule_relative(0, action)
+        scheduler.schedule(action)
+
+        sleep(0.1)
+        assert not ran[0]
+        assert scheduler.timer_thread is None
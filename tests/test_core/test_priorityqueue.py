@@ -0,0 +1,65 @@
+import unittest
+
+from rx.internal import PriorityQueue
+from rx.concurrency.scheduleditem import ScheduledItem
+
+def item(duetime):
+    return ScheduledItem(None, None, None, duetime)
+
+class TestPriorityQueue(unittest.TestCase):
+    def test_priorityqueue_dequeue_in_duetime_order(self):
+        queue = PriorityQueue()
+        for duetime in [5, 1, 4, 2, 3]:
+            queue.enqueue(item(duetime))
+
+        res = []
+        while queue.length > 0:
+            res.append(queue.dequeue().duetime)
+        assert res == [1, 2, 3, 4, 5]
+
+    def test_priorityqueue_stable_for_equal_duetime(self):
+        queue = PriorityQueue()
+        items = [item(10) for _ in range(5)]
+        for i in items:
+            queue.enqueue(i)
+
+        res = [queue.dequeue() for _ in range(5)]
+        assert all(a is b for a, b in zip(res, items))
+
+    def test_priorityqueue_remove(self):
+        queue = PriorityQueue()
+        a, b, c = item(1), item(1), item(2)
+        queue.enqueue(a)
+        queue.enqueue(b)
+        queue.enqueue(c)
+
+        assert queue.remove(b)
+        assert not queue.remove(b)
+        assert queue.length == 2
+        assert queue.dequeue() is a
+        assert queue.dequeue() is c
+        assert queue.length == 0
+
+    def test_priorityqueue_remove_head(self):
+        queue = PriorityQueue()
+        a, b = item(1), item(2)
+        queue.enqueue(a)
+        queue.enqueue(b)
+
+        assert queue.remove(queue.peek())
+        assert queue.peek() is b
+
+    def test_priorityqueue_remove_many(self):
+        queue = PriorityQueue()
+        items = [item(i % 17) for i in range(1000)]
+        for i in items:
+            queue.enqueue(i)
+
+        for i in items[::2]:
+            queue.remove(i)
+        assert len(queue) == 500
+        assert len(queue.items) < 1000
+
+        res = [queue.dequeue() for _ in range(500)]
+        assert all(i in items[1::2] for i in res)
+        assert [i.duetime for i in res] == sorted(i.duetime for i in res)
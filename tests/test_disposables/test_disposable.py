@@ -1,6 +1,9 @@
+import threading
+
 from rx.disposables import Disposable, BooleanDisposable, SingleAssignmentDisposable
 from rx.disposables import CompositeDisposable, SerialDisposable
 from rx.disposables import RefCountDisposable
+from rx.internal import noop
 
 def test_anonymousdisposable_create():
     def action():
@@ -282,3 +285,36 @@ def test_refcountdisposable_primarydisposesfirst():
     assert not d.is_disposed
     d2.dispose()
     assert d.is_disposed
+
+def test_groupdisposable_remove_is_identity_based():
+    class Equal(Disposable):
+        def __eq__(self, other):
+            return True
+
+        __hash__ = Disposable.__hash__
+
+    d1 = Equal(noop)
+    d2 = Equal(noop)
+    g = CompositeDisposable(d1)
+
+    assert not g.contains(d2)
+    assert not g.remove(d2)
+    assert g.length == 1
+
+def test_groupdisposable_concurrent_add_remove():
+    g = CompositeDisposable()
+
+    def worker():
+        for _ in range(1000):
+            d = Disposable.empty()
+            g.add(d)
+            assert g.remove(d)
+            assert d.is_disposed
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert g.length == 0
@@ -0,0 +1,89 @@
+import unittest
+
+from rx import Observable
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestBatch(unittest.TestCase):
+
+    def test_from_buffer(self):
+        scheduler = TestScheduler()
+
+        def create():
+            return Observable.from_buffer([1, 2, 3, 4, 5], 2, scheduler)
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(201, [1, 2]), on_next(202, [3, 4]), on_next(203, [5]), on_completed(203))
+
+    def test_from_buffer_empty(self):
+        scheduler = TestScheduler()
+
+        def create():
+            return Observable.from_buffer([], 2, scheduler)
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_completed(201))
+
+    def test_select_where_batch(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, [1, 2, 3]), on_next(220, [5, 7]), on_next(230, [8]), on_completed(300))
+
+        def create():
+            return xs.select_batch(lambda chunk: [x * 10 for x in chunk]).where_batch(lambda chunk: [x % 20 == 0 for x in chunk])
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(210, [20]), on_next(230, [80]), on_completed(300))
+
+    def test_select_batch_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, [1, 2]), on_next(220, [3]), on_completed(300))
+
+        def selector(chunk):
+            if 3 in chunk:
+                raise Exception(ex)
+            return chunk
+
+        def create():
+            return xs.select_batch(selector)
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(210, [1, 2]), on_error(220, ex))
+        xs.subscriptions.assert_equal(subscribe(200, 220))
+
+    def test_unbatch_take(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, [1, 2]), on_next(220, [3, 4, 5]), on_completed(300))
+
+        def create():
+            return xs.unbatch().take(4)
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(210, 1), on_next(210, 2), on_next(220, 3), on_next(220, 4), on_completed(220))
+        xs.subscriptions.assert_equal(subscribe(200, 220))
+
+    def test_numpy_batch(self):
+        if numpy is None:
+            raise unittest.SkipTest("numpy not available")
+
+        values = numpy.arange(10)
+        results = []
+        Observable.from_buffer(values, 4) \
+            .select_batch(numpy.square) \
+            .where_batch(lambda chunk: chunk % 2 == 0) \
+            .unbatch() \
+            .subscribe(results.append)
+
+        assert results == [0, 4, 16, 36, 64]
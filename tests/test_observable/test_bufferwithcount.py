@@ -3,6 +3,12 @@ import unittest
 from rx.observable import Observable
 from rx.testing import TestScheduler, ReactiveTest
 from rx.disposables import Disposable, SerialDisposable
+from rx.internal import ArgumentOutOfRangeException
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -63,4 +69,63 @@ class TestBufferWithCount(unittest.TestCase):
         on_next(350, str([4, 5, 6])))
         xs.subscriptions.assert_equal(subscribe(200, 370))
 
+    def test_buffer_with_count_skip_more_than_count(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_next(250, 5),
+            on_next(260, 6),
+            on_next(270, 7),
+            on_completed(300))
+
+        def create():
+            return xs.buffer_with_count(2, 3).select(lambda x: str(x))
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(
+            on_next(220, str([1, 2])),
+            on_next(250, str([4, 5])),
+            on_next(300, str([7])),
+            on_completed(300))
+        xs.subscriptions.assert_equal(subscribe(200, 300))
+
+    def test_buffer_with_count_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_error(240, ex))
+
+        def create():
+            return xs.buffer_with_count(2).select(lambda x: str(x))
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(
+            on_next(220, str([1, 2])),
+            on_error(240, ex))
+        xs.subscriptions.assert_equal(subscribe(200, 240))
+
+    def test_buffer_with_count_invalid_arguments(self):
+        xs = Observable.empty()
+        self.assertRaises(ArgumentOutOfRangeException, xs.buffer_with_count, 0)
+        self.assertRaises(ArgumentOutOfRangeException, xs.buffer_with_count, 2, 0)
+
+    def test_buffer_with_count_numpy(self):
+        if numpy is None:
+            raise unittest.SkipTest("numpy not available")
+
+        results = []
+        Observable.from_iterable(range(7)) \
+            .buffer_with_count(3, dtype="float64") \
+            .subscribe(results.append)
 
+        assert [len(buffer) for buffer in results] == [3, 3, 1]
+        assert all(buffer.dtype == numpy.float64 for buffer in results)
+        assert results[1].tolist() == [3.0, 4.0, 5.0]
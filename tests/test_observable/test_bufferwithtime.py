@@ -1,7 +1,7 @@
 import unittest
 
 from rx.observable import Observable
-from rx.testing import TestScheduler, ReactiveTest
+from rx.testing import TestScheduler, ReactiveTest, PreemptingScheduler
 from rx.disposables import Disposable, SerialDisposable
 
 on_next = ReactiveTest.on_next
@@ -118,3 +118,18 @@ class TestBufferWithCount(unittest.TestCase):
             on_next(600, ""),
             on_completed(600))
         xs.subscriptions.assert_equal(subscribe(200, 600))
+
+    def test_buffer_with_time_timer_rescheduled_before_schedule_returns(self):
+        scheduler = PreemptingScheduler()
+        res = []
+        subscription = [None]
+
+        def on_next(buffer):
+            res.append(buffer)
+            if len(res) == 2:
+                subscription[0].dispose()
+
+        subscription[0] = Observable.never().buffer_with_time(10, scheduler=scheduler).subscribe(on_next)
+        scheduler.run_pending()
+
+        assert res == [[], []]
@@ -2,7 +2,9 @@ import unittest
 
 from rx import Observable
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
+from rx.concurrency import immediate_scheduler, current_thread_scheduler
 from rx.disposables import Disposable, SerialDisposable
+from rx.subjects import Subject
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -382,3 +384,75 @@ class TestCombineLatest(unittest.TestCase):
         
         results = scheduler.start(create)        
         results.messages.assert_equal(on_error(220, ex))
+
+    def test_combine_latest_conflate_on(self):
+        scheduler = TestScheduler()
+        msgs1 = [on_next(150, 1), on_next(210, 2), on_next(210, 3), on_next(220, 4), on_completed(230)]
+        msgs2 = [on_next(150, 1), on_next(210, 10), on_next(220, 20), on_next(220, 30), on_completed(240)]
+        e1 = scheduler.create_hot_observable(msgs1)
+        e2 = scheduler.create_hot_observable(msgs2)
+        calls = [0]
+
+        def selector(x, y):
+            calls[0] += 1
+            return x + y
+
+        def create():
+            return e1.combine_latest(e2, selector, conflate_on=scheduler)
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(211, 3 + 10), on_next(221, 4 + 30), on_completed(240))
+        assert calls[0] == 2
+
+    def test_combine_latest_conflate_on_completes_after_pending(self):
+        scheduler = TestScheduler()
+        msgs1 = [on_next(150, 1), on_next(210, 2), on_completed(220)]
+        msgs2 = [on_next(150, 1), on_next(220, 3), on_completed(220)]
+        e1 = scheduler.create_hot_observable(msgs1)
+        e2 = scheduler.create_hot_observable(msgs2)
+
+        def create():
+            return Observable.combine_latest(e1, e2, lambda x, y: x + y, conflate_on=scheduler)
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(221, 2 + 3), on_completed(221))
+
+    def test_combine_latest_conflate_on_selector_throws(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        msgs1 = [on_next(150, 1), on_next(215, 2), on_completed(230)]
+        msgs2 = [on_next(150, 1), on_next(220, 3), on_completed(240)]
+        e1 = scheduler.create_hot_observable(msgs1)
+        e2 = scheduler.create_hot_observable(msgs2)
+
+        def create():
+            return e1.combine_latest(e2, lambda x, y: _raise(ex), conflate_on=scheduler)
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_error(221, ex))
+
+    def test_combine_latest_conflate_on_immediate_scheduler(self):
+        a, b = Subject(), Subject()
+        res = []
+        Observable.combine_latest(a, b, lambda x, y: x + y, conflate_on=immediate_scheduler).subscribe(res.append)
+
+        a.on_next(1)
+        b.on_next(2)
+        a.on_next(3)
+
+        assert res == [3, 5]
+
+    def test_combine_latest_conflate_on_current_thread_scheduler(self):
+        a, b = Subject(), Subject()
+        res = []
+        a.combine_latest(b, lambda x, y: x + y, conflate_on=current_thread_scheduler).subscribe(res.append)
+
+        a.on_next(1)
+        b.on_next(2)
+        b.on_next(3)
+
+        assert res == [3, 4]
+
+    def test_combine_latest_unknown_keyword(self):
+        o1 = Observable.never()
+        self.assertRaises(TypeError, o1.combine_latest, o1, lambda x, y: x + y, conflate=immediate_scheduler)
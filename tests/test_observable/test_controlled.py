@@ -0,0 +1,135 @@
+import unittest
+
+from rx import Observable
+from rx.testing import TestScheduler, ReactiveTest
+from rx.subjects import Subject
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+class TestControlled(unittest.TestCase):
+
+    def test_controlled_queues_until_requested(self):
+        scheduler = TestScheduler()
+        controlled = [None]
+        results = scheduler.create_observer()
+
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(230, 3),
+            on_next(301, 4),
+            on_next(350, 5),
+            on_next(399, 6),
+            on_completed(500)
+        )
+
+        def action0(scheduler, state):
+            controlled[0] = xs.controlled()
+            controlled[0].subscribe(results)
+        scheduler.schedule_absolute(200, action0)
+
+        def action1(scheduler, state):
+            controlled[0].request(1)
+        scheduler.schedule_absolute(300, action1)
+
+        def action2(scheduler, state):
+            controlled[0].request(3)
+        scheduler.schedule_absolute(360, action2)
+
+        def action3(scheduler, state):
+            controlled[0].request(10)
+        scheduler.schedule_absolute(600, action3)
+
+        scheduler.start()
+
+        results.messages.assert_equal(
+            on_next(300, 2),
+            on_next(360, 3),
+            on_next(360, 4),
+            on_next(360, 5),
+            on_next(600, 6),
+            on_completed(600)
+        )
+
+    def test_controlled_requests_add_up(self):
+        source = Subject()
+        controlled = source.controlled()
+        received = []
+        controlled.subscribe(received.append)
+
+        controlled.request(1)
+        controlled.request(2)
+        for i in range(5):
+            source.on_next(i)
+
+        assert received == [0, 1, 2]
+        assert list(controlled.subject.queue) == [3, 4]
+
+    def test_controlled_request_all(self):
+        source = Subject()
+        controlled = source.controlled()
+        received = []
+        controlled.subscribe(received.append)
+
+        source.on_next(0)
+        controlled.request()
+        source.on_next(1)
+        source.on_next(2)
+
+        assert received == [0, 1, 2]
+
+    def test_controlled_without_queue_drops(self):
+        source = Subject()
+        controlled = source.controlled(enable_queue=False)
+        received = []
+        controlled.subscribe(received.append)
+
+        source.on_next(0)
+        controlled.request(1)
+        source.on_next(1)
+        source.on_next(2)
+
+        assert received == [1]
+        assert not controlled.subject.queue
+
+    def test_controlled_error_after_queue(self):
+        ex = 'ex'
+        source = Subject()
+        controlled = source.controlled()
+        received = []
+        controlled.subscribe(received.append, received.append)
+
+        source.on_next(0)
+        source.on_next(1)
+        source.on_error(ex)
+        assert received == []
+
+        controlled.request(1)
+        assert received == [0]
+
+        controlled.request(1)
+        assert received == [0, 1, ex]
+
+    def test_controlled_request_from_on_next(self):
+        source = Subject()
+        controlled = source.controlled()
+        received = []
+
+        def on_next(value):
+            received.append(value)
+            controlled.request(1)
+
+        controlled.subscribe(on_next)
+        for i in range(5000):
+            source.on_next(i)
+
+        # Each request is made while the previous value is passed on. The
+        # queued values are emitted by the outer drain loop, not recursively.
+        controlled.request(1)
+        assert received == list(range(5000))
@@ -2,8 +2,10 @@ import logging
 import unittest
 from datetime import datetime
 
-from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
+from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable, \
+    PreemptingScheduler
 from rx.disposables import Disposable
+from rx.subjects import Subject
 
 FORMAT = '%(asctime)-15s %(threadName)s %(message)s'
 logging.basicConfig(filename='rx.log', format=FORMAT, level=logging.DEBUG)
@@ -186,3 +188,19 @@ class TestDelay(unittest.TestCase):
             
         results.messages.assert_equal()
         xs.subscriptions.assert_equal(subscribe(200, 1000))
+
+    def test_delay_timer_rescheduled_before_schedule_returns(self):
+        scheduler = PreemptingScheduler()
+        subject = Subject()
+        res = []
+
+        def on_next(x):
+            res.append(x)
+            if x == 1:
+                subject.on_next(2)
+
+        subject.delay(10, scheduler).subscribe(on_next)
+        subject.on_next(1)
+        scheduler.run_pending()
+
+        assert res == [1, 2]
@@ -91,3 +91,77 @@ class TestDistinctUntilChanged(unittest.TestCase):
 
         results.messages.assert_equal(on_next(280, 3), on_next(350, 1), on_error(380, ex))
         xs.subscriptions.assert_equal(subscribe(200, 380))
+
+    def test_distinct_unhashable_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(280, [1]), on_next(300, 2), on_next(350, [1]), on_next(380, 2), on_next(400, [3]), on_completed(420))
+
+        def create():
+            return xs.distinct()
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(280, [1]), on_next(300, 2), on_next(400, [3]), on_completed(420))
+
+    def test_distinct_comparer(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(280, 4), on_next(300, 2), on_next(350, 12), on_next(380, 3), on_next(400, 24), on_completed(420))
+
+        def create():
+            return xs.distinct(comparer=lambda a, b: a % 10 == b % 10)
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(280, 4), on_next(300, 2), on_next(380, 3), on_completed(420))
+
+    def test_distinct_max_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(280, 1), on_next(300, 2), on_next(320, 1), on_next(350, 3), on_next(380, 2), on_next(400, 1), on_completed(420))
+
+        def create():
+            return xs.distinct(max_keys=2)
+
+        results = scheduler.start(create)
+
+        # 1 is seen again at 320, so 2 is the least recently seen key when 3 arrives
+        results.messages.assert_equal(on_next(280, 1), on_next(300, 2), on_next(350, 3), on_next(380, 2), on_next(400, 1), on_completed(420))
+
+    def test_distinct_max_keys_comparer(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(280, 1), on_next(300, 2), on_next(320, 11), on_next(350, 3), on_next(380, 12), on_next(400, 21), on_completed(420))
+
+        def create():
+            return xs.distinct(comparer=lambda a, b: a % 10 == b % 10, max_keys=2)
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(280, 1), on_next(300, 2), on_next(350, 3), on_next(380, 12), on_next(400, 21), on_completed(420))
+
+    def test_distinct_within(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(250, 1), on_next(300, 2), on_next(320, 2), on_next(330, 1), on_completed(400))
+
+        def create():
+            return xs.distinct_within(100, scheduler=scheduler)
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(210, 1), on_next(220, 2), on_next(320, 2), on_next(330, 1), on_completed(400))
+
+    def test_distinct_within_key_selector_throws(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 0), on_completed(400))
+
+        def create():
+            def key_selector(x):
+                if not x:
+                    raise Exception(ex)
+                return x
+
+            return xs.distinct_within(100, key_selector, scheduler)
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(210, 1), on_error(220, ex))
+        xs.subscriptions.assert_equal(subscribe(200, 220))
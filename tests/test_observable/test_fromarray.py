@@ -47,4 +47,59 @@ class TestFromArray(unittest.TestCase):
           return Observable.from_array(enumerable_finite, scheduler=scheduler)
       results = scheduler.start(create)
 
-      results.messages.assert_equal(on_completed(201))
\ No newline at end of file
+      results.messages.assert_equal(on_completed(201))
+
+    def test_subscribe_to_enumerable_batched(self):
+        scheduler = TestScheduler()
+
+        def create():
+            return Observable.from_array([1, 2, 3, 4, 5], scheduler=scheduler, batch_size=2)
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(
+                            on_next(201, 1),
+                            on_next(201, 2),
+                            on_next(202, 3),
+                            on_next(202, 4),
+                            on_next(203, 5),
+                            on_completed(203)
+                        )
+
+    def test_subscribe_to_enumerable_twice(self):
+        xs = Observable.from_iterable([1, 2, 3])
+        first, second = [], []
+
+        xs.subscribe(first.append)
+        xs.subscribe(second.append)
+
+        assert first == [1, 2, 3]
+        assert second == [1, 2, 3]
+
+    def test_subscribe_to_generator_batched_take(self):
+        def naturals():
+            i = 0
+            while True:
+                yield i
+                i += 1
+
+        results = []
+        Observable.from_iterable(naturals(), batch_size=100).take(3).subscribe(results.append)
+
+        assert results == [0, 1, 2]
+
+    def test_subscribe_to_generator_batched_stops_pulling_on_dispose(self):
+        pulled = []
+
+        def naturals():
+            i = 0
+            while True:
+                pulled.append(i)
+                yield i
+                i += 1
+
+        results = []
+        Observable.from_iterable(naturals(), batch_size=100).take(3).subscribe(results.append)
+
+        assert results == [0, 1, 2]
+        assert pulled == [0, 1, 2]
@@ -0,0 +1,95 @@
+import unittest
+
+from rx.observable import Observable
+from rx.linq.fusedobservable import FusedObservable
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+class TestFusion(unittest.TestCase):
+
+    def test_fusion_collapses_chain(self):
+        xs = Observable.never()
+        ys = xs.where(lambda x: True).select(lambda x: x).skip(1).take_while(lambda x: True).take(3)
+
+        assert isinstance(ys, FusedObservable)
+        assert ys.source is xs
+        assert len(ys.stages) == 5
+
+    def test_fusion_does_not_change_operand(self):
+        xs = Observable.never().select(lambda x: x)
+        xs.where(lambda x: True)
+
+        assert len(xs.stages) == 1
+
+    def test_fusion_chain(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(150, 1), on_next(210, 2), on_next(220, 3), on_next(230, 4), on_next(240, 5), on_next(250, 6), on_next(260, 7), on_next(270, 8), on_completed(300))
+
+        def create():
+            return xs.where(lambda x: x % 2 == 0).select(lambda x, i: x * 10 + i).skip(1).take(2)
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(230, 41), on_next(250, 62), on_completed(250))
+        xs.subscriptions.assert_equal(subscribe(200, 250))
+
+    def test_fusion_take_stops_earlier_stages(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+        invoked = [0]
+
+        def selector(x):
+            invoked[0] += 1
+            return x
+
+        def create():
+            return xs.select(selector).take(1)
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(210, 1), on_completed(210))
+        xs.subscriptions.assert_equal(subscribe(200, 210))
+        assert invoked[0] == 1
+
+    def test_fusion_error_in_middle_stage(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+        invoked = [0]
+
+        def predicate(x):
+            invoked[0] += 1
+            return True
+
+        def selector(x):
+            if x == 2:
+                raise Exception(ex)
+            return x
+
+        def create():
+            return xs.where(predicate).select(selector).select(lambda x: -x)
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(on_next(210, -1), on_error(220, ex))
+        xs.subscriptions.assert_equal(subscribe(200, 220))
+        assert invoked[0] == 2
+
+    def test_fusion_subscriptions_have_own_state(self):
+        def subscribe(observer):
+            for x in [1, 2, 3, 4]:
+                observer.on_next(x)
+            observer.on_completed()
+
+        xs = Observable.create(subscribe).skip(1).take(2).select(lambda x, i: (x, i))
+        first, second = [], []
+
+        xs.subscribe(first.append)
+        xs.subscribe(second.append)
+
+        assert first == [(2, 0), (3, 1)]
+        assert second == [(2, 0), (3, 1)]
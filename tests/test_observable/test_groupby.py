@@ -540,5 +540,70 @@ class TestGroupBy(unittest.TestCase):
         xs.subscriptions.assert_equal(
             subscribe(200, 570))
 
+    def test_group_by_hashes_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, "1"),
+            on_next(230, 1),
+            on_completed(300))
+
+        def factory():
+            return xs.group_by(lambda x: x).select_many(
+                lambda g: g.count().select(lambda n: "%r:%d" % (g.key, n)))
+
+        results = scheduler.start(factory)
+        results.messages.assert_equal(
+            on_next(300, "1:2"),
+            on_next(300, "'1':1"),
+            on_completed(300))
+
+    def test_group_by_max_groups_evicts_least_recently_used(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(220, "b"),
+            on_next(230, "a"),
+            on_next(240, "c"),
+            on_next(250, "b"),
+            on_completed(300))
+        outer = [None]
+
+        def factory():
+            outer[0] = xs.group_by(lambda x: x, max_groups=2)
+            return outer[0].select_many(
+                lambda g: g.count().select(lambda n: "%s:%d" % (g.key, n)))
+
+        results = scheduler.start(factory)
+        results.messages.assert_equal(
+            on_next(240, "b:1"),
+            on_next(250, "a:2"),
+            on_next(300, "c:1"),
+            on_next(300, "b:1"),
+            on_completed(300))
+        xs.subscriptions.assert_equal(subscribe(200, 300))
+        assert outer[0].stats == {"groups": 0, "created": 4, "expired": 0, "evicted": 2}
+
+    def test_group_by_until_expires_group(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, "a"),
+            on_next(220, "a"),
+            on_next(230, "a"),
+            on_completed(300))
+        outer = [None]
+
+        def factory():
+            outer[0] = xs.group_by_until(lambda x: x, None, lambda g: g.skip(1))
+            return outer[0].select_many(
+                lambda g: g.count().select(lambda n: "%s:%d" % (g.key, n)))
+
+        results = scheduler.start(factory)
+        results.messages.assert_equal(
+            on_next(220, "a:2"),
+            on_next(300, "a:1"),
+            on_completed(300))
+        assert outer[0].stats == {"groups": 0, "created": 2, "expired": 1, "evicted": 0}
+
 if __name__ == '__main__':
     unittest.main()
@@ -901,6 +901,34 @@ class TestGroup_join(unittest.TestCase):
         results = scheduler.start(create=create)
             
         results.messages.assert_equal(on_error(210, ex))
-    
+
+    def test_group_join_keyed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, (1, "a")),
+            on_next(220, (2, "b")),
+            on_completed(300))
+        ys = scheduler.create_hot_observable(
+            on_next(215, (1, "x")),
+            on_next(225, (2, "y")),
+            on_next(230, (1, "z")),
+            on_completed(310))
+
+        def create():
+            return xs.group_join(
+                ys,
+                lambda x: Observable.never(),
+                lambda y: Observable.never(),
+                lambda x, yy: yy.select(lambda y: x[1] + y[1]),
+                left_key=lambda x: x[0]
+            ).merge_observable()
+
+        res = scheduler.start(create=create)
+
+        res.messages.assert_equal(
+            on_next(215, "ax"),
+            on_next(225, "by"),
+            on_next(230, "az"))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -807,3 +807,94 @@ class TestJoin(unittest.TestCase):
         results = scheduler.start(create=create)
 
         results.messages.assert_equal(on_error(215, ex))
+
+    def test_join_keyed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, (1, "a")),
+            on_next(220, (2, "b")),
+            on_completed(300))
+        ys = scheduler.create_hot_observable(
+            on_next(215, (1, "x")),
+            on_next(225, (2, "y")),
+            on_next(230, (1, "z")),
+            on_next(240, (3, "w")),
+            on_completed(310))
+
+        def create():
+            return xs.join(ys,
+                lambda x: Observable.never(),
+                lambda y: Observable.never(),
+                lambda x, y: x[1] + y[1],
+                left_key=lambda x: x[0])
+
+        results = scheduler.start(create=create)
+        results.messages.assert_equal(
+            on_next(215, "ax"),
+            on_next(225, "by"),
+            on_next(230, "az"),
+            on_completed(310))
+
+    def test_join_within_same_as_join_with_timers(self):
+        def messages(create):
+            scheduler = TestScheduler()
+            xs = scheduler.create_hot_observable(
+                on_next(210, 0),
+                on_next(219, 1),
+                on_next(240, 2),
+                on_next(300, 3),
+                on_next(310, 4),
+                on_next(500, 5),
+                on_completed(520))
+            ys = scheduler.create_hot_observable(
+                on_next(215, "hat"),
+                on_next(217, "bat"),
+                on_next(230, "wag"),
+                on_next(300, "pig"),
+                on_next(325, "cup"),
+                on_completed(800))
+            return scheduler.start(create=lambda: create(xs, ys, scheduler)).messages
+
+        expected = messages(lambda xs, ys, scheduler: xs.join(ys,
+            lambda x: Observable.timer(20, scheduler=scheduler),
+            lambda y: Observable.timer(20, scheduler=scheduler),
+            lambda x, y: "%s%s" % (x, y)))
+        actual = messages(lambda xs, ys, scheduler: xs.join_within(ys, 20,
+            lambda x, y: "%s%s" % (x, y), scheduler=scheduler))
+
+        actual.assert_equal(*expected)
+        actual.assert_equal(
+            on_next(215, "0hat"),
+            on_next(217, "0bat"),
+            on_next(219, "1hat"),
+            on_next(219, "1bat"),
+            on_next(230, "0wag"),
+            on_next(230, "1wag"),
+            on_next(240, "2wag"),
+            on_next(300, "3pig"),
+            on_next(310, "4pig"),
+            on_next(325, "4cup"),
+            on_completed(520))
+
+    def test_join_within_keyed(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, (1, "a")),
+            on_next(220, (2, "b")),
+            on_completed(300))
+        ys = scheduler.create_hot_observable(
+            on_next(215, (1, "x")),
+            on_next(225, (2, "y")),
+            on_next(230, (1, "z")),
+            on_completed(240))
+
+        def create():
+            return xs.join_within(ys, 15, lambda x, y: x[1] + y[1],
+                left_key=lambda x: x[0], scheduler=scheduler)
+
+        results = scheduler.start(create=create)
+        results.messages.assert_equal(
+            on_next(215, "ax"),
+            on_next(225, "by"),
+            on_completed(245))
+
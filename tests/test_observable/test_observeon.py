@@ -1,8 +1,12 @@
 import unittest
+import threading
 
 from rx import Observable
-from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
+from rx.concurrency import Scheduler
+from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable, \
+    PreemptingScheduler
 from rx.disposables import Disposable, SerialDisposable
+from rx.subjects import ReplaySubject
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -76,3 +80,69 @@ class TestObserveOn(unittest.TestCase):
         results.messages.assert_equal()
         xs.subscriptions.assert_equal(subscribe(200, 1000))
 
+
+    def test_observe_on_drains_pending_in_one_turn(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+                            on_next(210, 1),
+                            on_next(210, 2),
+                            on_next(210, 3),
+                            on_completed(250)
+                        )
+
+        def create():
+            return xs.observe_on(scheduler)
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(211, 1), on_next(211, 2), on_next(211, 3), on_completed(251))
+
+    def test_observe_on_batch_size(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+                            on_next(210, 1),
+                            on_next(210, 2),
+                            on_next(210, 3),
+                            on_completed(210)
+                        )
+
+        def create():
+            return xs.observe_on(scheduler, batch_size=2)
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(211, 1), on_next(211, 2), on_next(212, 3), on_completed(212))
+
+    def test_observe_on_timeout_scheduler_keeps_order(self):
+        res = []
+        done = threading.Event()
+
+        Observable.from_iterable(range(1000)).observe_on(Scheduler.timeout).subscribe(
+            res.append, on_completed=done.set)
+
+        done.wait(5)
+        assert res == list(range(1000))
+
+    def test_observe_on_turn_rescheduled_before_schedule_returns(self):
+        scheduler = PreemptingScheduler()
+        res = []
+        subject = ReplaySubject(scheduler=scheduler)
+        for i in range(3):
+            subject.on_next(i)
+
+        subject.subscribe(res.append)
+        scheduler.run_pending()
+
+        assert res == [0, 1, 2]
+
+    def test_replay_subject_timeout_scheduler_delivers_all(self):
+        for _ in range(50):
+            res = []
+            done = threading.Event()
+            subject = ReplaySubject(scheduler=Scheduler.timeout)
+            for i in range(20):
+                subject.on_next(i)
+            subject.on_completed()
+
+            subject.subscribe(res.append, on_completed=done.set)
+
+            done.wait(5)
+            assert res == list(range(20))
@@ -0,0 +1,165 @@
+import unittest
+
+from rx import Observable
+from rx.testing import TestScheduler, ReactiveTest, PreemptingScheduler
+from rx.subjects import Subject
+from rx.internal import BufferOverflowException
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+class TestOnBackpressure(unittest.TestCase):
+
+    def test_on_backpressure_drop(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(211, 3),
+            on_next(211, 4),
+            on_next(220, 5),
+            on_completed(230)
+        )
+        res = [None]
+
+        def create():
+            res[0] = xs.on_backpressure_drop(scheduler)
+            return res[0]
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(
+            on_next(211, 2),
+            on_next(221, 5),
+            on_completed(231))
+        xs.subscriptions.assert_equal(subscribe(200, 231))
+        assert res[0].stats == {"dropped": 2}
+
+    def test_on_backpressure_latest(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 2),
+            on_next(210, 3),
+            on_next(210, 4),
+            on_next(220, 5),
+            on_completed(230)
+        )
+        res = [None]
+
+        def create():
+            res[0] = xs.on_backpressure_latest(scheduler)
+            return res[0]
+
+        results = scheduler.start(create)
+
+        results.messages.assert_equal(
+            on_next(211, 4),
+            on_next(221, 5),
+            on_completed(231))
+        assert res[0].stats == {"dropped": 2}
+
+    def test_on_backpressure_latest_keyed(self):
+        source = Subject()
+        scheduler = TestScheduler()
+        received = []
+        res = source.on_backpressure_latest(scheduler, lambda x: x[0])
+        res.subscribe(received.append)
+
+        for quote in [("a", 1), ("b", 1), ("a", 2), ("c", 1), ("b", 2), ("a", 3)]:
+            source.on_next(quote)
+        scheduler.advance_by(10)
+
+        assert received == [("a", 3), ("b", 2), ("c", 1)]
+        assert res.stats == {"dropped": 3}
+
+    def test_on_backpressure_latest_key_throws(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 2),
+            on_next(220, 3),
+            on_completed(230)
+        )
+
+        def key_selector(x):
+            if x == 3:
+                raise Exception(ex)
+            return x
+
+        results = scheduler.start(lambda: xs.on_backpressure_latest(scheduler, key_selector))
+
+        results.messages.assert_equal(
+            on_next(211, 2),
+            on_error(221, ex))
+
+    def test_on_backpressure_buffer_drop_oldest(self):
+        source = Subject()
+        scheduler = TestScheduler()
+        received = []
+        overflowed = []
+        res = source.on_backpressure_buffer(3, scheduler, "drop_oldest", overflowed.append)
+        res.subscribe(received.append, None, lambda: received.append("done"))
+
+        for i in range(6):
+            source.on_next(i)
+        source.on_completed()
+        scheduler.advance_by(10)
+
+        assert received == [3, 4, 5, "done"]
+        assert overflowed == [3, 4, 5]
+        assert res.stats == {"dropped": 3}
+
+    def test_on_backpressure_buffer_drop_newest(self):
+        source = Subject()
+        scheduler = TestScheduler()
+        received = []
+        res = source.on_backpressure_buffer(3, scheduler, "drop_newest")
+        res.subscribe(received.append)
+
+        for i in range(6):
+            source.on_next(i)
+        scheduler.advance_by(10)
+
+        assert received == [0, 1, 2]
+        assert res.stats == {"dropped": 3}
+
+    def test_on_backpressure_buffer_error(self):
+        source = Subject()
+        scheduler = TestScheduler()
+        received = []
+        errors = []
+        source.on_backpressure_buffer(2, scheduler).subscribe(received.append, errors.append)
+
+        for i in range(4):
+            source.on_next(i)
+        scheduler.advance_by(10)
+
+        assert received == []
+        assert len(errors) == 1 and isinstance(errors[0], BufferOverflowException)
+
+    def test_on_backpressure_buffer_invalid_arguments(self):
+        xs = Observable.empty()
+        self.assertRaises(ValueError, xs.on_backpressure_buffer, 2, None, "block")
+        self.assertRaises(ValueError, xs.on_backpressure_buffer, 0, None)
+
+    def test_on_backpressure_turn_rescheduled_before_schedule_returns(self):
+        scheduler = PreemptingScheduler()
+        subject = Subject()
+        res = []
+
+        def on_next(x):
+            res.append(x)
+            if x == 1:
+                subject.on_next(2)
+                subject.on_completed()
+
+        subject.on_backpressure_buffer(10, scheduler).subscribe(on_next, on_completed=lambda: res.append("done"))
+        subject.on_next(1)
+        scheduler.run_pending()
+
+        assert res == [1, 2, "done"]
@@ -1,9 +1,11 @@
+import threading
 import unittest
 
 from rx import Observable
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
 from rx.disposables import Disposable, SerialDisposable
 from rx.subjects import Subject
+from rx.internal import BufferOverflowException, ArgumentOutOfRangeException
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -152,3 +154,125 @@ class TestPausableBuffered(unittest.TestCase):
         on_next(210, 2),
             on_error(230, err)
         )
+
+    def paused_overflow(self, max_buffer, overflow):
+        scheduler = TestScheduler()
+        controller = Subject()
+        results = scheduler.create_observer()
+
+        xs = scheduler.create_hot_observable(
+            on_next(210, 2),
+            on_next(301, 3),
+            on_next(302, 4),
+            on_next(303, 5),
+            on_next(304, 6),
+            on_completed(500)
+        )
+
+        def action0(scheduler, state):
+            xs.pausable_buffered(controller, max_buffer, overflow).subscribe(results)
+            controller.on_next(True)
+        scheduler.schedule_absolute(200, action0)
+
+        def action1(scheduler, state):
+            controller.on_next(False)
+        scheduler.schedule_absolute(300, action1)
+
+        def action2(scheduler, state):
+            controller.on_next(True)
+        scheduler.schedule_absolute(400, action2)
+
+        scheduler.start()
+        return results
+
+    def test_paused_drop_oldest(self):
+        results = self.paused_overflow(2, "drop_oldest")
+        results.messages.assert_equal(
+            on_next(210, 2),
+            on_next(400, 5),
+            on_next(400, 6),
+            on_completed(500))
+
+    def test_paused_drop_newest(self):
+        results = self.paused_overflow(2, "drop_newest")
+        results.messages.assert_equal(
+            on_next(210, 2),
+            on_next(400, 3),
+            on_next(400, 4),
+            on_completed(500))
+
+    def test_paused_overflow_error(self):
+        results = self.paused_overflow(2, "error")
+        assert len(results.messages) == 2
+        assert results.messages[0].value.value == 2
+        assert results.messages[1].time == 303
+        assert isinstance(results.messages[1].value.exception, BufferOverflowException)
+
+    def test_paused_spill(self):
+        results = self.paused_overflow(1, "spill")
+        results.messages.assert_equal(
+            on_next(210, 2),
+            on_next(400, 3),
+            on_next(400, 4),
+            on_next(400, 5),
+            on_next(400, 6),
+            on_completed(500))
+
+    def test_paused_completed_flushes_in_order(self):
+        source = Subject()
+        controller = Subject()
+        received = []
+        source.pausable_buffered(controller).subscribe(received.append)
+
+        for i in range(3):
+            source.on_next(i)
+        source.on_completed()
+
+        assert received == [0, 1, 2]
+
+    def test_paused_block(self):
+        source = Subject()
+        controller = Subject()
+        received = []
+        source.pausable_buffered(controller, 2, "block").subscribe(received.append)
+
+        def produce():
+            for i in range(10):
+                source.on_next(i)
+            source.on_completed()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        producer.join(0.2)
+
+        # The producer is blocked on the third value
+        assert producer.is_alive()
+        assert received == []
+
+        controller.on_next(True)
+        producer.join(5)
+        assert not producer.is_alive()
+        assert received == list(range(10))
+
+    def test_pausable_buffered_invalid_overflow(self):
+        self.assertRaises(ValueError, Observable.empty().pausable_buffered, Subject(), 2, "drop_random")
+
+    def test_pausable_buffered_unbounded_spill_or_block(self):
+        self.assertRaises(ArgumentOutOfRangeException, Observable.empty().pausable_buffered, Subject(), None, "spill")
+        self.assertRaises(ArgumentOutOfRangeException, Observable.empty().pausable_buffered, Subject(), None, "block")
+
+    def test_spill_buffer_keeps_order(self):
+        from rx.backpressure.spillbuffer import SpillBuffer
+
+        buffer = SpillBuffer(3)
+        for i in range(10):
+            buffer.append(i)
+        popped = [buffer.popleft() for _ in range(4)]
+        for i in range(10, 15):
+            buffer.append(i)
+        while buffer:
+            popped.append(buffer.popleft())
+
+        assert popped == list(range(15))
+        assert buffer.file is not None and buffer.read_pos == 0
+        buffer.close()
@@ -1,4 +1,5 @@
 import unittest
+from datetime import timedelta
 
 from rx import Observable
 from rx.abstractobserver import AbstractObserver
@@ -6,6 +7,7 @@ from rx.linq.connectableobservable import ConnectableObservable
 from rx.subjects import Subject
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
 from rx.disposables import Disposable, SerialDisposable
+from rx.internal import ArgumentOutOfRangeException
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -154,6 +156,101 @@ class TestPublish(unittest.TestCase):
         dis3.dispose()
         assert(disconnected[0])
 
+    def test_ref_count_grace_reuses_connection(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(250, 2),
+            on_next(270, 3)
+        )
+        refd = xs.publish().ref_count(20, scheduler)
+        results = scheduler.create_observer()
+        d1 = [None]
+        d2 = [None]
+
+        def action1(scheduler, state):
+            d1[0] = refd.subscribe(results)
+        scheduler.schedule_absolute(200, action1)
+
+        def action2(scheduler, state):
+            d1[0].dispose()
+        scheduler.schedule_absolute(230, action2)
+
+        def action3(scheduler, state):
+            d2[0] = refd.subscribe(results)
+        scheduler.schedule_absolute(240, action3)
+
+        def action4(scheduler, state):
+            d2[0].dispose()
+        scheduler.schedule_absolute(260, action4)
+
+        scheduler.start()
+
+        results.messages.assert_equal(on_next(210, 1), on_next(250, 2))
+        xs.subscriptions.assert_equal(subscribe(200, 280))
+        self.assertEqual({"connects": 1, "disconnects": 1, "reused": 1}, refd.stats)
+
+    def test_ref_count_grace_reconnects_after_grace(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(250, 2)
+        )
+        refd = xs.publish().ref_count(timedelta(milliseconds=10), scheduler)
+        d = [None]
+
+        def action1(scheduler, state):
+            d[0] = refd.subscribe()
+        scheduler.schedule_absolute(200, action1)
+
+        def action2(scheduler, state):
+            d[0].dispose()
+            d[0].dispose() # idempotency test
+        scheduler.schedule_absolute(220, action2)
+
+        def action3(scheduler, state):
+            d[0] = refd.subscribe()
+        scheduler.schedule_absolute(240, action3)
+
+        def action4(scheduler, state):
+            d[0].dispose()
+        scheduler.schedule_absolute(245, action4)
+
+        scheduler.start()
+
+        xs.subscriptions.assert_equal(subscribe(200, 230), subscribe(240, 255))
+        self.assertEqual({"connects": 2, "disconnects": 2, "reused": 0}, refd.stats)
+
+    def test_ref_count_grace_overtaken_timer(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1))
+        refd = xs.publish().ref_count(20, scheduler)
+        d = [None]
+
+        def subscribe_at(time):
+            def action(scheduler, state):
+                d[0] = refd.subscribe()
+            scheduler.schedule_absolute(time, action)
+
+        def dispose_at(time):
+            def action(scheduler, state):
+                d[0].dispose()
+            scheduler.schedule_absolute(time, action)
+
+        subscribe_at(200)
+        dispose_at(210)
+        subscribe_at(215)
+        dispose_at(225)
+
+        scheduler.start()
+
+        # The timer of the first dispose must not cut the second grace short
+        xs.subscriptions.assert_equal(subscribe(200, 245))
+
+    def test_ref_count_grace_negative(self):
+        xs = Observable.never().publish()
+        self.assertRaises(ArgumentOutOfRangeException, xs.ref_count, -1)
+
     def test_publish_basic(self):
         scheduler = TestScheduler()
         xs = scheduler.create_hot_observable(
@@ -0,0 +1,82 @@
+import unittest
+import threading
+
+from nose import SkipTest
+try:
+    import concurrent.futures
+except ImportError:
+    raise SkipTest("concurrent.futures not available")
+
+from rx import Observable
+from rx.subjects import Subject
+
+def square(x):
+    return x * x
+
+def fail_on_five(x):
+    if x == 5:
+        raise ValueError(x)
+    return x
+
+def run(source):
+    results = []
+    errors = []
+    ev = threading.Event()
+
+    def on_error(err):
+        errors.append(err)
+        ev.set()
+
+    source.subscribe(results.append, on_error, ev.set)
+    ev.wait(10)
+    return results, errors
+
+class TestSelectParallel(unittest.TestCase):
+    def test_select_parallel_ordered(self):
+        xs = Observable.from_iterable(range(100))
+        results, errors = run(xs.select_parallel(square, max_workers=2, chunk_size=7))
+
+        assert results == [x * x for x in range(100)]
+        assert not errors
+
+    def test_select_parallel_unordered(self):
+        xs = Observable.from_iterable(range(100))
+        results, errors = run(xs.select_parallel(square, max_workers=2, ordered=False, chunk_size=10))
+
+        assert sorted(results) == [x * x for x in range(100)]
+        assert not errors
+
+    def test_select_parallel_empty(self):
+        results, errors = run(Observable.empty().select_parallel(square, max_workers=1))
+
+        assert results == []
+        assert not errors
+
+    def test_select_parallel_selector_throws(self):
+        xs = Observable.from_iterable(range(10))
+        results, errors = run(xs.select_parallel(fail_on_five, max_workers=2))
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], ValueError)
+        assert 5 not in results
+
+    def test_select_parallel_source_throws(self):
+        xs = Observable.throw_exception(ValueError("ex"))
+        results, errors = run(xs.select_parallel(square, max_workers=1))
+
+        assert results == []
+        assert str(errors[0]) == "ex"
+
+    def test_select_parallel_dispose(self):
+        s = Subject()
+        results = []
+        d = s.select_parallel(square, max_workers=1).subscribe(results.append)
+        s.on_next(2)
+        d.dispose()
+        s.on_next(3)
+        s.on_completed()
+        assert 9 not in results
+
+    def test_select_parallel_chunk_size_out_of_range(self):
+        with self.assertRaises(ValueError):
+            Observable.empty().select_parallel(square, chunk_size=0)
@@ -0,0 +1,68 @@
+import unittest
+
+from rx import Observable
+from rx.testing import TestScheduler, ReactiveTest
+from rx.subjects import Subject
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+class TestStopAndWait(unittest.TestCase):
+
+    def test_stop_and_wait_one_in_flight(self):
+        source = Subject()
+        consumer = TestScheduler()
+        received = []
+        source.controlled().stop_and_wait(consumer).subscribe(received.append, None, lambda: received.append("done"))
+
+        for i in range(3):
+            source.on_next(i)
+        source.on_completed()
+        assert received == []
+
+        consumer.advance_by(1)
+        assert received == [0]
+        consumer.advance_by(1)
+        assert received == [0, 1]
+        consumer.advance_by(1)
+        assert received == [0, 1, 2, "done"]
+
+    def test_stop_and_wait_hot(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(230, 3),
+            on_next(231, 4),
+            on_next(301, 5),
+            on_completed(400)
+        )
+
+        results = scheduler.start(lambda: xs.controlled().stop_and_wait(scheduler))
+
+        results.messages.assert_equal(
+            on_next(210, 2),
+            on_next(230, 3),
+            on_next(231, 4),
+            on_next(301, 5),
+            on_completed(400))
+        xs.subscriptions.assert_equal(subscribe(200, 400))
+
+    def test_stop_and_wait_dispose(self):
+        source = Subject()
+        consumer = TestScheduler()
+        received = []
+        subscription = source.controlled().stop_and_wait(consumer).subscribe(received.append)
+
+        for i in range(3):
+            source.on_next(i)
+        consumer.advance_by(1)
+        subscription.dispose()
+        consumer.advance_by(5)
+
+        assert received == [0]
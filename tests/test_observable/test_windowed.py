@@ -0,0 +1,60 @@
+import unittest
+
+from rx import Observable
+from rx.testing import TestScheduler, ReactiveTest
+from rx.subjects import Subject
+from rx.internal import ArgumentOutOfRangeException
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+class TestWindowed(unittest.TestCase):
+
+    def test_windowed_window_in_flight(self):
+        source = Subject()
+        consumer = TestScheduler()
+        received = []
+        source.controlled().windowed(2, consumer).subscribe(received.append, None, lambda: received.append("done"))
+
+        for i in range(5):
+            source.on_next(i)
+        assert received == []
+
+        consumer.advance_by(1)
+        assert received == [0, 1]
+        consumer.advance_by(1)
+        assert received == [0, 1, 2, 3]
+
+        source.on_completed()
+        assert received == [0, 1, 2, 3]
+        consumer.advance_by(1)
+        assert received == [0, 1, 2, 3, 4, "done"]
+
+    def test_windowed_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(150, 1),
+            on_next(210, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_error(250, ex)
+        )
+
+        results = scheduler.start(lambda: xs.controlled().windowed(2, scheduler))
+
+        results.messages.assert_equal(
+            on_next(210, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_error(250, ex))
+        xs.subscriptions.assert_equal(subscribe(200, 250))
+
+    def test_windowed_invalid_size(self):
+        controlled = Observable.empty().controlled()
+        self.assertRaises(ArgumentOutOfRangeException, controlled.windowed, 0)
@@ -3,6 +3,7 @@ import unittest
 from rx import Observable
 from rx.testing import TestScheduler, ReactiveTest, is_prime, MockDisposable
 from rx.disposables import Disposable, SerialDisposable
+from rx.internal import BufferOverflowException
 
 on_next = ReactiveTest.on_next
 on_completed = ReactiveTest.on_completed
@@ -470,3 +471,79 @@ class TestZip(unittest.TestCase):
         results.messages.assert_equal(on_next(215, 2 + 3), on_error(225, ex))
         n1.subscriptions.assert_equal(subscribe(200, 225))
 
+
+    def test_zip_three_sources(self):
+        scheduler = TestScheduler()
+        o1 = scheduler.create_hot_observable(on_next(150, 1), on_next(210, 1), on_next(220, 2), on_completed(300))
+        o2 = scheduler.create_hot_observable(on_next(150, 1), on_next(215, 10), on_next(225, 20), on_next(235, 30), on_completed(400))
+        o3 = scheduler.create_hot_observable(on_next(150, 1), on_next(230, 100), on_next(240, 200), on_completed(250))
+
+        def create():
+            return o1.zip(o2, o3, lambda x, y, z: x + y + z)
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(230, 111), on_next(240, 222), on_completed(400))
+
+    def test_zip_max_buffer_error(self):
+        scheduler = TestScheduler()
+        o1 = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+        o2 = scheduler.create_hot_observable(on_next(240, 10), on_completed(300))
+
+        def create():
+            return o1.zip(o2, lambda x, y: x + y, max_buffer=2)
+
+        results = scheduler.start(create)
+        assert len(results.messages) == 1
+        assert results.messages[0].time == 230
+        assert isinstance(results.messages[0].value.exception, BufferOverflowException)
+        o1.subscriptions.assert_equal(subscribe(200, 230))
+
+    def test_zip_max_buffer_drop_newest(self):
+        scheduler = TestScheduler()
+        o1 = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+        o2 = scheduler.create_hot_observable(on_next(240, 10), on_next(250, 20), on_next(260, 30), on_completed(300))
+
+        def create():
+            return o1.zip(o2, lambda x, y: x + y, max_buffer=2, overflow="drop_newest")
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(240, 11), on_next(250, 22), on_completed(300))
+
+    def test_zip_max_buffer_drop_oldest(self):
+        scheduler = TestScheduler()
+        o1 = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(300))
+        o2 = scheduler.create_hot_observable(on_next(240, 10), on_next(250, 20), on_next(260, 30), on_completed(300))
+
+        def create():
+            return o1.zip(o2, lambda x, y: x + y, max_buffer=2, overflow="drop_oldest")
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(240, 12), on_next(250, 23), on_completed(300))
+
+    def test_zip_max_buffer_one_drop_oldest(self):
+        scheduler = TestScheduler()
+        o1 = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_completed(300))
+        o2 = scheduler.create_hot_observable(on_next(230, 10), on_next(240, 20), on_completed(300))
+        o3 = scheduler.create_hot_observable(on_next(250, 100), on_completed(300))
+
+        def create():
+            return Observable.zip(o1, o2, o3, lambda x, y, z: x + y + z, max_buffer=1, overflow="drop_oldest")
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(250, 122), on_completed(300))
+
+    def test_zip_unknown_keyword(self):
+        o1 = Observable.never()
+        self.assertRaises(TypeError, o1.zip, o1, lambda x, y: x + y, max_bufer=2)
+        self.assertRaises(TypeError, Observable.zip, o1, o1, lambda x, y: x + y, max_bufer=2)
+
+    def test_zip_classmethods(self):
+        scheduler = TestScheduler()
+        o1 = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_completed(300))
+        o2 = scheduler.create_hot_observable(on_next(215, 10), on_next(225, 20), on_completed(300))
+
+        def create():
+            return Observable.zip(o1, o2, lambda x, y: x + y).zip(Observable.zip_array(o1, o2), lambda x, y: [x, y])
+
+        results = scheduler.start(create)
+        results.messages.assert_equal(on_next(215, [11, [1, 10]]), on_next(225, [22, [2, 20]]), on_completed(300))
@@ -1,3 +1,5 @@
+import threading
+
 from nose.tools import raises
 
 from rx import Observable, Observer
@@ -467,4 +469,29 @@ def test_subject_disposed():
         on_next(400, 3),
         on_next(450, 4),
         on_next(550, 5)
-    )
\ No newline at end of file
+    )
+
+def test_behavior_subject_concurrent_subscribe_sees_latest():
+    s = BehaviorSubject(0)
+    values = []
+
+    def produce():
+        for i in range(1, 2001):
+            s.on_next(i)
+
+    def subscribe():
+        for i in range(200):
+            seen = []
+            d = s.subscribe(seen.append)
+            d.dispose()
+            values.append(seen)
+
+    threads = [threading.Thread(target=produce), threading.Thread(target=subscribe)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for seen in values:
+        assert seen == sorted(seen)
+    assert s.value == 2000
@@ -640,3 +640,36 @@ def test_replay_subject_dies_out():
         on_completed(901)
     )
 
+
+def test_replay_subject_buffer_size_only():
+    s = ReplaySubject(3)
+    for i in range(1000):
+        s.on_next(i)
+
+    res = []
+    s.subscribe(res.append)
+    assert res == [997, 998, 999]
+
+def test_replay_subject_window_only():
+    scheduler = TestScheduler()
+    subject = [None]
+    results = []
+
+    def action1(scheduler, state=None):
+        subject[0] = ReplaySubject(window=100, scheduler=scheduler)
+    scheduler.schedule_absolute(100, action1)
+
+    def get_action(i):
+        def action(scheduler, state=None):
+            subject[0].on_next(i)
+        return action
+
+    for i in range(200, 400, 10):
+        scheduler.schedule_absolute(i, get_action(i))
+
+    def action2(scheduler, state=None):
+        subject[0].subscribe(results.append)
+    scheduler.schedule_absolute(450, action2)
+
+    scheduler.start()
+    assert results == [350, 360, 370, 380, 390]
@@ -1,3 +1,5 @@
+import threading
+
 from nose.tools import assert_raises, raises
 
 from rx import Observable, Observer
@@ -359,3 +361,89 @@ def test_subject_create():
     s.on_completed()
     assert(not done)
 
+
+def test_subject_concurrent_on_next():
+    s = Subject()
+    counts = [[0] for _ in range(4)]
+    for count in counts:
+        def on_next(x, count=count):
+            count[0] += 1
+        s.subscribe(on_next)
+
+    s = Subject.synchronize(s)
+
+    def produce():
+        for i in range(1000):
+            s.on_next(i)
+
+    threads = [threading.Thread(target=produce) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [c[0] for c in counts] == [4000] * 4
+
+def test_subject_concurrent_subscribe_dispose():
+    s = Subject()
+    received = [0]
+
+    def on_next(x):
+        received[0] += 1
+    s.subscribe(on_next)
+
+    def churn():
+        for i in range(500):
+            s.subscribe(lambda x: None).dispose()
+
+    def produce():
+        for i in range(1000):
+            s.on_next(i)
+
+    threads = [threading.Thread(target=churn) for _ in range(2)]
+    threads.append(threading.Thread(target=produce))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert received[0] == 1000
+    assert len(s.observers) == 1
+
+def test_subject_synchronize_serializes():
+    s = Subject()
+    active = [0]
+    overlaps = [0]
+
+    def on_next(x):
+        active[0] += 1
+        if active[0] > 1:
+            overlaps[0] += 1
+        active[0] -= 1
+    s.subscribe(on_next)
+    synchronized = Subject.synchronize(s)
+
+    def produce():
+        for i in range(2000):
+            synchronized.on_next(i)
+
+    threads = [threading.Thread(target=produce) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert overlaps[0] == 0
+
+def test_subject_on_next_disposed_concurrently():
+    s = Subject()
+    s.subscribe(lambda x: None)
+    check_disposed = s.check_disposed
+
+    # Another thread disposes the subject right after on_next has checked
+    def check_then_dispose():
+        check_disposed()
+        s.dispose()
+    s.check_disposed = check_then_dispose
+
+    s.on_next(1)